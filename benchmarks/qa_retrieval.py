@@ -0,0 +1,77 @@
+"""Micro-benchmark: BM25 inverted index vs. the old substring keyword scorer.
+
+PYTHONPATH=src python benchmarks/qa_retrieval.py [--chunks 20000] [--queries 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
+)
+from neuralscope.features.codebase_qa.data.datasource.lexical_index.implementation import (
+    BM25Index,
+)
+
+WORDS = (
+    "user account session token cache request response handler service repository "
+    "config parser graph node edge report scan file path index query vector chunk"
+).split()
+
+
+def keyword_search(question: str, chunks: list[CodeChunk], top_k: int) -> list[CodeChunk]:
+    """The scorer QARepository used before the inverted index."""
+    q_lower = question.lower()
+    scored = []
+    for chunk in chunks:
+        score = sum(1 for word in q_lower.split() if word in chunk.content.lower())
+        if score > 0:
+            scored.append((score, chunk))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [chunk for _, chunk in scored[:top_k]]
+
+
+def make_chunk(rng: random.Random, i: int) -> CodeChunk:
+    lines = []
+    for _ in range(rng.randint(5, 60)):
+        a, b, c = rng.sample(WORDS, 3)
+        lines.append(f"    {a}_{b} = self.{c.capitalize()}{a.capitalize()}({b}, id_{i})")
+    body = "\n".join(lines)
+    return CodeChunk(f"pkg/mod_{i % 500}.py", f"def f_{i}():\n{body}", 1, len(lines) + 1)
+
+
+def timed(label: str, fn, queries: list[str]) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed * 1000 / len(queries):9.3f} ms/query")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)  # noqa: S311
+    chunks = [make_chunk(rng, i) for i in range(args.chunks)]
+    queries = [
+        f"how does the {' '.join(rng.sample(WORDS, 2))} work with id_{rng.randrange(args.chunks)}"
+        for _ in range(args.queries)
+    ]
+
+    start = time.perf_counter()
+    index = BM25Index(chunks)
+    print(f"{'BM25 build':<24} {(time.perf_counter() - start) * 1000:9.1f} ms total")
+    old = timed("keyword scorer", lambda q: keyword_search(q, chunks, 5), queries)
+    new = timed("BM25 inverted index", lambda q: index.search(q, 5), queries)
+    print(f"speedup: {old / new:.1f}x over {args.chunks} chunks")
+
+
+if __name__ == "__main__":
+    main()
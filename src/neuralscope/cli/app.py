@@ -8,6 +8,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from neuralscope import __version__
+from neuralscope.core.settings import RerankMode
 from neuralscope.sdk.client import NeuralScope
 
 app = typer.Typer(
@@ -20,6 +21,7 @@ console = Console()
 
 MODEL_OPTION = typer.Option(None, "--model", "-m", help="LLM model (e.g. openai/gpt-5.2)")
 PROFILE_OPTION = typer.Option("default", "--profile", "-p", help="Prompt profile name")
+RERANK_OPTION = typer.Option(None, "--rerank", help="Rerank retrieved chunks before answering")
 
 
 def _run(coro):
@@ -52,14 +54,26 @@ def main(
 
 @app.command()
 def review(
-    path: str = typer.Argument(..., help="File to review"),
+    path: str = typer.Argument(..., help="File, directory or glob to review"),
     diff: bool = typer.Option(False, "--diff", "-d", help="Review as diff"),
+    concurrency: int | None = typer.Option(
+        None, "--concurrency", "-j", help="Max files reviewed in parallel"
+    ),
     model: str | None = MODEL_OPTION,
     profile: str = PROFILE_OPTION,
 ) -> None:
     """AI-powered code review."""
     console.print(f"[bold]Reviewing[/bold] {path}...")
-    result = _run(_client(model, profile).review(path, diff=diff))
+
+    def on_file_reviewed(file: str, score: float | None) -> None:
+        outcome = "failed" if score is None else f"score {score}"
+        console.print(f"  [dim]reviewed[/dim] {file} ({outcome})")
+
+    result = _run(
+        _client(model, profile).review(
+            path, diff=diff, concurrency=concurrency, on_file_reviewed=on_file_reviewed
+        )
+    )
     console.print_json(data=result)
 
 
@@ -80,11 +94,14 @@ def graph(
     path: str = typer.Argument(..., help="Project root path"),
     output: str = typer.Option("json", "--output", "-o", help="Output format (json/dot/svg)"),
     mode: str = typer.Option("ast", "--mode", help="Analysis mode: ast or llm"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", help="Parallel AST parser processes (0 = all CPUs)"
+    ),
     model: str | None = MODEL_OPTION,
 ) -> None:
     """Build dependency graph (AST or LLM-powered)."""
     console.print(f"[bold]Building graph[/bold] for {path} (mode={mode})...")
-    result = _run(_client(model).build_graph(path, output=output, mode=mode))
+    result = _run(_client(model).build_graph(path, output=output, mode=mode, workers=workers))
     console.print_json(data=result)
 
 
@@ -102,11 +119,30 @@ def impact(
 @app.command()
 def scan(
     path: str = typer.Argument(..., help="Project path to scan"),
+    concurrency: int | None = typer.Option(
+        None, "--concurrency", "-j", help="Max files scanned in parallel"
+    ),
+    full: bool = typer.Option(False, "--full", help="Rescan every file, ignoring stored findings"),
+    batch_tokens: int | None = typer.Option(
+        None, "--batch-tokens", help="Pack small files into requests up to this token budget"
+    ),
     model: str | None = MODEL_OPTION,
 ) -> None:
     """Scan for security vulnerabilities."""
     console.print(f"[bold]Scanning[/bold] {path}...")
-    result = _run(_client(model).scan(path))
+
+    def on_file_scanned(file: str, issues: int) -> None:
+        console.print(f"  [dim]scanned[/dim] {file} ({issues} issue(s))")
+
+    result = _run(
+        _client(model).scan(
+            path,
+            concurrency=concurrency,
+            incremental=not full,
+            batch_tokens=batch_tokens,
+            on_file_scanned=on_file_scanned,
+        )
+    )
     console.print_json(data=result)
 
 
@@ -125,12 +161,31 @@ def test_gen(
 def ask(
     question: str = typer.Argument(..., help="Question about the codebase"),
     project: str = typer.Option(".", "--project", help="Project root"),
+    rerank: RerankMode | None = RERANK_OPTION,
+    stream: bool = typer.Option(True, "--stream/--no-stream", help="Print the answer live"),
     model: str | None = MODEL_OPTION,
 ) -> None:
     """Ask a question about the codebase (RAG-powered)."""
     console.print(f"[bold]Asking:[/bold] {question}")
-    result = _run(_client(model).ask(question, project=project))
-    console.print_json(data=result)
+    if not stream:
+        result = _run(_client(model).ask(question, project=project, rerank=rerank))
+        console.print_json(data=result)
+        return
+
+    async def render() -> dict:
+        streamed = False
+        async for event in _client(model).ask_stream(question, project=project, rerank=rerank):
+            if isinstance(event, str):
+                console.print(event, end="", markup=False, highlight=False, soft_wrap=True)
+                streamed = True
+            else:
+                if streamed:
+                    console.print()
+                    event = {k: v for k, v in event.items() if k != "answer"}
+                return event
+        return {}
+
+    console.print_json(data=_run(render()))
 
 
 @app.command()
@@ -213,5 +268,67 @@ def models() -> None:
     console.print(table)
 
 
+# ── cache ─────────────────────────────────────────────────────────────────
+
+cache_app = typer.Typer(help="Inspect and manage the on-disk caches.", no_args_is_help=True)
+app.add_typer(cache_app, name="cache")
+
+OLDER_THAN_OPTION = typer.Option(
+    None, "--older-than", help="Also delete AST/Q&A index files untouched for N days"
+)
+NAMESPACE_OPTION = typer.Option(
+    None, "--namespace", "-n", help="Only export these namespaces (repeatable)"
+)
+
+
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """Show entries, size and limits per cache namespace."""
+    table = Table(title="Caches")
+    table.add_column("Namespace", style="cyan")
+    table.add_column("Entries", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Limit", justify="right")
+    table.add_column("Eviction")
+    for row in _client().cache_stats():
+        limit = row["size_limit"]
+        table.add_row(
+            row["namespace"],
+            str(row["entries"]),
+            _mb(row["bytes"]),
+            _mb(limit) if limit is not None else "-",
+            row["eviction_policy"] or "-",
+        )
+    console.print(table)
+
+
+@cache_app.command("prune")
+def cache_prune(older_than: float | None = OLDER_THAN_OPTION) -> None:
+    """Drop expired entries and evict namespaces down to their size limits."""
+    removed = _client().cache_prune(older_than_days=older_than)
+    console.print_json(data={"removed": removed})
+
+
+@cache_app.command("export")
+def cache_export(
+    path: str = typer.Argument(..., help="Archive to write (.tar.gz)"),
+    namespace: list[str] | None = NAMESPACE_OPTION,
+) -> None:
+    """Export the caches to an archive, e.g. to ship a warm cache between CI jobs."""
+    counts = _client().cache_export(path, namespaces=namespace or None)
+    console.print_json(data={"exported": counts, "path": path})
+
+
+@cache_app.command("import")
+def cache_import(path: str = typer.Argument(..., help="Archive written by `cache export`")) -> None:
+    """Import a cache archive, merging it into the local caches."""
+    counts = _client().cache_import(path)
+    console.print_json(data={"imported": counts})
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
 if __name__ == "__main__":
     app()
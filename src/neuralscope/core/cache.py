@@ -1,50 +1,387 @@
 """LLM response caching via diskcache.
 
 Wraps LangChain LLMs to cache completions and avoid redundant API calls
-during development and CI.
+during development and CI. A bounded in-process LRU sits in front of the
+disk tier; async callers read and write the disk off the event loop and
+share one provider call per key while it is in flight.
+
+Two opt-in tiers catch near-identical prompts after an exact miss: an alias
+key over normalized code blocks, and a `SemanticCacheIndex`.
 """
 
 from __future__ import annotations
 
+import ast
+import asyncio
 import hashlib
+import io
 import json
+import re
+import threading
+import time
+import tokenize
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import diskcache
 
 from neuralscope.core.logging import get_logger
+from neuralscope.core.settings import EvictionPolicy, Settings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from neuralscope.core.semantic_cache import SemanticCacheIndex
 
 logger = get_logger("llm_cache")
 
 _DEFAULT_DIR = Path.home() / ".neuralscope" / "cache"
 
+# diskcache-backed namespaces, as directories under `Settings.cache_dir` ("" is the root).
+DISK_NAMESPACES = {
+    "llm": "",
+    "embeddings": "embeddings",
+    "semantic": "semantic",
+    "scan_findings": "scan_findings",
+}
+# Namespaces of plain files, one per project root.
+FILE_NAMESPACES = {"ast": "ast", "qa_index": "qa_index"}
+
+
+@dataclass(frozen=True)
+class CacheLimits:
+    """Size cap and eviction policy diskcache enforces as entries are added."""
+
+    size_limit: int
+    eviction_policy: EvictionPolicy = EvictionPolicy.LEAST_RECENTLY_STORED
+
+    @classmethod
+    def for_namespace(cls, settings: Settings, namespace: str) -> CacheLimits:
+        mb = settings.cache_size_limits_mb.get(namespace, settings.cache_size_limit_mb)
+        return cls(size_limit=mb * 1024 * 1024, eviction_policy=settings.cache_eviction_policy)
+
+    def open(self, directory: Path) -> diskcache.Cache:
+        return diskcache.Cache(
+            str(directory),
+            size_limit=self.size_limit,
+            eviction_policy=self.eviction_policy.value,
+        )
+
+
+def namespace_dir(settings: Settings, namespace: str) -> Path:
+    sub = DISK_NAMESPACES.get(namespace, FILE_NAMESPACES.get(namespace))
+    if sub is None:
+        raise ValueError(f"Unknown cache namespace: {namespace}")
+    return settings.cache_dir / sub if sub else settings.cache_dir
+
+
+def open_cache(directory: Path, limits: CacheLimits | None) -> diskcache.Cache:
+    return limits.open(directory) if limits else diskcache.Cache(str(directory))
+
+
+_FENCE = re.compile(r"```[^\n]*\n(.*?)```", re.DOTALL)
+# Tokens kept by name, so indentation structure survives normalization.
+_LAYOUT = {tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT}
+
+# Namespace and text of a prompt, for the semantic tier.
+Similar = tuple[str, str]
+
 
 class LLMCache:
-    def __init__(self, cache_dir: Path | None = None, ttl: int = 3600) -> None:
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl: int = 3600,
+        *,
+        memory_size: int = 256,
+        semantic: SemanticCacheIndex | None = None,
+        limits: CacheLimits | None = None,
+    ) -> None:
         self._dir = cache_dir or _DEFAULT_DIR
-        self._cache = diskcache.Cache(str(self._dir))
+        self._cache = open_cache(self._dir, limits)
         self._ttl = ttl
+        self._memory_size = max(0, memory_size)
+        # key -> (value, monotonic expiry), most recently used last.
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._semantic = semantic
+        # Prompt embeddings from semantic misses in `aget`, reused by the `aset` that follows.
+        self._miss_vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._counts = dict.fromkeys(
+            ("memory_hits", "disk_hits", "normalized_hits", "semantic_hits", "misses", "coalesced"),
+            0,
+        )
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self._semantic is not None
 
-    def key(self, model: str, messages: list[dict[str, str]]) -> str:
-        payload = json.dumps({"model": model, "messages": messages}, sort_keys=True)
+    def key(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        *,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        normalize: bool = False,
+    ) -> str:
+        """Hash the request; with `normalize`, code blocks are keyed by `normalize_code`."""
+        data: dict[str, Any] = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "messages": messages,
+        }
+        if normalize:
+            data["messages"] = [{**m, "content": normalize_code(m["content"])} for m in messages]
+            data["normalized"] = True
+        payload = json.dumps(data, sort_keys=True)
         return hashlib.sha256(payload.encode()).hexdigest()
 
-    def get(self, cache_key: str) -> str | None:
-        result = self._cache.get(cache_key)
-        if result is not None:
-            logger.debug("Cache hit: %s", cache_key[:12])
+    def get(self, cache_key: str, *, alias: str | None = None) -> str | None:
+        result = self._memory_get(cache_key)
+        if result is None:
+            result = self._disk_find(cache_key, alias)
+        if result is None:
+            self._count("misses")
         return result
 
-    def set(self, cache_key: str, value: str) -> None:
-        self._cache.set(cache_key, value, expire=self._ttl)
+    def set(
+        self,
+        cache_key: str,
+        value: str,
+        *,
+        alias: str | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        """Store `value`; `ttl` overrides the cache-wide TTL for this entry."""
+        self._memory_set(cache_key, value, ttl)
+        self._disk_set(cache_key, value, alias, ttl)
+
+    async def aget(
+        self,
+        cache_key: str,
+        *,
+        alias: str | None = None,
+        similar: Similar | None = None,
+    ) -> str | None:
+        result = self._memory_get(cache_key)
+        if result is None:
+            result, vector = await self._afind(cache_key, alias, similar)
+            if result is None and vector is not None:
+                with self._lock:
+                    self._miss_vectors[cache_key] = vector
+                    while len(self._miss_vectors) > max(1, self._memory_size):
+                        self._miss_vectors.popitem(last=False)
+        if result is None:
+            self._count("misses")
+        return result
+
+    async def aset(
+        self,
+        cache_key: str,
+        value: str,
+        *,
+        alias: str | None = None,
+        similar: Similar | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        self._memory_set(cache_key, value, ttl)
+        await asyncio.to_thread(self._disk_set, cache_key, value, alias, ttl)
+        with self._lock:
+            vector = self._miss_vectors.pop(cache_key, None)
+        await self._semantic_add(cache_key, similar, vector)
+
+    async def aget_or_compute(
+        self,
+        cache_key: str,
+        compute: Callable[[], Awaitable[str]],
+        *,
+        alias: str | None = None,
+        similar: Similar | None = None,
+        ttl: int | None = None,
+    ) -> str:
+        """Return the cached value, or the result of `compute`, which is then cached.
+
+        Concurrent calls for a key that is already being computed await that
+        computation instead of starting their own; if it fails, they all fail.
+        """
+        result = self._memory_get(cache_key)
+        if result is not None:
+            return result
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(cache_key)
+        if pending is not None and pending.get_loop() is loop:
+            self._count("coalesced")
+            return await asyncio.shield(pending)
+
+        # Registered before the disk lookup, so callers arriving meanwhile wait on it too.
+        future: asyncio.Future[str] = loop.create_future()
+        self._inflight[cache_key] = future
+        try:
+            result, vector = await self._afind(cache_key, alias, similar)
+            if result is None:
+                self._count("misses")
+                result = await compute()
+                self._memory_set(cache_key, result, ttl)
+                await asyncio.to_thread(self._disk_set, cache_key, result, alias, ttl)
+                await self._semantic_add(cache_key, similar, vector)
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; mark it retrieved so an unawaited one is not logged.
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
 
     def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
         self._cache.clear()
+        if self._semantic is not None:
+            self._semantic.clear()
 
     @property
     def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            memory_entries = len(self._memory)
         return {
             "directory": str(self._dir),
             "size": len(self._cache),
+            "memory_entries": memory_entries,
+            "hits": counts["memory_hits"] + counts["disk_hits"],
+            **counts,
         }
+
+    def _memory_get(self, cache_key: str) -> str | None:
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self._memory.move_to_end(cache_key)
+                    self._counts["memory_hits"] += 1
+                    return entry[0]
+                del self._memory[cache_key]
+        return None
+
+    def _memory_set(self, cache_key: str, value: str, ttl: float | None = None) -> None:
+        if not self._memory_size:
+            return
+        expiry = time.monotonic() + (self._ttl if ttl is None else ttl)
+        with self._lock:
+            self._memory[cache_key] = (value, expiry)
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+    def _disk_find(self, cache_key: str, alias: str | None) -> str | None:
+        result, expire_time = self._cache.get(cache_key, expire_time=True)
+        if result is not None:
+            logger.debug("Cache hit: %s", cache_key[:12])
+            self._count("disk_hits")
+        elif alias is not None:
+            result, expire_time = self._cache.get(alias, expire_time=True)
+            if result is None:
+                return None
+            logger.debug("Normalized cache hit: %s", cache_key[:12])
+            self._count("normalized_hits")
+        else:
+            return None
+        # Promote into memory for no longer than the disk entry has left.
+        remaining = None if expire_time is None else expire_time - time.time()
+        if remaining is None or remaining > 0:
+            self._memory_set(cache_key, result, remaining)
+        return result
+
+    def _disk_set(self, cache_key: str, value: str, alias: str | None, ttl: int | None) -> None:
+        expire = self._ttl if ttl is None else ttl
+        self._cache.set(cache_key, value, expire=expire)
+        if alias is not None:
+            self._cache.set(alias, value, expire=expire)
+
+    async def _afind(
+        self, cache_key: str, alias: str | None, similar: Similar | None
+    ) -> tuple[str | None, np.ndarray | None]:
+        """Look `cache_key` up on disk, then semantically.
+
+        Also returns the prompt embedding computed for the semantic lookup, so a
+        miss can be added to the index without embedding the prompt again.
+        """
+        result = await asyncio.to_thread(self._disk_find, cache_key, alias)
+        vector = None
+        if result is None and similar is not None and self._semantic is not None:
+            try:
+                vector = await self._semantic.embed(similar[1])
+            except Exception as exc:
+                logger.warning("Semantic cache lookup failed: %s", exc)
+                return None, None
+            try:
+                match = await asyncio.to_thread(self._semantic.search, similar[0], vector)
+            except Exception as exc:
+                logger.warning("Semantic cache lookup failed: %s", exc)
+                match = None
+            if match is not None:
+                result = await asyncio.to_thread(self._cache.get, match)
+                if result is not None:
+                    logger.debug("Semantic cache hit: %s", cache_key[:12])
+                    self._count("semantic_hits")
+                    self._memory_set(cache_key, result)
+        return result, vector
+
+    async def _semantic_add(
+        self, cache_key: str, similar: Similar | None, vector: np.ndarray | None = None
+    ) -> None:
+        if similar is None or self._semantic is None:
+            return
+        if vector is None:
+            try:
+                vector = await self._semantic.embed(similar[1])
+            except Exception as exc:
+                logger.warning("Semantic cache update failed: %s", exc)
+                return
+        try:
+            await asyncio.to_thread(self._semantic.add, similar[0], vector, cache_key)
+        except Exception as exc:
+            logger.warning("Semantic cache update failed: %s", exc)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+
+def normalize_code(text: str) -> str:
+    """Rewrite fenced code blocks so formatting and comments no longer matter.
+
+    Python blocks become their AST dump; anything else that tokenizes drops
+    comments and blank lines; the rest has its whitespace collapsed.
+    """
+    return _FENCE.sub(lambda m: f"```\n{_normalize_block(m.group(1))}\n```", text)
+
+
+def _normalize_block(code: str) -> str:
+    try:
+        return ast.dump(ast.parse(code))
+    except (SyntaxError, ValueError):
+        pass
+    skip = {tokenize.COMMENT, tokenize.NL, tokenize.ENDMARKER}
+    try:
+        return " ".join(
+            tokenize.tok_name[t.type] if t.type in _LAYOUT else t.string
+            for t in tokenize.generate_tokens(io.StringIO(code).readline)
+            if t.type not in skip
+        )
+    except (tokenize.TokenError, SyntaxError):
+        return " ".join(code.split())
@@ -0,0 +1,213 @@
+"""Inspect, prune, export and import the on-disk caches.
+
+An export is a gzipped tarball: `manifest.json`, one `<namespace>.jsonl` per
+diskcache namespace (key, remaining TTL and a tagged value per line), and the
+files of each file namespace under `files/<namespace>/`. Nothing is pickled,
+so importing an artifact from another CI job cannot run code.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+import tarfile
+import time
+from pathlib import Path
+from typing import Any
+
+from neuralscope.core.cache import DISK_NAMESPACES, FILE_NAMESPACES, CacheLimits, namespace_dir
+from neuralscope.core.logging import get_logger
+from neuralscope.core.settings import Settings
+
+logger = get_logger("cache_admin")
+
+EXPORT_VERSION = 1
+
+
+def cache_stats(settings: Settings) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for namespace in DISK_NAMESPACES:
+        directory = namespace_dir(settings, namespace)
+        limits = CacheLimits.for_namespace(settings, namespace)
+        entries = volume = 0
+        if directory.is_dir():
+            with limits.open(directory) as cache:
+                entries, volume = len(cache), cache.volume()
+        rows.append(
+            {
+                "namespace": namespace,
+                "entries": entries,
+                "bytes": volume,
+                "size_limit": limits.size_limit,
+                "eviction_policy": limits.eviction_policy.value,
+            }
+        )
+    for namespace in FILE_NAMESPACES:
+        files = _files(namespace_dir(settings, namespace))
+        rows.append(
+            {
+                "namespace": namespace,
+                "entries": len(files),
+                "bytes": sum(f.stat().st_size for f in files),
+                "size_limit": None,
+                "eviction_policy": None,
+            }
+        )
+    return rows
+
+
+def prune_caches(settings: Settings, *, older_than_days: float | None = None) -> dict[str, int]:
+    """Drop expired entries and evict down to each namespace's size limit.
+
+    File namespaces have no TTL; with `older_than_days`, their files not
+    written for that long are removed.
+    """
+    removed: dict[str, int] = {}
+    for namespace in DISK_NAMESPACES:
+        directory = namespace_dir(settings, namespace)
+        if directory.is_dir():
+            with CacheLimits.for_namespace(settings, namespace).open(directory) as cache:
+                removed[namespace] = cache.cull()
+    if older_than_days is not None:
+        cutoff = time.time() - older_than_days * 86400
+        for namespace in FILE_NAMESPACES:
+            stale = [
+                f for f in _files(namespace_dir(settings, namespace)) if f.stat().st_mtime < cutoff
+            ]
+            for f in stale:
+                f.unlink(missing_ok=True)
+            removed[namespace] = len(stale)
+    return removed
+
+
+def export_caches(
+    settings: Settings,
+    path: Path,
+    *,
+    namespaces: list[str] | None = None,
+) -> dict[str, int]:
+    selected = namespaces or [*DISK_NAMESPACES, *FILE_NAMESPACES]
+    counts: dict[str, int] = {}
+    now = time.time()
+    with tarfile.open(path, "w:gz") as tar:
+        for namespace in selected:
+            directory = namespace_dir(settings, namespace)
+            if namespace in FILE_NAMESPACES:
+                files = _files(directory)
+                for f in files:
+                    tar.add(f, arcname=f"files/{namespace}/{f.name}")
+                counts[namespace] = len(files)
+                continue
+            lines: list[str] = []
+            if directory.is_dir():
+                with CacheLimits.for_namespace(settings, namespace).open(directory) as cache:
+                    for key in cache.iterkeys():
+                        value, expire_time = cache.get(key, expire_time=True)
+                        if value is None:
+                            continue
+                        ttl = None if expire_time is None else expire_time - now
+                        if ttl is not None and ttl <= 0:
+                            continue
+                        try:
+                            encoded = _encode(value)
+                        except TypeError:
+                            logger.warning("Skipping %s entry of type %s", namespace, type(value))
+                            continue
+                        lines.append(json.dumps({"key": key, "ttl": ttl, "value": encoded}))
+            _add_bytes(tar, f"{namespace}.jsonl", "\n".join(lines).encode())
+            counts[namespace] = len(lines)
+        manifest = {"version": EXPORT_VERSION, "namespaces": list(counts)}
+        _add_bytes(tar, "manifest.json", json.dumps(manifest).encode())
+    return counts
+
+
+def import_caches(settings: Settings, path: Path) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    with tarfile.open(path, "r:gz") as tar:
+        manifest = json.loads(_read(tar, "manifest.json"))
+        if manifest.get("version") != EXPORT_VERSION:
+            raise ValueError(f"Unsupported cache export version: {manifest.get('version')}")
+        for namespace in manifest["namespaces"]:
+            if namespace in DISK_NAMESPACES:
+                counts[namespace] = _import_entries(
+                    settings, namespace, _read(tar, f"{namespace}.jsonl")
+                )
+            elif namespace in FILE_NAMESPACES:
+                counts[namespace] = _import_files(settings, namespace, tar)
+    return counts
+
+
+def _import_entries(settings: Settings, namespace: str, raw: bytes) -> int:
+    directory = namespace_dir(settings, namespace)
+    directory.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with CacheLimits.for_namespace(settings, namespace).open(directory) as cache:
+        for line in raw.decode().splitlines():
+            entry = json.loads(line)
+            cache.set(entry["key"], _decode(entry["value"]), expire=entry["ttl"])
+            count += 1
+    return count
+
+
+def _import_files(settings: Settings, namespace: str, tar: tarfile.TarFile) -> int:
+    directory = namespace_dir(settings, namespace)
+    directory.mkdir(parents=True, exist_ok=True)
+    prefix = f"files/{namespace}/"
+    count = 0
+    for member in tar.getmembers():
+        name = member.name.removeprefix(prefix)
+        # Only flat regular files: never follow links or write outside the namespace.
+        if (
+            not member.name.startswith(prefix)
+            or not member.isfile()
+            or "/" in name
+            or name in {"", ".", ".."}
+        ):
+            continue
+        data = tar.extractfile(member)
+        if data is None:
+            continue
+        tmp = directory / f".{name}.tmp"
+        tmp.write_bytes(data.read())
+        tmp.replace(directory / name)
+        count += 1
+    return count
+
+
+def _files(directory: Path) -> list[Path]:
+    if not directory.is_dir():
+        return []
+    return sorted(f for f in directory.iterdir() if f.is_file() and not f.name.startswith("."))
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _read(tar: tarfile.TarFile, name: str) -> bytes:
+    data = tar.extractfile(name)
+    if data is None:
+        raise ValueError(f"{name} is missing from the cache export")
+    return data.read()
+
+
+def _encode(value: Any) -> dict[str, Any]:
+    if isinstance(value, str):
+        return {"s": value}
+    if isinstance(value, bytes):
+        return {"b": base64.b64encode(value).decode()}
+    if isinstance(value, tuple | list):
+        return {"t": [_encode(v) for v in value]}
+    raise TypeError(type(value).__name__)
+
+
+def _decode(data: dict[str, Any]) -> Any:
+    if "s" in data:
+        return data["s"]
+    if "b" in data:
+        return base64.b64decode(data["b"])
+    return tuple(_decode(v) for v in data["t"])
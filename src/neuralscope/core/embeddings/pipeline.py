@@ -0,0 +1,173 @@
+"""Batched, deduplicated embedding with a persistent content-hash cache.
+
+Identical texts are embedded once per call, and vectors are stored under the
+SHA-256 of the text and the embedder's identity, so re-indexing a mostly
+unchanged project only sends the changed chunks to the provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from neuralscope.core.cache import CacheLimits, open_cache
+from neuralscope.core.logging import get_logger
+
+logger = get_logger("embeddings")
+
+
+def embedding_id(embeddings: Embeddings) -> str:
+    """Identifies an embedder, so stored vectors are never mixed across models."""
+    model = getattr(embeddings, "model", "")
+    return f"{type(embeddings).__name__}:{model}"
+
+
+class EmbeddingCache:
+    """Content-hash → float32 vector store.
+
+    Like the scan findings store, entries never expire: the key covers the
+    text and the model, so a hit can never be stale.
+    """
+
+    def __init__(self, directory: Path, *, limits: CacheLimits | None = None) -> None:
+        self._cache = open_cache(directory, limits)
+
+    def get(self, key: str) -> np.ndarray | None:
+        raw = self._cache.get(key)
+        return None if raw is None else np.frombuffer(raw, dtype=np.float32)
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        self._cache.set(key, np.asarray(vector, dtype=np.float32).tobytes())
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Vectors of the `keys` that are stored; missing keys are left out."""
+        found: dict[str, np.ndarray] = {}
+        for key in keys:
+            vector = self.get(key)
+            if vector is not None:
+                found[key] = vector
+        return found
+
+    def put_many(self, vectors: dict[str, np.ndarray]) -> None:
+        # One transaction instead of a commit per vector.
+        with self._cache.transact():
+            for key, vector in vectors.items():
+                self.put(key, vector)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+@dataclass
+class EmbeddingStats:
+    texts: int = 0
+    unique: int = 0
+    cache_hits: int = 0
+    embedded: int = 0
+    requests: int = 0
+    retries: int = 0
+
+
+class EmbeddingPipeline:
+    """Embeds texts in `batch_size` requests, up to `concurrency` in flight.
+
+    A failed request is retried `max_retries` times with exponential backoff
+    from `retry_delay` seconds before the error propagates.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        *,
+        batch_size: int = 64,
+        concurrency: int = 4,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        cache: EmbeddingCache | None = None,
+    ) -> None:
+        self._embeddings = embeddings
+        self._batch_size = max(1, batch_size)
+        self._concurrency = max(1, concurrency)
+        self._max_retries = max(0, max_retries)
+        self._retry_delay = retry_delay
+        self._cache = cache
+        self._id = embedding_id(embeddings)
+        self.stats = EmbeddingStats()
+
+    @property
+    def embedding_id(self) -> str:
+        return self._id
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self._id}\0{text}".encode()).hexdigest()
+
+    async def embed_documents(self, texts: list[str]) -> np.ndarray:
+        """Return one float32 row per text, in order."""
+        self.stats.texts += len(texts)
+        keys = [self.key(t) for t in texts]
+        unique = dict(zip(keys, texts, strict=True))
+        vectors: dict[str, np.ndarray] = {}
+        if self._cache is not None and unique:
+            # diskcache is synchronous; look every key up in one worker-thread hop.
+            vectors = await asyncio.to_thread(self._cache.get_many, list(unique))
+        missing = {key: text for key, text in unique.items() if key not in vectors}
+        self.stats.unique += len(unique)
+        self.stats.cache_hits += len(vectors)
+
+        pending = list(missing.items())
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def embed_batch(batch: list[tuple[str, str]]) -> None:
+            async with semaphore:
+                rows = await self._retrying(
+                    self._embeddings.aembed_documents, [text for _, text in batch]
+                )
+            self.stats.requests += 1
+            self.stats.embedded += len(batch)
+            embedded = {
+                key: np.asarray(row, dtype=np.float32)
+                for (key, _), row in zip(batch, rows, strict=True)
+            }
+            vectors.update(embedded)
+            if self._cache is not None:
+                await asyncio.to_thread(self._cache.put_many, embedded)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for start in range(0, len(pending), self._batch_size):
+                    tg.create_task(embed_batch(pending[start : start + self._batch_size]))
+        except* Exception as group:
+            # Vectors of batches that finished are already cached for the next run.
+            raise group.exceptions[0] from None
+
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        row = await self._retrying(self._embeddings.aembed_query, text)
+        return np.asarray(row, dtype=np.float32)
+
+    async def _retrying(self, call: Callable[[Any], Awaitable[Any]], arg: Any) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await call(arg)
+            except Exception as exc:
+                if attempt >= self._max_retries:
+                    raise
+                delay = self._retry_delay * 2**attempt
+                logger.warning("Embedding request failed (%s), retrying in %.1fs", exc, delay)
+                self.stats.retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
@@ -0,0 +1,184 @@
+"""Transparent response caching for LangChain chat models.
+
+Every feature datasource talks to the LLM through `ainvoke`, so caching at the
+chat-model level covers all of them without touching feature code.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from neuralscope.core.cache import LLMCache, Similar
+
+
+class CachedChatModel(BaseChatModel):
+    """Wraps a chat model and serves repeated prompts from `LLMCache`.
+
+    The cache key covers model, temperature, max_tokens and the full message list.
+    With `normalize_code`, and with a semantic tier on the cache, prompts
+    that differ only in code formatting or by a near-duplicate last message
+    are served too. Concurrent identical async calls share one inner call. Streaming passes
+    the inner model's chunks through and caches the joined text; a hit is
+    replayed as a single chunk. Responses served from the cache carry
+    `response_metadata["cache_hit"]`.
+    """
+
+    inner: BaseChatModel
+    llm_cache: LLMCache
+    model_id: str
+    temperature: float = 0.1
+    max_tokens: int | None = None
+    # Also key prompts by their normalized code blocks (see `normalize_code`).
+    normalize_code: bool = False
+    # Overrides the cache-wide TTL for responses of this model instance.
+    ttl: int | None = None
+
+    @property
+    def _llm_type(self) -> str:
+        return f"cached-{self.inner._llm_type}"
+
+    def _cache_key(self, messages: list[BaseMessage], stop: list[str] | None) -> str:
+        return self._key(messages, stop, normalize=False)
+
+    def _alias(self, messages: list[BaseMessage], stop: list[str] | None) -> str | None:
+        return self._key(messages, stop, normalize=True) if self.normalize_code else None
+
+    def _similar(self, messages: list[BaseMessage], stop: list[str] | None) -> Similar | None:
+        if not self.llm_cache.semantic_enabled or not messages:
+            return None
+        # Everything but the last message must match exactly; only the last is embedded.
+        return self._key(messages[:-1], stop, normalize=False), _content_text(messages[-1].content)
+
+    def _key(self, messages: list[BaseMessage], stop: list[str] | None, *, normalize: bool) -> str:
+        payload = [{"role": m.type, "content": _content_text(m.content)} for m in messages]
+        if stop:
+            payload.append({"role": "stop", "content": json.dumps(stop)})
+        return self.llm_cache.key(
+            self.model_id,
+            payload,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            normalize=normalize,
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        cache_key, alias = self._cache_key(messages, stop), self._alias(messages, stop)
+        cached = self.llm_cache.get(cache_key, alias=alias)
+        if cached is not None:
+            return _result(cached)
+
+        response = self.inner.invoke(messages, stop=stop, **kwargs)
+        content = _content_text(response.content)
+        self.llm_cache.set(cache_key, content, alias=alias, ttl=self.ttl)
+        return ChatResult(generations=[ChatGeneration(message=response)])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        response: BaseMessage | None = None
+
+        async def call() -> str:
+            nonlocal response
+            response = await self.inner.ainvoke(messages, stop=stop, **kwargs)
+            return _content_text(response.content)
+
+        content = await self.llm_cache.aget_or_compute(
+            self._cache_key(messages, stop),
+            call,
+            alias=self._alias(messages, stop),
+            similar=self._similar(messages, stop),
+            ttl=self.ttl,
+        )
+        if response is not None:
+            return ChatResult(generations=[ChatGeneration(message=response)])
+        return _result(content)
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        cache_key, alias = self._cache_key(messages, stop), self._alias(messages, stop)
+        cached = self.llm_cache.get(cache_key, alias=alias)
+        if cached is not None:
+            yield _hit_chunk(cached)
+            return
+
+        parts: list[str] = []
+        for chunk in self.inner.stream(messages, stop=stop, **kwargs):
+            text = _content_text(chunk.content)
+            parts.append(text)
+            if run_manager:
+                run_manager.on_llm_new_token(text)
+            yield _chunk(text, chunk)
+        self.llm_cache.set(cache_key, "".join(parts), alias=alias, ttl=self.ttl)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        cache_key, alias = self._cache_key(messages, stop), self._alias(messages, stop)
+        similar = self._similar(messages, stop)
+        cached = await self.llm_cache.aget(cache_key, alias=alias, similar=similar)
+        if cached is not None:
+            yield _hit_chunk(cached)
+            return
+
+        parts: list[str] = []
+        async for chunk in self.inner.astream(messages, stop=stop, **kwargs):
+            text = _content_text(chunk.content)
+            parts.append(text)
+            if run_manager:
+                await run_manager.on_llm_new_token(text)
+            yield _chunk(text, chunk)
+        # Only a fully consumed stream is cached; an abandoned one never reaches here.
+        await self.llm_cache.aset(
+            cache_key, "".join(parts), alias=alias, similar=similar, ttl=self.ttl
+        )
+
+
+def _content_text(content: str | list[Any]) -> str:
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, sort_keys=True, default=str)
+
+
+def _result(content: str) -> ChatResult:
+    message = AIMessage(content=content, response_metadata={"cache_hit": True})
+    return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _hit_chunk(content: str) -> ChatGenerationChunk:
+    message = AIMessageChunk(content=content, response_metadata={"cache_hit": True})
+    return ChatGenerationChunk(message=message)
+
+
+def _chunk(content: str, source: BaseMessage) -> ChatGenerationChunk:
+    # Keep the provider's token usage, which often arrives on the last chunk only.
+    usage = getattr(source, "usage_metadata", None)
+    return ChatGenerationChunk(message=AIMessageChunk(content=content, usage_metadata=usage))
@@ -6,11 +6,23 @@ LLM proxies:     OpenRouter (100+ models, one key), LiteLLM (self-hosted proxy).
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from langchain_core.language_models import BaseChatModel
+from langchain_core.rate_limiters import InMemoryRateLimiter
 
+from neuralscope.core.cache import CacheLimits, LLMCache, namespace_dir
+from neuralscope.core.llm.cached_model import CachedChatModel
 from neuralscope.core.llm.models import ModelConfig
+from neuralscope.core.llm.pricing import model_price
+from neuralscope.core.llm.traced_model import TimedRateLimiter, TracedChatModel
 from neuralscope.core.logging import get_logger
 from neuralscope.core.settings import LLMProvider, Settings, get_settings
+from neuralscope.core.trace_export import span_processors
+from neuralscope.core.tracing import Tracer
+
+if TYPE_CHECKING:
+    from neuralscope.core.semantic_cache import SemanticCacheIndex
 
 logger = get_logger("llm.registry")
 
@@ -52,11 +64,29 @@ class ModelRegistry:
         llm = registry.get("anthropic/claude-sonnet-4-6-20260217")
         llm = registry.get("openrouter/deepseek/r1")
         llm = registry.get("litellm/gpt-5.2")
+
+    When `Settings.cache_enabled` is true, returned models are wrapped in
+    `CachedChatModel`, so identical prompts are answered from disk; the
+    `cache_normalize_code` and `cache_semantic_threshold` settings widen that
+    to reformatted code and near-duplicate prompts.
+    When `Settings.llm_requests_per_second` is set, all models of one provider
+    share a single rate limiter; cache hits are never throttled.
+    When `Settings.llm_tracing` is true, every call is recorded on `tracer`,
+    grouped by the `feature` the model was requested for, and exported when
+    `trace_otlp_endpoint` or `trace_jsonl_path` is set.
     """
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(self, settings: Settings | None = None, tracer: Tracer | None = None) -> None:
         self._settings = settings or get_settings()
+        if tracer is None:
+            tracer = Tracer(max_spans=self._settings.trace_max_spans)
+            for processor in span_processors(self._settings):
+                tracer.add_processor(processor)
+        self.tracer = tracer
         self._cache: dict[str, BaseChatModel] = {}
+        self._models: dict[str, BaseChatModel] = {}
+        self._llm_cache: LLMCache | None = None
+        self._rate_limiters: dict[LLMProvider, TimedRateLimiter] = {}
 
     def get(
         self,
@@ -64,22 +94,105 @@ class ModelRegistry:
         *,
         temperature: float = 0.1,
         max_tokens: int | None = None,
+        feature: str | None = None,
     ) -> BaseChatModel:
+        """Return a (cached) model; `feature` selects its `cache_feature_ttl` entry
+        and labels its trace spans."""
         if model_string is None:
             model_string = self._settings.get_model_string()
 
-        cache_key = f"{model_string}:{temperature}:{max_tokens}"
+        model_key = f"{model_string}:{temperature}:{max_tokens}"
+        cache_key = f"{model_key}:{feature or ''}"
         if cache_key in self._cache:
             return self._cache[cache_key]
 
         config = ModelConfig.from_string(
             model_string, temperature=temperature, max_tokens=max_tokens
         )
-        llm = self._create(config)
+        llm = self._models.get(model_key)
+        if llm is None:
+            llm = self._create(config)
+            if self._settings.llm_requests_per_second:
+                llm.rate_limiter = self._get_rate_limiter(config.provider)
+            self._models[model_key] = llm
+            logger.info("Created LLM: %s (temp=%.1f)", model_string, temperature)
+        if self._settings.cache_enabled:
+            # One wrapper per feature over the same client, so TTLs can differ.
+            llm = CachedChatModel(
+                inner=llm,
+                llm_cache=self._get_llm_cache(),
+                model_id=model_string,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                normalize_code=self._settings.cache_normalize_code,
+                ttl=self._settings.cache_feature_ttl.get(feature) if feature else None,
+            )
+        if self._settings.llm_tracing:
+            llm = TracedChatModel(
+                inner=llm,
+                tracer=self.tracer,
+                model_id=model_string,
+                feature=feature or "llm",
+                price=self._price(config),
+            )
         self._cache[cache_key] = llm
-        logger.info("Created LLM: %s (temp=%.1f)", model_string, temperature)
         return llm
 
+    def _get_llm_cache(self) -> LLMCache:
+        if self._llm_cache is None:
+            self._llm_cache = LLMCache(
+                namespace_dir(self._settings, "llm"),
+                ttl=self._settings.cache_ttl,
+                memory_size=self._settings.cache_memory_size,
+                semantic=self._get_semantic_index(),
+                limits=CacheLimits.for_namespace(self._settings, "llm"),
+            )
+        return self._llm_cache
+
+    def _get_semantic_index(self) -> SemanticCacheIndex | None:
+        threshold = self._settings.cache_semantic_threshold
+        if threshold is None:
+            return None
+        from neuralscope.core.embeddings import EmbeddingsService
+        from neuralscope.core.embeddings.pipeline import EmbeddingCache, EmbeddingPipeline
+        from neuralscope.core.semantic_cache import SemanticCacheIndex
+
+        try:
+            embeddings = EmbeddingsService(self._settings).get()
+        except Exception as exc:  # missing provider package or credentials
+            logger.warning("Semantic cache disabled: %s", exc)
+            return None
+        pipeline = EmbeddingPipeline(
+            embeddings,
+            max_retries=self._settings.embedding_max_retries,
+            cache=EmbeddingCache(
+                namespace_dir(self._settings, "embeddings"),
+                limits=CacheLimits.for_namespace(self._settings, "embeddings"),
+            ),
+        )
+        return SemanticCacheIndex(
+            pipeline,
+            namespace_dir(self._settings, "semantic"),
+            threshold=threshold,
+            ttl=self._settings.cache_ttl,
+            limits=CacheLimits.for_namespace(self._settings, "semantic"),
+        )
+
+    def _get_rate_limiter(self, provider: LLMProvider) -> TimedRateLimiter:
+        if provider not in self._rate_limiters:
+            self._rate_limiters[provider] = TimedRateLimiter(
+                InMemoryRateLimiter(
+                    requests_per_second=self._settings.llm_requests_per_second or 1.0,
+                    check_every_n_seconds=0.05,
+                )
+            )
+        return self._rate_limiters[provider]
+
+    def _price(self, config: ModelConfig) -> tuple[float, float] | None:
+        if config.provider == LLMProvider.OLLAMA:
+            return (0.0, 0.0)
+        return model_price(config.model_name, self._settings.llm_prices)
+
     def _create(self, config: ModelConfig) -> BaseChatModel:
         factory = {
             LLMProvider.OPENAI: self._openai,
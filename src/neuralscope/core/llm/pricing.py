@@ -0,0 +1,49 @@
+"""Per-model list prices for cost estimates in traces.
+
+Prices are USD per million input and output tokens, matched by the longest
+model-name prefix, so dated releases share their family's price. They go
+stale; `Settings.llm_prices` overrides or extends the table.
+"""
+
+from __future__ import annotations
+
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    # OpenAI
+    "gpt-5": (1.25, 10.0),
+    "gpt-5-mini": (0.25, 2.0),
+    "gpt-5-nano": (0.05, 0.4),
+    "gpt-4.1": (2.0, 8.0),
+    "gpt-4.1-mini": (0.4, 1.6),
+    "gpt-4.1-nano": (0.1, 0.4),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "o3": (2.0, 8.0),
+    "o3-pro": (20.0, 80.0),
+    "o4-mini": (1.1, 4.4),
+    # Anthropic
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-haiku-4-5": (1.0, 5.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    # Google
+    "gemini-2.5-pro": (1.25, 10.0),
+    "gemini-2.5-flash": (0.3, 2.5),
+    "gemini-2.5-flash-lite": (0.1, 0.4),
+    "gemini-2.0-flash": (0.1, 0.4),
+    "gemini-1.5-pro": (1.25, 5.0),
+}
+
+
+def model_price(
+    model_name: str,
+    overrides: dict[str, tuple[float, float]] | None = None,
+) -> tuple[float, float] | None:
+    """Return (input, output) USD per million tokens, or None for unknown models."""
+    table = {**MODEL_PRICES, **(overrides or {})}
+    matches = [prefix for prefix in table if model_name.startswith(prefix)]
+    return table[max(matches, key=len)] if matches else None
+
+
+def estimate_cost(price: tuple[float, float], input_tokens: int, output_tokens: int) -> float:
+    return (input_tokens * price[0] + output_tokens * price[1]) / 1_000_000
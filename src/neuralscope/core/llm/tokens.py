@@ -0,0 +1,13 @@
+"""Provider-agnostic token estimates.
+
+Exact counts need a per-provider tokenizer; budgets only need to be close,
+so a characters-per-token heuristic is used everywhere instead.
+"""
+
+from __future__ import annotations
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
@@ -0,0 +1,190 @@
+"""Per-call tracing for LangChain chat models.
+
+`ModelRegistry` wraps every model it hands out, outside the cache, so a
+span covers exactly what a feature waited for: cache lookup, rate-limiter
+queue and the provider call.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from neuralscope.core.llm.cached_model import CachedChatModel
+from neuralscope.core.llm.pricing import estimate_cost
+from neuralscope.core.tracing import Tracer, TraceSpan, activate, current_span
+
+
+class TracedChatModel(BaseChatModel):
+    """Records a `TraceSpan` on `tracer` for each call of `inner`.
+
+    Tokens come from the response's `usage_metadata`; cache hits cost
+    nothing. Run metadata passed through `config={"metadata": ...}` (such
+    as the reviewed `file`) is copied onto the span.
+    """
+
+    inner: BaseChatModel
+    tracer: Tracer
+    model_id: str
+    feature: str = "llm"
+    # USD per million input and output tokens; no cost is recorded without it.
+    price: tuple[float, float] | None = None
+
+    @property
+    def _llm_type(self) -> str:
+        return f"traced-{self.inner._llm_type}"
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        span = self._start(run_manager)
+        try:
+            with activate(span):
+                response = self.inner.invoke(messages, stop=stop, **kwargs)
+        except BaseException as exc:
+            span.finish(error=_error(exc))
+            raise
+        self._observe(span, response)
+        self._finish(span)
+        return ChatResult(generations=[ChatGeneration(message=response)])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        span = self._start(run_manager)
+        try:
+            with activate(span):
+                response = await self.inner.ainvoke(messages, stop=stop, **kwargs)
+        except BaseException as exc:
+            span.finish(error=_error(exc))
+            raise
+        self._observe(span, response)
+        self._finish(span)
+        return ChatResult(generations=[ChatGeneration(message=response)])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        span = self._start(run_manager)
+        try:
+            chunks = iter(self.inner.stream(messages, stop=stop, **kwargs))
+            # Lookup and queueing happen before the first chunk.
+            with activate(span):
+                chunk = next(chunks, None)
+            while chunk is not None:
+                self._observe(span, chunk)
+                if run_manager:
+                    run_manager.on_llm_new_token(chunk.text())
+                yield ChatGenerationChunk(message=chunk)
+                chunk = next(chunks, None)
+        except BaseException as exc:
+            span.finish(error=_error(exc))
+            raise
+        self._finish(span)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        span = self._start(run_manager)
+        try:
+            chunks = aiter(self.inner.astream(messages, stop=stop, **kwargs))
+            # Lookup and queueing happen before the first chunk.
+            with activate(span):
+                chunk = await anext(chunks, None)
+            while chunk is not None:
+                self._observe(span, chunk)
+                if run_manager:
+                    await run_manager.on_llm_new_token(chunk.text())
+                yield ChatGenerationChunk(message=chunk)
+                chunk = await anext(chunks, None)
+        except BaseException as exc:
+            span.finish(error=_error(exc))
+            raise
+        self._finish(span)
+
+    def _start(
+        self, run_manager: CallbackManagerForLLMRun | AsyncCallbackManagerForLLMRun | None
+    ) -> TraceSpan:
+        metadata = run_manager.metadata if run_manager else {}
+        # LangChain adds its own `ls_*` keys to every run.
+        extra = {k: v for k, v in metadata.items() if not k.startswith("ls_")}
+        span = self.tracer.start_span(self.feature, self.model_id, **extra)
+        if isinstance(self.inner, CachedChatModel):
+            span.cache_hit = False
+        return span
+
+    def _observe(self, span: TraceSpan, message: BaseMessage) -> None:
+        """Fold one response, or one streamed chunk, into the span."""
+        if span.ttft_ms is None and message.type == "AIMessageChunk":
+            span.ttft_ms = (time.time() - span.start_time) * 1000
+        if message.response_metadata.get("cache_hit"):
+            span.cache_hit = True
+        usage = getattr(message, "usage_metadata", None)
+        if usage:
+            span.input_tokens += usage.get("input_tokens", 0)
+            span.output_tokens += usage.get("output_tokens", 0)
+
+    def _finish(self, span: TraceSpan) -> None:
+        # Cost first: finishing the span folds it into the tracer's stats.
+        if span.cache_hit:
+            span.cost_usd = 0.0
+        elif self.price is not None:
+            span.cost_usd = estimate_cost(self.price, span.input_tokens, span.output_tokens)
+        span.finish(output_tokens=span.output_tokens)
+
+
+class TimedRateLimiter(BaseRateLimiter):
+    """Delegates to `limiter` and adds each wait to the active span's `queue_ms`."""
+
+    def __init__(self, limiter: BaseRateLimiter) -> None:
+        self._limiter = limiter
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        start = time.perf_counter()
+        try:
+            return self._limiter.acquire(blocking=blocking)
+        finally:
+            _add_queue_time(start)
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        start = time.perf_counter()
+        try:
+            return await self._limiter.aacquire(blocking=blocking)
+        finally:
+            _add_queue_time(start)
+
+
+def _add_queue_time(start: float) -> None:
+    span = current_span()
+    if span is not None:
+        span.queue_ms += (time.perf_counter() - start) * 1000
+
+
+def _error(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import logging
 import time
 from abc import ABC, abstractmethod
+from contextvars import Token
 from typing import Any
 
-from neuralscope.core.logging import get_logger
+from neuralscope.core.logging import KeyValues, get_logger
+from neuralscope.core.tracing import Tracer, TraceSpan, pop_span, push_span
 
 logger = get_logger("log_context")
 
+# Longest string kept in a span attribute.
+_MAX_ATTRIBUTE = 256
+
 
 class ILogContextRepository(ABC):
     """Interface for wide logging in use cases.
@@ -31,26 +37,81 @@ class ILogContextRepository(ABC):
 
 
 class LogContextRepository(ILogContextRepository):
-    """Default implementation: logs to structured logger."""
+    """Default implementation: logs to structured logger.
+
+    With a `tracer`, the use case is also traced: `emit_input` opens a
+    "use_case" span that parents the LLM spans started until `emit_result`.
+    """
 
-    def __init__(self, use_case_name: str) -> None:
+    def __init__(self, use_case_name: str, tracer: Tracer | None = None) -> None:
         self._use_case = use_case_name
         self._start_time: float | None = None
+        self._tracer = tracer
+        self._span: TraceSpan | None = None
+        self._token: Token[TraceSpan | None] | None = None
 
     def emit_input(self, **kwargs: Any) -> None:
         """Log input and start timer."""
         self._start_time = time.monotonic()
-        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
-        logger.info("USE_CASE_INPUT | %s | %s", self._use_case, context)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "USE_CASE_INPUT | %s | %s",
+                self._use_case,
+                KeyValues(kwargs),
+                extra={
+                    "fields": {
+                        "event": "use_case_input",
+                        "use_case": self._use_case,
+                        "context": kwargs,
+                    }
+                },
+            )
+        if self._tracer is not None:
+            self._span = self._tracer.start_span(
+                self._use_case, "", kind="use_case", **_span_attributes(kwargs)
+            )
+            self._token = push_span(self._span)
 
     def emit_result(self, *, result: str, **kwargs: Any) -> None:
         """Log result with elapsed time."""
-        elapsed = f"{time.monotonic() - self._start_time:.3f}s" if self._start_time else "n/a"
-        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
-        logger.info(
-            "USE_CASE_RESULT | %s | result=%s | elapsed=%s | %s",
-            self._use_case,
-            result,
-            elapsed,
-            context,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            seconds = time.monotonic() - self._start_time if self._start_time else None
+            logger.info(
+                "USE_CASE_RESULT | %s | result=%s | elapsed=%s | %s",
+                self._use_case,
+                result,
+                f"{seconds:.3f}s" if seconds is not None else "n/a",
+                KeyValues(kwargs),
+                extra={
+                    "fields": {
+                        "event": "use_case_result",
+                        "use_case": self._use_case,
+                        "result": result,
+                        "elapsed_s": round(seconds, 3) if seconds is not None else None,
+                        "context": kwargs,
+                    }
+                },
+            )
+        self._finish_span(result, kwargs)
+
+    def _finish_span(self, result: str, kwargs: dict[str, Any]) -> None:
+        span, token = self._span, self._token
+        if span is None or token is None:
+            return
+        self._span = self._token = None
+        pop_span(token)
+        span.metadata.update(_span_attributes({"result": result, **kwargs}))
+        error = str(kwargs.get("reason", result)) if result == "error" else None
+        span.finish(error=error)
+
+
+def _span_attributes(values: dict[str, Any]) -> dict[str, Any]:
+    """Scalars as-is; anything else as a string of at most `_MAX_ATTRIBUTE` chars."""
+    attributes: dict[str, Any] = {}
+    for key, value in values.items():
+        if value is None or isinstance(value, bool | int | float):
+            attributes[key] = value
+        else:
+            text = str(value)
+            attributes[key] = text if len(text) <= _MAX_ATTRIBUTE else text[:_MAX_ATTRIBUTE] + "..."
+    return attributes
@@ -1,32 +1,144 @@
-"""Structured logging for NeuralScope."""
+"""Structured logging for NeuralScope.
+
+`setup_logging` puts a `QueueHandler` on the "neuralscope" logger, so the
+logging thread (usually the event loop) only enqueues records; a
+`QueueListener` thread formats and writes them. Message arguments are left
+unformatted until then, so wrap expensive ones in `KeyValues`.
+
+With `log_format="json"`, each line is a JSON object: timestamp, level,
+logger and message, plus the fields a record carries in
+`extra={"fields": {...}}`, with long strings and collections truncated.
+"""
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import queue
 import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from neuralscope.core.settings import LogFormat, Settings, get_settings
 
-from neuralscope.core.settings import get_settings
+TEXT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 
+_listener: QueueListener | None = None
 
-def setup_logging() -> logging.Logger:
+
+def setup_logging(settings: Settings | None = None) -> logging.Logger:
     """Configure structured logging."""
-    settings = get_settings()
+    global _listener
+    settings = settings or get_settings()
 
     logger = logging.getLogger("neuralscope")
     logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
 
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stderr)
-        formatter = logging.Formatter(
-            fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        if settings.log_format == LogFormat.JSON:
+            handler.setFormatter(
+                JsonFormatter(
+                    max_chars=settings.log_max_value_chars, max_items=settings.log_max_items
+                )
+            )
+        else:
+            handler.setFormatter(logging.Formatter(fmt=TEXT_FORMAT, datefmt="%Y-%m-%d %H:%M:%S"))
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        logger.addHandler(_DeferredQueueHandler(records))
+        _listener = QueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
 
     return logger
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and remove the handler `setup_logging` installed."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    logger = logging.getLogger("neuralscope")
+    for handler in [h for h in logger.handlers if isinstance(h, _DeferredQueueHandler)]:
+        logger.removeHandler(handler)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a child logger."""
     return logging.getLogger(f"neuralscope.{name}")
+
+
+class KeyValues:
+    """`k=v` pairs, rendered (and truncated) only when a record is formatted."""
+
+    __slots__ = ("_max_chars", "_values")
+
+    def __init__(self, values: dict[str, Any], *, max_chars: int = 200) -> None:
+        self._values = values
+        self._max_chars = max_chars
+
+    def __str__(self) -> str:
+        return " ".join(
+            f"{k}={truncate(v, max_chars=self._max_chars)}" for k, v in self._values.items()
+        )
+
+
+class JsonFormatter(logging.Formatter):
+    def __init__(self, *, max_chars: int = 1000, max_items: int = 20) -> None:
+        super().__init__()
+        self._max_chars = max_chars
+        self._max_items = max_items
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": truncate(record.getMessage(), max_chars=self._max_chars),
+        }
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            for key, value in fields.items():
+                data.setdefault(
+                    key, truncate(value, max_chars=self._max_chars, max_items=self._max_items)
+                )
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+def truncate(value: Any, *, max_chars: int = 1000, max_items: int = 20) -> Any:
+    """Bound the size of a value for logging; JSON scalars pass through."""
+    if value is None or isinstance(value, bool | int | float):
+        return value
+    if isinstance(value, dict):
+        items = list(value.items())
+        kept = {
+            str(k): truncate(v, max_chars=max_chars, max_items=max_items)
+            for k, v in items[:max_items]
+        }
+        if len(items) > max_items:
+            kept["..."] = f"{len(items) - max_items} more"
+        return kept
+    if isinstance(value, list | tuple | set | frozenset):
+        seq = list(value)
+        kept_items = [
+            truncate(v, max_chars=max_chars, max_items=max_items) for v in seq[:max_items]
+        ]
+        if len(seq) > max_items:
+            kept_items.append(f"... {len(seq) - max_items} more")
+        return kept_items
+    text = str(value)
+    if len(text) > max_chars:
+        return f"{text[:max_chars]}... ({len(text) - max_chars} more chars)"
+    return text
+
+
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock handler formats here, on the caller's thread; the listener does it instead.
+        return record
@@ -0,0 +1,244 @@
+"""Single-pass project walker shared by every feature.
+
+A `ProjectSnapshot` walks a tree once under one ignore policy (built-in skip
+dirs plus any `.gitignore` files) and memoizes file contents and parsed ASTs,
+so several analyses in one process read and parse each file only once.
+Memoized results are keyed by each file's mtime and size, and
+`SnapshotRegistry.get` re-walks the tree, so a long-lived registry picks up
+added, removed and edited files while unchanged ones are still read once.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+SKIP_DIRS = frozenset({".venv", "venv", "__pycache__", ".git", "node_modules", ".tox", ".nox"})
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectFile:
+    path: Path
+    rel: str
+    mtime_ns: int
+    size: int
+
+
+class ProjectSnapshot:
+    """Lazily walked, memoized view of the `.py` files under `root`.
+
+    `read` and `parse` behave like `Path.read_text` and `ast.parse` (including
+    the exceptions they raise) but hit the disk and the parser once per file
+    version, as seen by the walk that produced the `ProjectFile`.
+    """
+
+    def __init__(self, root: Path | str, *, use_gitignore: bool = True) -> None:
+        self._root = Path(root).resolve()
+        self._use_gitignore = use_gitignore
+        self._files: list[ProjectFile] | None = None
+        # rel -> ((mtime_ns, size), result); results of older versions are replaced.
+        self._sources: dict[str, tuple[tuple[int, int], str | OSError | UnicodeDecodeError]] = {}
+        self._trees: dict[str, tuple[tuple[int, int], ast.Module | SyntaxError]] = {}
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def files(self) -> list[ProjectFile]:
+        if self._files is None:
+            found: list[ProjectFile] = []
+            if self._root.is_dir():
+                self._walk(self._root, "", [], found)
+            found.sort(key=lambda f: f.path.parts)
+            self._files = found
+            live = {f.rel for f in found}
+            for memo in (self._sources, self._trees):
+                for rel in memo.keys() - live:
+                    del memo[rel]
+        return self._files
+
+    def refresh(self) -> None:
+        """Re-walk on the next `files` access, keeping results for unchanged files."""
+        self._files = None
+
+    def read(self, file: ProjectFile) -> str:
+        stamp = (file.mtime_ns, file.size)
+        cached = self._sources.get(file.rel)
+        if cached is not None and cached[0] == stamp:
+            source = cached[1]
+        else:
+            try:
+                source = file.path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as exc:
+                source = exc
+            self._sources[file.rel] = (stamp, source)
+        if isinstance(source, Exception):
+            raise source
+        return source
+
+    def parse(self, file: ProjectFile) -> ast.Module:
+        stamp = (file.mtime_ns, file.size)
+        cached = self._trees.get(file.rel)
+        if cached is not None and cached[0] == stamp:
+            tree = cached[1]
+        else:
+            source = self.read(file)
+            try:
+                tree = ast.parse(source, filename=file.rel)
+            except SyntaxError as exc:
+                tree = exc
+            self._trees[file.rel] = (stamp, tree)
+        if isinstance(tree, SyntaxError):
+            raise tree
+        return tree
+
+    def _walk(
+        self,
+        directory: Path,
+        rel_dir: str,
+        rules: list[_IgnoreRule],
+        found: list[ProjectFile],
+    ) -> None:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        if self._use_gitignore and any(e.name == ".gitignore" for e in entries):
+            rules = rules + _read_gitignore(directory / ".gitignore", rel_dir)
+        for entry in entries:
+            rel = f"{rel_dir}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in SKIP_DIRS or _ignored(rules, rel, is_dir=True):
+                    continue
+                self._walk(Path(entry.path), f"{rel}/", rules, found)
+            elif entry.name.endswith(".py") and entry.is_file():
+                if _ignored(rules, rel, is_dir=False):
+                    continue
+                stat = entry.stat()
+                found.append(
+                    ProjectFile(
+                        path=Path(entry.path),
+                        rel=str(Path(rel)),
+                        mtime_ns=stat.st_mtime_ns,
+                        size=stat.st_size,
+                    )
+                )
+
+
+class SnapshotRegistry:
+    """Hands out one `ProjectSnapshot` per root, so features share it.
+
+    Each `get` refreshes the snapshot, so callers always see the current tree.
+    """
+
+    def __init__(self, *, use_gitignore: bool = True) -> None:
+        self._use_gitignore = use_gitignore
+        self._snapshots: dict[Path, ProjectSnapshot] = {}
+
+    def get(self, root: Path | str) -> ProjectSnapshot:
+        key = Path(root).resolve()
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = self._snapshots[key] = ProjectSnapshot(
+                key, use_gitignore=self._use_gitignore
+            )
+        else:
+            snapshot.refresh()
+        return snapshot
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+
+# ── .gitignore ────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class _IgnoreRule:
+    base: str
+    pattern: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _read_gitignore(path: Path, base: str) -> list[_IgnoreRule]:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+    rules: list[_IgnoreRule] = []
+    for line in lines:
+        rule = _parse_rule(line, base)
+        if rule is not None:
+            rules.append(rule)
+    return rules
+
+
+def _parse_rule(line: str, base: str) -> _IgnoreRule | None:
+    line = line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to the .gitignore's directory.
+    anchored = "/" in line
+    line = line.lstrip("/")
+    prefix = "" if anchored else "(?:.*/)?"
+    return _IgnoreRule(
+        base=base,
+        pattern=re.compile(prefix + _glob_to_regex(line) + r"\Z"),
+        negate=negate,
+        dir_only=dir_only,
+    )
+
+
+def _glob_to_regex(glob: str) -> str:
+    out: list[str] = []
+    i = 0
+    while i < len(glob):
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("/**", i) and i + 3 == len(glob):
+            out.append("/.*")
+            i += 3
+        elif glob[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif glob[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif glob[i] == "[" and (end := glob.find("]", i + 1)) != -1:
+            body = glob[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(glob[i]))
+            i += 1
+    return "".join(out)
+
+
+def _ignored(rules: list[_IgnoreRule], rel: str, *, is_dir: bool) -> bool:
+    # Last matching rule wins, as in git.
+    ignored = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if not rel.startswith(rule.base):
+            continue
+        if rule.pattern.match(rel[len(rule.base) :]):
+            ignored = not rule.negate
+    return ignored
@@ -0,0 +1,111 @@
+"""Embedding-similarity lookup tier for `LLMCache`.
+
+Prompts are grouped by a caller-supplied namespace (model, sampling params and
+every message but the last), and only the last message is embedded. A new
+prompt reuses a cached answer when its embedding is within `threshold`
+cosine similarity of one seen before in the same namespace. Namespaces are
+also scoped to the embedder, so vectors from another embedding model (of
+another dimension, or simply another space) are never compared.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from neuralscope.core.cache import CacheLimits, open_cache
+from neuralscope.core.embeddings.pipeline import EmbeddingPipeline
+
+
+class SemanticCacheIndex:
+    def __init__(
+        self,
+        pipeline: EmbeddingPipeline,
+        directory: Path,
+        *,
+        threshold: float = 0.97,
+        ttl: int | None = None,
+        limits: CacheLimits | None = None,
+    ) -> None:
+        self._pipeline = pipeline
+        self._store = open_cache(directory, limits)
+        self._threshold = threshold
+        self._ttl = ttl
+        # Scoped namespace -> stacked unit vectors, loaded from disk on first use.
+        # `search` and `add` run in worker threads, so every access holds the lock.
+        self._entries: dict[str, _Vectors] | None = None
+        self._lock = threading.Lock()
+
+    async def embed(self, text: str) -> np.ndarray:
+        vector = await self._pipeline.embed_query(text)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def search(self, namespace: str, vector: np.ndarray) -> str | None:
+        """Return the cache key of the most similar prompt above the threshold."""
+        with self._lock:
+            keys, matrix = self._namespace(self._scoped(namespace)).view()
+        if not keys or matrix.shape[1] != len(vector):
+            return None
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        return keys[best] if scores[best] >= self._threshold else None
+
+    def add(self, namespace: str, vector: np.ndarray, cache_key: str) -> None:
+        scoped = self._scoped(namespace)
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._namespace(scoped).append(cache_key, vector)
+        self._store.set(cache_key, (scoped, vector.tobytes()), expire=self._ttl)
+
+    def clear(self) -> None:
+        self._store.clear()
+        with self._lock:
+            self._entries = None
+
+    def _scoped(self, namespace: str) -> str:
+        return f"{self._pipeline.embedding_id}\0{namespace}"
+
+    def _namespace(self, namespace: str) -> _Vectors:
+        if self._entries is None:
+            self._entries = {}
+            for key in self._store:
+                entry = self._store.get(key)
+                if entry is None:
+                    continue
+                ns, raw = entry
+                self._entries.setdefault(ns, _Vectors()).append(
+                    key, np.frombuffer(raw, dtype=np.float32)
+                )
+        return self._entries.setdefault(namespace, _Vectors())
+
+
+class _Vectors:
+    """Cache keys and their vectors as rows of one matrix, grown by doubling."""
+
+    __slots__ = ("_keys", "_matrix")
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._matrix: np.ndarray | None = None
+
+    def append(self, key: str, vector: np.ndarray) -> None:
+        n = len(self._keys)
+        if self._matrix is not None and self._matrix.shape[1] != len(vector):
+            # Same embedder id, different dimension: the old vectors are unusable.
+            self._keys, self._matrix, n = [], None, 0
+        if self._matrix is None or n == len(self._matrix):
+            grown = np.empty((max(16, 2 * n), len(vector)), dtype=np.float32)
+            if self._matrix is not None:
+                grown[:n] = self._matrix[:n]
+            self._matrix = grown
+        self._matrix[n] = vector
+        # Rows below the key count are never rewritten, so views handed out stay valid.
+        self._keys.append(key)
+
+    def view(self) -> tuple[list[str], np.ndarray]:
+        if self._matrix is None:
+            return [], np.empty((0, 0), dtype=np.float32)
+        return list(self._keys), self._matrix[: len(self._keys)]
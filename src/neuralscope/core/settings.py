@@ -24,6 +24,29 @@ class QdrantMode(str, Enum):
     SERVER = "server"
 
 
+class VectorBackend(str, Enum):
+    QDRANT = "qdrant"
+    LOCAL = "local"
+
+
+class EvictionPolicy(str, Enum):
+    LEAST_RECENTLY_STORED = "least-recently-stored"
+    LEAST_RECENTLY_USED = "least-recently-used"
+    LEAST_FREQUENTLY_USED = "least-frequently-used"
+    NONE = "none"
+
+
+class LogFormat(str, Enum):
+    TEXT = "text"
+    JSON = "json"
+
+
+class RerankMode(str, Enum):
+    NONE = "none"
+    LLM = "llm"
+    CROSS_ENCODER = "cross-encoder"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="NEURALSCOPE_",
@@ -36,6 +59,7 @@ class Settings(BaseSettings):
     # LLM
     llm_provider: LLMProvider = LLMProvider.OPENAI
     llm_model: str = "gpt-5.2"
+    llm_requests_per_second: float | None = None
 
     # Direct provider keys
     openai_api_key: str | None = Field(default=None, alias="OPENAI_API_KEY")
@@ -53,14 +77,60 @@ class Settings(BaseSettings):
     # Qdrant
     qdrant_url: str = Field(default="http://localhost:6333", alias="QDRANT_URL")
     qdrant_mode: QdrantMode = Field(default=QdrantMode.MEMORY, alias="QDRANT_MODE")
+    qa_vector_search: bool = True
+    # "local" keeps float16 vectors in memory-mapped files under qa_vector_dir.
+    qa_vector_backend: VectorBackend = VectorBackend.QDRANT
+    qa_vector_dir: Path = Path.home() / ".neuralscope" / "vectors"
+    qa_top_k: int = 5
+    qa_candidates: int = 20
+    qa_context_tokens: int = 6000
+    qa_rerank: RerankMode = RerankMode.NONE
+    # Chat model string for LLM rerank, or cross-encoder name; defaults when unset.
+    qa_rerank_model: str | None = None
+    embedding_batch_size: int = 64
+    embedding_concurrency: int = 4
+    embedding_max_retries: int = 3
 
     # MLOps
     langsmith_api_key: str | None = Field(default=None, alias="LANGSMITH_API_KEY")
     langsmith_tracing: bool = Field(default=False, alias="LANGSMITH_TRACING")
+    # One in-memory span per LLM call: latency, tokens, cache hit and estimated cost.
+    llm_tracing: bool = True
+    trace_max_spans: int = 1000
+    # USD per million (input, output) tokens by model-name prefix, over the built-in table.
+    llm_prices: dict[str, tuple[float, float]] = Field(default_factory=dict)
+    # Export spans as OpenTelemetry traces: OTLP/HTTP (e.g. http://localhost:4318/v1/traces)
+    # and/or OTLP/JSON lines appended to a file.
+    trace_otlp_endpoint: str | None = None
+    trace_otlp_headers: dict[str, str] = Field(default_factory=dict)
+    trace_jsonl_path: Path | None = None
 
     # General
     log_level: str = "INFO"
+    log_format: LogFormat = LogFormat.TEXT
+    # Longest string and most list/dict items a JSON log field keeps.
+    log_max_value_chars: int = 1000
+    log_max_items: int = 20
     cache_enabled: bool = True
+    cache_dir: Path = Path.home() / ".neuralscope" / "cache"
+    cache_ttl: int = 3600
+    # LLM response TTL per feature ("review", "docs", "scan", ...), in seconds.
+    cache_feature_ttl: dict[str, int] = Field(default_factory=dict)
+    # Size cap of each cache namespace, with per-namespace overrides ("llm", "embeddings", ...).
+    cache_size_limit_mb: int = 1024
+    cache_size_limits_mb: dict[str, int] = Field(default_factory=dict)
+    cache_eviction_policy: EvictionPolicy = EvictionPolicy.LEAST_RECENTLY_STORED
+    # Entries kept in the in-process LRU in front of the disk cache.
+    cache_memory_size: int = 256
+    # Key fenced code by AST/tokens, so whitespace and comment edits still hit.
+    # Cached reviews then keep the line numbers of the first version seen.
+    cache_normalize_code: bool = False
+    # Cosine similarity at which an embedded prompt reuses a cached answer; off when unset.
+    cache_semantic_threshold: float | None = None
+    scan_concurrency: int = 8
+    review_concurrency: int = 8
+    scan_batch_tokens: int | None = None
+    respect_gitignore: bool = True
     profiles_dir: Path = Path.home() / ".neuralscope" / "profiles"
 
     def get_model_string(self) -> str:
@@ -0,0 +1,266 @@
+"""Export `Tracer` spans as OpenTelemetry traces.
+
+Spans are encoded as OTLP/JSON `ExportTraceServiceRequest` payloads, so
+any OpenTelemetry collector can ingest them without the OpenTelemetry SDK:
+
+- `OtlpHttpExporter` posts them to an OTLP/HTTP endpoint
+  (`http://localhost:4318/v1/traces` for a local collector);
+- `JsonlExporter` appends one payload per line to a file, the format the
+  collector's `otlpjsonfile` receiver reads, for offline CI runs.
+
+Exporters run behind `BatchSpanProcessor`, which only enqueues on the
+caller's thread; a background thread batches and sends.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import queue
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from neuralscope.core.logging import get_logger
+from neuralscope.core.settings import Settings
+from neuralscope.core.tracing import TraceSpan
+
+logger = get_logger("trace_export")
+
+SERVICE_NAME = "neuralscope"
+
+# One processor per exporter config, shared by every registry in the process.
+_shared: dict[tuple[str, ...], BatchSpanProcessor] = {}
+_shared_lock = threading.Lock()
+
+# OTLP SpanKind and StatusCode values.
+_KIND_INTERNAL, _KIND_CLIENT = 1, 3
+_STATUS_OK, _STATUS_ERROR = 1, 2
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, spans: list[TraceSpan]) -> None:
+        """Send one batch; called from the processor's background thread."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook
+        """Release resources after the last batch."""
+
+
+class OtlpHttpExporter(SpanExporter):
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        self._endpoint = endpoint
+        self._headers = {"Content-Type": "application/json", **(headers or {})}
+        self._timeout = timeout
+
+    def export(self, spans: list[TraceSpan]) -> None:
+        body = json.dumps(otlp_payload(spans)).encode()
+        request = urllib.request.Request(  # noqa: S310 - endpoint comes from settings
+            self._endpoint, data=body, headers=self._headers, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self._timeout):  # noqa: S310
+            pass
+
+
+class JsonlExporter(SpanExporter):
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def export(self, spans: list[TraceSpan]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(otlp_payload(spans)) + "\n")
+
+
+class BatchSpanProcessor:
+    """Queues finished spans and exports them in batches from a daemon thread.
+
+    A batch is sent when `max_batch_size` spans are waiting or every
+    `schedule_delay` seconds. When the queue is full, new spans are dropped
+    and counted rather than blocking the caller. Remaining spans are flushed
+    at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        *,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        schedule_delay: float = 5.0,
+    ) -> None:
+        self._exporter = exporter
+        self._queue: queue.Queue[TraceSpan | None] = queue.Queue(max_queue_size)
+        self._max_batch = max(1, max_batch_size)
+        self._delay = schedule_delay
+        self._stopped = threading.Event()
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="neuralscope-span-export", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def on_end(self, span: TraceSpan) -> None:
+        if self._stopped.is_set():
+            return
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        # Blocks until there is room, so the sentinel is never dropped.
+        self._queue.put(None)
+        self._thread.join(timeout=self._delay + 30)
+        self._exporter.shutdown()
+        if self.dropped:
+            logger.warning("Dropped %d spans: export queue was full", self.dropped)
+
+    def _run(self) -> None:
+        while True:
+            batch: list[TraceSpan] = []
+            deadline = time.monotonic() + self._delay
+            stop = False
+            while len(batch) < self._max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            if batch:
+                self._export(batch)
+            if stop:
+                return
+
+    def _export(self, batch: list[TraceSpan]) -> None:
+        try:
+            self._exporter.export(batch)
+        except Exception as exc:
+            logger.warning("Exporting %d spans failed: %s", len(batch), exc)
+
+
+def span_processors(settings: Settings) -> list[BatchSpanProcessor]:
+    """Processors for the exporters enabled in `settings`.
+
+    Processors are shared: every call with the same exporter config returns the
+    same one, so creating many clients does not start an export thread each.
+    """
+    processors: list[BatchSpanProcessor] = []
+    if settings.trace_otlp_endpoint:
+        endpoint, headers = settings.trace_otlp_endpoint, settings.trace_otlp_headers
+        key = ("otlp", endpoint, *sorted(f"{k}={v}" for k, v in headers.items()))
+        processors.append(
+            _shared_processor(key, lambda: OtlpHttpExporter(endpoint, headers=headers))
+        )
+    if settings.trace_jsonl_path:
+        path = settings.trace_jsonl_path
+        key = ("jsonl", str(path.resolve()))
+        processors.append(_shared_processor(key, lambda: JsonlExporter(path)))
+    return processors
+
+
+def _shared_processor(
+    key: tuple[str, ...], exporter: Callable[[], SpanExporter]
+) -> BatchSpanProcessor:
+    with _shared_lock:
+        processor = _shared.get(key)
+        if processor is None or processor.stopped:
+            processor = _shared[key] = BatchSpanProcessor(exporter())
+        return processor
+
+
+def otlp_payload(spans: list[TraceSpan]) -> dict[str, Any]:
+    """An OTLP/JSON `ExportTraceServiceRequest` holding `spans`."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _attributes({"service.name": SERVICE_NAME})},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "neuralscope.tracing"},
+                        "spans": [otlp_span(s) for s in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def otlp_span(span: TraceSpan) -> dict[str, Any]:
+    if span.kind == "llm":
+        # OpenTelemetry semantic conventions for generative AI client spans.
+        name = f"chat {span.model}"
+        kind = _KIND_CLIENT
+        attributes: dict[str, Any] = {
+            "gen_ai.operation.name": "chat",
+            "gen_ai.request.model": span.model,
+            "gen_ai.usage.input_tokens": span.input_tokens,
+            "gen_ai.usage.output_tokens": span.output_tokens,
+            "neuralscope.feature": span.operation,
+            "neuralscope.queue_ms": span.queue_ms,
+            "neuralscope.ttft_ms": span.ttft_ms,
+            "neuralscope.cache_hit": span.cache_hit,
+            "neuralscope.cost_usd": span.cost_usd,
+        }
+    else:
+        name = span.operation
+        kind = _KIND_INTERNAL
+        attributes = {"neuralscope.kind": span.kind}
+    attributes.update({f"neuralscope.{k}": v for k, v in span.metadata.items()})
+
+    data: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": name,
+        "kind": kind,
+        "startTimeUnixNano": str(int(span.start_time * 1e9)),
+        "endTimeUnixNano": str(int(span.end_time * 1e9)),
+        "attributes": _attributes(attributes),
+        "status": (
+            {"code": _STATUS_ERROR, "message": span.error}
+            if span.error is not None
+            else {"code": _STATUS_OK}
+        ),
+    }
+    if span.parent_id:
+        data["parentSpanId"] = span.parent_id
+    return data
+
+
+def _attributes(values: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": _any_value(v)} for k, v in values.items() if v is not None]
+
+
+def _any_value(value: Any) -> dict[str, Any]:
+    # bool before int: bool is an int subclass.
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, list | tuple):
+        return {"arrayValue": {"values": [_any_value(v) for v in value]}}
+    return {"stringValue": str(value)}
@@ -2,20 +2,47 @@
 
 Captures call metadata (model, latency, tokens) for debugging,
 cost tracking, and integration with LangSmith or custom backends.
+`ModelRegistry` opens one span per chat-model call; the span is also the
+active span while the call runs, so code below it (the rate limiter) can
+add to it. `LogContextRepository` opens a "use_case" span around each use
+case, which becomes the parent of the LLM spans started inside it.
+
+Recording is O(1) per span: recent spans sit in a fixed-size ring buffer,
+and stats are folded in as each span finishes, with latency and token
+percentiles read from log-bucketed histograms instead of sorted samples.
 """
 
 from __future__ import annotations
 
+import math
+import os
+import threading
 import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Protocol
 
 from neuralscope.core.logging import get_logger
 
 logger = get_logger("llm_tracing")
 
+_active: ContextVar[TraceSpan | None] = ContextVar("neuralscope_active_span", default=None)
+
+PERCENTILES = (50, 95, 99)
+
+
+class SpanProcessor(Protocol):
+    """Receives every span as it finishes; must not block (see `core.trace_export`)."""
+
+    def on_end(self, span: TraceSpan) -> None: ...
 
-@dataclass
+    def shutdown(self) -> None: ...
+
+
+@dataclass(slots=True)
 class TraceSpan:
     operation: str
     model: str
@@ -25,6 +52,22 @@ class TraceSpan:
     output_tokens: int = 0
     metadata: dict[str, Any] = field(default_factory=dict)
     error: str | None = None
+    # Time spent waiting for the provider's rate limiter.
+    queue_ms: float = 0.0
+    # Set for streamed calls only.
+    ttft_ms: float | None = None
+    # None when the model is not cached.
+    cache_hit: bool | None = None
+    # None when the model has no known price.
+    cost_usd: float | None = None
+    # "llm" for model calls, which are the only spans counted in `Tracer.stats`.
+    kind: str = "llm"
+    # W3C trace-context ids, hex encoded.
+    trace_id: str = field(default_factory=lambda: os.urandom(16).hex())
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+    parent_id: str | None = None
+    # Collector notified once, when the span finishes.
+    tracer: Tracer | None = field(default=None, repr=False, compare=False)
 
     @property
     def duration_ms(self) -> float:
@@ -33,23 +76,46 @@ class TraceSpan:
         return (self.end_time - self.start_time) * 1000
 
     def finish(self, *, output_tokens: int = 0, error: str | None = None) -> None:
+        first = self.end_time == 0.0
         self.end_time = time.time()
         self.output_tokens = output_tokens
         self.error = error
+        if first and self.tracer is not None:
+            self.tracer._record(self)
 
 
 class Tracer:
-    """In-memory trace collector. Integrates with LangSmith when configured."""
+    """In-memory trace collector. Integrates with LangSmith when configured.
+
+    `spans` holds the last `max_spans` spans; `stats` covers every LLM span
+    finished since the tracer was created or cleared. Processors added with
+    `add_processor` see every finished span, of any kind.
+    """
 
     def __init__(self, max_spans: int = 1000) -> None:
-        self._spans: list[TraceSpan] = []
-        self._max = max_spans
+        # Appending to a bounded deque drops the oldest span in O(1).
+        self._spans: deque[TraceSpan] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._started = 0
+        self._operations: dict[str, _OperationStats] = {}
+        self._processors: list[SpanProcessor] = []
+
+    def add_processor(self, processor: SpanProcessor) -> None:
+        self._processors.append(processor)
 
-    def start_span(self, operation: str, model: str, **metadata: Any) -> TraceSpan:
-        span = TraceSpan(operation=operation, model=model, metadata=metadata)
+    def start_span(
+        self, operation: str, model: str, *, kind: str = "llm", **metadata: Any
+    ) -> TraceSpan:
+        """Start a span, as a child of the active span when there is one."""
+        span = TraceSpan(
+            operation=operation, model=model, metadata=metadata, kind=kind, tracer=self
+        )
+        parent = _active.get()
+        if parent is not None:
+            span.trace_id, span.parent_id = parent.trace_id, parent.span_id
         self._spans.append(span)
-        if len(self._spans) > self._max:
-            self._spans = self._spans[-self._max :]
+        if kind == "llm":
+            self._started += 1
         return span
 
     @property
@@ -58,17 +124,149 @@ class Tracer:
 
     @property
     def stats(self) -> dict[str, Any]:
-        total = len(self._spans)
-        errors = sum(1 for s in self._spans if s.error)
-        avg_ms = 0.0
-        finished = [s for s in self._spans if s.end_time > 0]
-        if finished:
-            avg_ms = sum(s.duration_ms for s in finished) / len(finished)
+        with self._lock:
+            operations = {op: s.as_dict() for op, s in self._operations.items()}
+            finished = sum(s.calls for s in self._operations.values())
+            latency = sum(s.latency_total_ms for s in self._operations.values())
         return {
-            "total_calls": total,
-            "errors": errors,
-            "avg_latency_ms": round(avg_ms, 1),
+            "total_calls": self._started,
+            "errors": sum(s["errors"] for s in operations.values()),
+            "avg_latency_ms": round(latency / finished, 1) if finished else 0.0,
+            "features": operations,
         }
 
     def clear(self) -> None:
-        self._spans.clear()
+        with self._lock:
+            self._spans.clear()
+            self._started = 0
+            self._operations.clear()
+
+    def shutdown(self) -> None:
+        """Flush and stop every processor."""
+        for processor in self._processors:
+            processor.shutdown()
+
+    def _record(self, span: TraceSpan) -> None:
+        if span.kind == "llm":
+            with self._lock:
+                stats = self._operations.get(span.operation)
+                if stats is None:
+                    stats = self._operations[span.operation] = _OperationStats()
+                stats.add(span)
+        for processor in self._processors:
+            processor.on_end(span)
+
+
+def current_span() -> TraceSpan | None:
+    return _active.get()
+
+
+@contextmanager
+def activate(span: TraceSpan) -> Iterator[TraceSpan]:
+    """Make `span` the active span for the calls made inside the block."""
+    token = _active.set(span)
+    try:
+        yield span
+    finally:
+        _active.reset(token)
+
+
+def push_span(span: TraceSpan) -> Token[TraceSpan | None]:
+    """Make `span` active until `pop_span`, for code that cannot use `activate`."""
+    return _active.set(span)
+
+
+def pop_span(token: Token[TraceSpan | None]) -> None:
+    try:
+        _active.reset(token)
+    except ValueError:
+        # Popped in another context than it was pushed, e.g. by a resumed generator.
+        old = token.old_value
+        _active.set(None if old is Token.MISSING else old)
+
+
+class LogHistogram:
+    """Streaming quantiles within a relative error of `accuracy`.
+
+    Positive values are counted in logarithmic buckets whose bounds grow by
+    a constant factor, so memory depends on the range of values, not on how
+    many were added; values below `min_value` share a single bucket.
+    """
+
+    __slots__ = ("_counts", "_gamma_log", "_low", "_min", "count")
+
+    def __init__(self, accuracy: float = 0.01, min_value: float = 1e-3) -> None:
+        self._gamma_log = math.log((1 + accuracy) / (1 - accuracy))
+        self._min = min_value
+        self._counts: dict[int, int] = {}
+        self._low = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value < self._min:
+            self._low += 1
+            return
+        index = math.ceil(math.log(value) / self._gamma_log)
+        self._counts[index] = self._counts.get(index, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """Nearest-rank quantile, `q` in [0, 1]; 0.0 when empty."""
+        rank = max(1, math.ceil(q * self.count))
+        seen = self._low
+        if seen >= rank:
+            return 0.0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                # Midpoint of the bucket (gamma^(i-1), gamma^i], in relative terms.
+                return 2 * math.exp(index * self._gamma_log) / (1 + math.exp(self._gamma_log))
+        return 0.0
+
+
+class _OperationStats:
+    __slots__ = (
+        "cache_hits",
+        "calls",
+        "cost_usd",
+        "errors",
+        "input_tokens",
+        "latency",
+        "latency_total_ms",
+        "output_tokens",
+        "priced",
+        "tokens",
+    )
+
+    def __init__(self) -> None:
+        self.calls = self.errors = self.cache_hits = self.priced = 0
+        self.input_tokens = self.output_tokens = 0
+        self.cost_usd = self.latency_total_ms = 0.0
+        self.latency = LogHistogram()
+        self.tokens = LogHistogram()
+
+    def add(self, span: TraceSpan) -> None:
+        duration = span.duration_ms
+        self.calls += 1
+        self.errors += span.error is not None
+        self.cache_hits += bool(span.cache_hit)
+        self.input_tokens += span.input_tokens
+        self.output_tokens += span.output_tokens
+        if span.cost_usd is not None:
+            self.priced += 1
+            self.cost_usd += span.cost_usd
+        self.latency_total_ms += duration
+        self.latency.add(duration)
+        self.tokens.add(span.input_tokens + span.output_tokens)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": round(self.cost_usd, 6) if self.priced else None,
+            "latency_ms": {f"p{p}": round(self.latency.quantile(p / 100), 1) for p in PERCENTILES},
+            "tokens": {f"p{p}": round(self.tokens.quantile(p / 100)) for p in PERCENTILES},
+        }
@@ -69,19 +69,20 @@ class LlmReviewerDatasource:
 
     async def review_source(self, file_path: str, source: str) -> ReviewResult:
         prompt = f"File: {file_path}\n\n```\n{source}\n```"
-        raw = await self._invoke(SYSTEM_PROMPT, prompt)
+        raw = await self._invoke(SYSTEM_PROMPT, prompt, file_path=file_path)
         return self._parse(file_path, raw)
 
     async def review_diff(self, diff: str) -> ReviewResult:
         raw = await self._invoke(DIFF_SYSTEM_PROMPT, diff)
         return self._parse("(diff)", raw)
 
-    async def _invoke(self, system: str, user: str) -> str:
+    async def _invoke(self, system: str, user: str, *, file_path: str | None = None) -> str:
         response = await self._llm.ainvoke(
             [
                 SystemMessage(content=system),
                 HumanMessage(content=user),
-            ]
+            ],
+            config={"metadata": {"file": file_path}} if file_path else None,
         )
         return str(response.content)
 
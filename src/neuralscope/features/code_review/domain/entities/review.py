@@ -52,3 +52,39 @@ class ReviewResult:
     @property
     def passed(self) -> bool:
         return self.score >= 7.0 and self.critical_count == 0
+
+
+@dataclass
+class ProjectReview:
+    """Reviews of every file under a directory or matching a glob."""
+
+    root: str
+    reviews: list[ReviewResult] = field(default_factory=list)
+    # File path -> why its review failed.
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def file_count(self) -> int:
+        return len(self.reviews) + len(self.errors)
+
+    @property
+    def average_score(self) -> float:
+        if not self.reviews:
+            return 0.0
+        return round(sum(r.score for r in self.reviews) / len(self.reviews), 2)
+
+    @property
+    def score_distribution(self) -> dict[int, int]:
+        """Number of files per whole score, 0 to 10."""
+        counts = dict.fromkeys(range(11), 0)
+        for r in self.reviews:
+            counts[min(10, max(0, int(r.score)))] += 1
+        return counts
+
+    @property
+    def failing_files(self) -> list[str]:
+        return [r.file_path for r in self.reviews if not r.passed]
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors and not self.failing_files
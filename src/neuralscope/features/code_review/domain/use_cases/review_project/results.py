@@ -0,0 +1,26 @@
+"""Review project use case results."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from neuralscope.features.code_review.domain.entities.review import ProjectReview
+
+
+@dataclass(frozen=True)
+class ReviewProjectSuccess:
+    report: ProjectReview
+
+    def is_success(self) -> bool:
+        return True
+
+
+@dataclass(frozen=True)
+class ReviewProjectError:
+    message: str
+
+    def is_success(self) -> bool:
+        return False
+
+
+ReviewProjectResult = ReviewProjectSuccess | ReviewProjectError
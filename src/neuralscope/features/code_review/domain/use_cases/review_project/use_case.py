@@ -0,0 +1,137 @@
+"""Review project use case."""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from neuralscope.core.log_context import ILogContextRepository
+from neuralscope.core.project import ProjectFile, ProjectSnapshot, SnapshotRegistry
+from neuralscope.features.code_review.domain.entities.review import ProjectReview, ReviewResult
+from neuralscope.features.code_review.domain.repository.reviewer import (
+    GetReviewErrorResult,
+    IReviewerRepository,
+)
+from neuralscope.features.code_review.domain.use_cases.review_project.results import (
+    ReviewProjectError,
+    ReviewProjectResult,
+    ReviewProjectSuccess,
+)
+
+# Called as each file finishes, in completion order; the review is None when it failed.
+FileReviewedCallback = Callable[[str, ReviewResult | None], None]
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def is_project_target(path: str) -> bool:
+    """Whether `path` names a directory or a glob rather than a single file."""
+    return Path(path).is_dir() or any(c in _GLOB_CHARS for c in path)
+
+
+@dataclass(frozen=True)
+class ReviewProjectParams:
+    target: str
+    max_concurrency: int = 8
+
+
+class ReviewProjectUseCase:
+    """Reviews every file under a directory, or matching a glob, concurrently.
+
+    At most `max_concurrency` reviews run at once. Files come from the shared
+    project snapshot, so ignored directories and `.gitignore`d files are
+    skipped; empty and unreadable files are too. The report is ordered by
+    file path whatever order the reviews finish in.
+    """
+
+    def __init__(
+        self,
+        reviewer_repo: IReviewerRepository,
+        log_context_repository: ILogContextRepository,
+        *,
+        on_file_reviewed: FileReviewedCallback | None = None,
+        snapshots: SnapshotRegistry | None = None,
+    ) -> None:
+        self._reviewer = reviewer_repo
+        self._log_context = log_context_repository
+        self._on_file_reviewed = on_file_reviewed
+        self._snapshots = snapshots or SnapshotRegistry()
+
+    async def __call__(self, params: ReviewProjectParams) -> ReviewProjectResult:
+        self._log_context.emit_input(target=params.target, max_concurrency=params.max_concurrency)
+
+        snapshot, files = self._select(params.target)
+        if snapshot is None:
+            self._log_context.emit_result(result="error", reason="not found")
+            return ReviewProjectError(f"No directory or files match: {params.target}")
+
+        pending: list[tuple[str, str]] = []
+        for f in files:
+            try:
+                source = snapshot.read(f)
+            except (OSError, UnicodeDecodeError):
+                continue
+            if source.strip():
+                pending.append((f.rel, source))
+        if not pending:
+            self._log_context.emit_result(result="error", reason="no files")
+            return ReviewProjectError(f"No Python files to review in: {params.target}")
+
+        reviews: dict[str, ReviewResult] = {}
+        errors: dict[str, str] = {}
+        semaphore = asyncio.Semaphore(max(1, params.max_concurrency))
+
+        async def review(rel: str, source: str) -> None:
+            async with semaphore:
+                result = await self._reviewer.review_file(rel, source)
+            if result.is_success():
+                reviews[rel] = result.get_review()
+            elif isinstance(result, GetReviewErrorResult):
+                errors[rel] = result.message
+            else:
+                errors[rel] = "LLM review failed"
+            if self._on_file_reviewed is not None:
+                self._on_file_reviewed(rel, reviews.get(rel))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for rel, source in pending:
+                    tg.create_task(review(rel, source))
+        except* Exception as group:
+            # Surface the first provider error rather than an opaque ExceptionGroup.
+            raise group.exceptions[0] from None
+
+        report = ProjectReview(
+            root=str(snapshot.root),
+            reviews=[reviews[rel] for rel, _ in pending if rel in reviews],
+            errors={rel: errors[rel] for rel, _ in pending if rel in errors},
+        )
+        self._log_context.emit_result(
+            result="success",
+            files=report.file_count,
+            average_score=report.average_score,
+            failing=len(report.failing_files),
+            errors=len(report.errors),
+        )
+        return ReviewProjectSuccess(report=report)
+
+    def _select(self, target: str) -> tuple[ProjectSnapshot | None, list[ProjectFile]]:
+        path = Path(target)
+        if path.is_dir():
+            snapshot = self._snapshots.get(path)
+            return snapshot, snapshot.files
+
+        # The glob is matched from its longest literal prefix, which becomes the root.
+        parts = path.parts
+        literal = next(i for i, part in enumerate([*parts, "*"]) if _GLOB_CHARS & set(part))
+        root = Path(*parts[:literal]) if literal else Path()
+        if not root.is_dir():
+            return None, []
+        pattern = str(Path(*parts[literal:]))
+        matched = {str(Path(m)) for m in glob.glob(pattern, root_dir=root, recursive=True)}
+        snapshot = self._snapshots.get(root)
+        files = [f for f in snapshot.files if f.rel in matched]
+        return (snapshot, files) if files else (None, [])
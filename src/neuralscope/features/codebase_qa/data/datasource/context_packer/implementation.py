@@ -0,0 +1,102 @@
+"""Packs retrieved chunks into a token-budgeted prompt context."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from neuralscope.core.llm.tokens import estimate_tokens
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
+)
+from neuralscope.features.codebase_qa.data.datasource.lexical_index.implementation import (
+    STOPWORDS,
+    tokenize,
+)
+
+ELISION = "    ..."
+
+# Below this many tokens a trimmed window is too small to be worth sending.
+MIN_BLOCK_TOKENS = 32
+
+
+@dataclass
+class PackedContext:
+    blocks: list[str]
+    chunks: list[CodeChunk]
+    tokens: int
+
+
+class ContextPacker:
+    """Fills `token_budget` with chunks in relevance order.
+
+    A chunk that overlaps one already packed from the same file is dropped,
+    so no line is sent twice even if the caller mixes chunks from different
+    indexes. A chunk larger than its share of the budget is
+    trimmed to its first line plus the window of lines that mentions the most
+    question terms.
+    """
+
+    def __init__(self, token_budget: int = 6000, *, max_chunk_share: float = 0.5) -> None:
+        self._budget = token_budget
+        self._max_chunk_tokens = max(MIN_BLOCK_TOKENS, int(token_budget * max_chunk_share))
+
+    def pack(self, question: str, chunks: list[CodeChunk]) -> PackedContext:
+        terms = set(tokenize(question)) - STOPWORDS
+        packed = PackedContext(blocks=[], chunks=[], tokens=0)
+        for chunk in chunks:
+            if any(_overlaps(chunk, kept) for kept in packed.chunks):
+                continue
+            remaining = self._budget - packed.tokens
+            if remaining < MIN_BLOCK_TOKENS:
+                break
+            block, start, end = self._render(chunk, terms, min(remaining, self._max_chunk_tokens))
+            tokens = estimate_tokens(block)
+            if tokens > remaining:
+                continue
+            packed.blocks.append(block)
+            packed.chunks.append(replace(chunk, line_start=start, line_end=end))
+            packed.tokens += tokens
+        return packed
+
+    def _render(self, chunk: CodeChunk, terms: set[str], budget: int) -> tuple[str, int, int]:
+        header = f"# {chunk.file_path}:{chunk.line_start}-{chunk.line_end}\n"
+        if estimate_tokens(header + chunk.content) <= budget:
+            return header + chunk.content, chunk.line_start, chunk.line_end
+
+        lines = chunk.content.splitlines()
+        first, body = lines[0], lines[1:]
+        start, end = _best_window(body, terms, budget - estimate_tokens(header + first) - 4)
+        window = body[start:end]
+        parts = [first]
+        if start > 0:
+            parts.append(ELISION)
+        parts.extend(window)
+        if end < len(body):
+            parts.append(ELISION)
+        # The end line covers the window actually sent, so cited sources stay accurate.
+        line_end = chunk.line_start + end
+        header = f"# {chunk.file_path}:{chunk.line_start}-{line_end}\n"
+        return header + "\n".join(parts), chunk.line_start, line_end
+
+
+def _overlaps(a: CodeChunk, b: CodeChunk) -> bool:
+    return a.file_path == b.file_path and a.line_start <= b.line_end and b.line_start <= a.line_end
+
+
+def _best_window(lines: list[str], terms: set[str], budget: int) -> tuple[int, int]:
+    """Return [start, end) of the densest run of question terms that fits `budget` tokens."""
+    costs = [estimate_tokens(line) + 1 for line in lines]
+    hits = [len(terms.intersection(tokenize(line))) for line in lines]
+    best_hits, best_start, best_end = -1, 0, 0
+    start = used = score = 0
+    for end, cost in enumerate(costs, start=1):
+        used += cost
+        score += hits[end - 1]
+        while used > budget and start < end:
+            used -= costs[start]
+            score -= hits[start]
+            start += 1
+        # On ties, keep growing the earliest window rather than jumping ahead.
+        if score > best_hits or (score == best_hits and start == best_start):
+            best_hits, best_start, best_end = score, start, end
+    return best_start, best_end
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import ast
+import hashlib
+from collections.abc import Mapping
 from dataclasses import dataclass
-from pathlib import Path
 
+from neuralscope.core.project import SnapshotRegistry
 from neuralscope.features.codebase_qa.domain.entities.answer import SourceReference
 
-SKIP_DIRS = {".venv", "venv", "__pycache__", ".git", "node_modules", ".tox"}
-
 
 @dataclass
 class CodeChunk:
@@ -17,6 +17,8 @@ class CodeChunk:
     content: str
     line_start: int
     line_end: int
+    symbol: str = ""
+    parent: str | None = None
 
     def to_source_ref(self, snippet: str = "") -> SourceReference:
         return SourceReference(
@@ -27,67 +29,177 @@ class CodeChunk:
         )
 
 
+_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _first_line(stmt: ast.stmt) -> int:
+    decorators = getattr(stmt, "decorator_list", [])
+    return min([stmt.lineno, *(d.lineno for d in decorators)])
+
+
+@dataclass
+class IndexedFile:
+    file_path: str
+    digest: str
+    chunks: list[CodeChunk] | None
+
+
 class FileIndexer:
     """Walks .py files and produces chunks suitable for embedding."""
 
-    def __init__(self, max_chunk_lines: int = 60) -> None:
+    def __init__(
+        self,
+        max_chunk_lines: int = 60,
+        *,
+        snapshots: SnapshotRegistry | None = None,
+    ) -> None:
         self._max_lines = max_chunk_lines
+        self._snapshots = snapshots or SnapshotRegistry()
 
     def index(self, project_path: str) -> list[CodeChunk]:
-        root = Path(project_path)
-        chunks: list[CodeChunk] = []
-
-        for f in sorted(root.rglob("*.py")):
-            if self._skip(f, root):
-                continue
+        return [c for f in self.index_files(project_path) for c in f.chunks or []]
+
+    def index_files(
+        self,
+        project_path: str,
+        *,
+        known: Mapping[str, str] | None = None,
+    ) -> list[IndexedFile]:
+        """Chunk every non-empty file, skipping those whose digest matches `known`.
+
+        Skipped files are still listed, with `chunks=None`, so callers can tell
+        unchanged files from deleted ones.
+        """
+        snapshot = self._snapshots.get(project_path)
+        known = known or {}
+        files: list[IndexedFile] = []
+
+        for f in snapshot.files:
             try:
-                source = f.read_text(encoding="utf-8")
+                source = snapshot.read(f)
             except (OSError, UnicodeDecodeError):
                 continue
             if not source.strip():
                 continue
 
-            rel = str(f.relative_to(root))
-            file_chunks = self._chunk_by_ast(rel, source)
+            digest = hashlib.sha256(source.encode()).hexdigest()
+            if known.get(f.rel) == digest:
+                files.append(IndexedFile(f.rel, digest, None))
+                continue
+
+            try:
+                file_chunks = self._chunk_by_ast(f.rel, source, snapshot.parse(f))
+            except SyntaxError:
+                file_chunks = []
             if not file_chunks:
-                file_chunks = self._chunk_by_lines(rel, source)
-            chunks.extend(file_chunks)
+                file_chunks = self._chunk_by_lines(f.rel, source)
+            files.append(IndexedFile(f.rel, digest, file_chunks))
 
-        return chunks
+        return files
 
-    def _chunk_by_ast(self, file_path: str, source: str) -> list[CodeChunk]:
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            return []
+    def _chunk_by_ast(self, file_path: str, source: str, tree: ast.Module) -> list[CodeChunk]:
+        """Split a module into non-overlapping chunks that cover every line once.
 
+        A def or class that fits in `max_chunk_lines` is one chunk. A larger
+        class is split into its own lines (header, attributes) and one subtree
+        per member; a larger function is cut at statement boundaries. Code
+        between defs belongs to the enclosing scope. `symbol` names the scope a
+        chunk belongs to and `parent` the enclosing one, whose first chunk is
+        its header.
+        """
         lines = source.splitlines()
+        return self._chunk_scope(file_path, lines, tree.body, 1, len(lines), "", None)
+
+    def _chunk_scope(
+        self,
+        file_path: str,
+        lines: list[str],
+        body: list[ast.stmt],
+        start: int,
+        end: int,
+        symbol: str,
+        parent: str | None,
+    ) -> list[CodeChunk]:
         chunks: list[CodeChunk] = []
+        own_start = start
+        own_splits: list[int] = []
+        for stmt in body:
+            first = max(_first_line(stmt), own_start)
+            if not isinstance(stmt, _DEFS):
+                own_splits.append(first)
+                continue
+            chunks += self._split(
+                file_path, lines, own_start, first - 1, own_splits, symbol, parent
+            )
+            name = f"{symbol}.{stmt.name}" if symbol else stmt.name
+            last = stmt.end_lineno or first
+            chunks += self._chunk_def(file_path, lines, stmt, first, last, name, symbol or None)
+            own_start, own_splits = last + 1, []
+        chunks += self._split(file_path, lines, own_start, end, own_splits, symbol, parent)
+        return chunks
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
-                start = node.lineno
-                end = node.end_lineno or start
-                body = "\n".join(lines[start - 1 : end])
-                chunks.append(
-                    CodeChunk(
-                        file_path=file_path,
-                        content=body,
-                        line_start=start,
-                        line_end=end,
-                    )
-                )
-
-        if not chunks and lines:
+    def _chunk_def(
+        self,
+        file_path: str,
+        lines: list[str],
+        node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef,
+        start: int,
+        end: int,
+        symbol: str,
+        parent: str | None,
+    ) -> list[CodeChunk]:
+        if end - start < self._max_lines:
+            return self._split(file_path, lines, start, end, [], symbol, parent)
+        if isinstance(node, ast.ClassDef):
+            return self._chunk_scope(file_path, lines, node.body, start, end, symbol, parent)
+        # Continuation pieces of a long function point back at its first piece.
+        splits = [_first_line(stmt) for stmt in node.body]
+        pieces = self._split(file_path, lines, start, end, splits, symbol, parent)
+        for piece in pieces[1:]:
+            piece.parent = symbol
+        return pieces
+
+    def _split(
+        self,
+        file_path: str,
+        lines: list[str],
+        start: int,
+        end: int,
+        splits: list[int],
+        symbol: str,
+        parent: str | None,
+    ) -> list[CodeChunk]:
+        """Cut lines `start..end` into pieces of at most `max_chunk_lines`.
+
+        Pieces end just before a line in `splits` where possible, falling back
+        to a hard cut. Blank runs are dropped; every other line lands in
+        exactly one piece.
+        """
+        chunks: list[CodeChunk] = []
+        while start <= end:
+            while start <= end and not lines[start - 1].strip():
+                start += 1
+            if start > end:
+                break
+            stop = min(end, start + self._max_lines - 1)
+            if stop < end:
+                cut = max((s for s in splits if start < s <= stop + 1), default=None)
+                if cut is not None:
+                    stop = cut - 1
+            last = stop
+            while not lines[last - 1].strip():
+                last -= 1
             chunks.append(
                 CodeChunk(
                     file_path=file_path,
-                    content=source[:3000],
-                    line_start=1,
-                    line_end=len(lines),
+                    content="\n".join(lines[start - 1 : last]),
+                    line_start=start,
+                    line_end=last,
+                    symbol=symbol,
+                    parent=parent,
                 )
             )
-
+            start = stop + 1
         return chunks
 
     def _chunk_by_lines(self, file_path: str, source: str) -> list[CodeChunk]:
@@ -104,7 +216,3 @@ class FileIndexer:
                 )
             )
         return chunks
-
-    @staticmethod
-    def _skip(path: Path, root: Path) -> bool:
-        return bool(SKIP_DIRS & set(path.relative_to(root).parts))
@@ -0,0 +1,138 @@
+"""On-disk Q&A index: chunks and embeddings per project root.
+
+Each root gets a JSON manifest (per-file content hash, chunks and vector row
+range) and a float32 `.npy` matrix of chunk embeddings, so a warm start only
+re-chunks and re-embeds files whose content changed. The matrix is
+memory-mapped on load: vectors are only read from disk for the rows used.
+
+Each save writes the matrix under a fresh name before the manifest that
+points to it, so replacing the manifest atomically switches both.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from neuralscope.core.logging import get_logger
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
+)
+
+logger = get_logger("qa_index_store")
+
+# Bump when the manifest layout or chunking rules change.
+INDEX_VERSION = 3
+
+
+@dataclass
+class IndexEntry:
+    digest: str
+    chunks: list[CodeChunk]
+    # One row per chunk; None until the chunks have been embedded.
+    vectors: np.ndarray | None = None
+
+
+class QAIndexStore:
+    def __init__(self, directory: Path) -> None:
+        self._dir = directory
+
+    def load(self, root: str, embedding_id: str | None) -> dict[str, IndexEntry]:
+        """Return stored entries, or nothing if they were built for another embedder."""
+        path = self._manifest_path(root)
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                manifest.get("version") != INDEX_VERSION
+                or manifest.get("root") != root
+                or manifest.get("embedding_id") != embedding_id
+            ):
+                return {}
+            vectors = manifest["vectors"]
+            matrix = np.load(self._dir / vectors, mmap_mode="r") if vectors else None
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Ignoring unreadable Q&A index %s: %s", path, exc)
+            return {}
+        return {
+            file_path: _entry_from_json(file_path, raw, matrix)
+            for file_path, raw in manifest["files"].items()
+        }
+
+    def save(self, root: str, embedding_id: str | None, entries: dict[str, IndexEntry]) -> None:
+        files: dict[str, Any] = {}
+        blocks: list[np.ndarray] = []
+        row = 0
+        for file_path, entry in entries.items():
+            rows = None
+            if entry.vectors is not None and len(entry.vectors):
+                rows = [row, row + len(entry.vectors)]
+                blocks.append(np.asarray(entry.vectors, dtype=np.float32))
+                row += len(entry.vectors)
+            files[file_path] = {
+                "digest": entry.digest,
+                "chunks": [
+                    [c.content, c.line_start, c.line_end, c.symbol, c.parent] for c in entry.chunks
+                ],
+                "rows": rows,
+            }
+
+        self._dir.mkdir(parents=True, exist_ok=True)
+        key = self._key(root)
+        vectors = None
+        if blocks:
+            matrix = np.concatenate(blocks)
+            vectors = f"{key}.{os.urandom(8).hex()}.npy"
+            tmp = self._dir / f".{vectors}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, matrix)
+            os.replace(tmp, self._dir / vectors)
+
+        manifest = {
+            "version": INDEX_VERSION,
+            "root": root,
+            "embedding_id": embedding_id,
+            "vectors": vectors,
+            "files": files,
+        }
+        path = self._manifest_path(root)
+        tmp = self._dir / f".{path.name}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, path)
+
+        for stale in self._dir.glob(f"{key}.*.npy"):
+            if stale.name != vectors:
+                # Still mapped by a reader on some platforms; the next save retries.
+                with contextlib.suppress(OSError):
+                    stale.unlink()
+
+    def _key(self, root: str) -> str:
+        return hashlib.sha256(root.encode()).hexdigest()[:16]
+
+    def _manifest_path(self, root: str) -> Path:
+        return self._dir / f"{self._key(root)}.json"
+
+
+def _entry_from_json(file_path: str, raw: dict[str, Any], matrix: np.ndarray | None) -> IndexEntry:
+    chunks = [
+        CodeChunk(
+            file_path=file_path,
+            content=content,
+            line_start=start,
+            line_end=end,
+            symbol=symbol,
+            parent=parent,
+        )
+        for content, start, end, symbol, parent in raw["chunks"]
+    ]
+    rows = raw["rows"]
+    vectors = matrix[rows[0] : rows[1]] if rows and matrix is not None else None
+    return IndexEntry(digest=raw["digest"], chunks=chunks, vectors=vectors)
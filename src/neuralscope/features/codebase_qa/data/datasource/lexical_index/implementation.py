@@ -0,0 +1,97 @@
+"""BM25 lexical index over code chunks.
+
+Identifiers are split on snake_case and CamelCase boundaries (the whole
+identifier is kept too), so "user repository" finds `UserRepository` and
+`user_repo`. Postings live in flat `array`s in CSR layout: a query only walks
+the postings of its own terms, never the whole corpus.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from array import array
+from collections import Counter
+from functools import lru_cache
+
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
+)
+
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+")
+_CAMEL = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# Question words that are rare in code and would otherwise get a high IDF.
+STOPWORDS = frozenset(
+    "a an and are be can do does for from how i in is it of on or the this to what when "
+    "where which who why with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    tokens: list[str] = []
+    for word in _WORD.findall(text):
+        tokens.extend(_split_identifier(word))
+    return tokens
+
+
+@lru_cache(maxsize=1 << 16)
+def _split_identifier(word: str) -> tuple[str, ...]:
+    # Identifiers repeat heavily across a codebase, so splits are memoized.
+    parts = [p.lower() for piece in word.split("_") for p in _CAMEL.findall(piece)]
+    whole = word.strip("_").lower()
+    if len(parts) > 1 and whole:
+        parts.append(whole)
+    return tuple(parts)
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of chunks, built once per index."""
+
+    def __init__(self, chunks: list[CodeChunk], *, k1: float = 1.2, b: float = 0.75) -> None:
+        self._chunks = chunks
+        self._k1 = k1
+        self._b = b
+
+        postings: dict[str, list[tuple[int, int]]] = {}
+        self._doc_len = array("I")
+        for doc_id, chunk in enumerate(chunks):
+            counts = Counter(tokenize(f"{chunk.file_path}\n{chunk.content}"))
+            self._doc_len.append(sum(counts.values()))
+            for term, tf in counts.items():
+                postings.setdefault(term, []).append((doc_id, tf))
+
+        self._terms: dict[str, int] = {}
+        self._offsets = array("I", [0])
+        self._doc_ids = array("I")
+        self._tfs = array("I")
+        self._idf = array("d")
+        n_docs = len(chunks)
+        for term_id, (term, plist) in enumerate(postings.items()):
+            self._terms[term] = term_id
+            for doc_id, tf in plist:
+                self._doc_ids.append(doc_id)
+                self._tfs.append(tf)
+            self._offsets.append(len(self._doc_ids))
+            df = len(plist)
+            self._idf.append(math.log(1 + (n_docs - df + 0.5) / (df + 0.5)))
+        self._avg_len = (sum(self._doc_len) / n_docs) if n_docs else 0.0
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def search(self, query: str, top_k: int) -> list[tuple[CodeChunk, float]]:
+        k1, b, avg_len = self._k1, self._b, self._avg_len or 1.0
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)) - STOPWORDS:
+            term_id = self._terms.get(term)
+            if term_id is None:
+                continue
+            idf = self._idf[term_id]
+            for i in range(self._offsets[term_id], self._offsets[term_id + 1]):
+                doc_id, tf = self._doc_ids[i], self._tfs[i]
+                norm = k1 * (1 - b + b * self._doc_len[doc_id] / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [(self._chunks[doc_id], score) for doc_id, score in best]
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import AsyncIterator
 from typing import Any
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages.ai import UsageMetadata
 
+from neuralscope.core.llm.tokens import estimate_tokens
 from neuralscope.core.logging import get_logger
 from neuralscope.features.codebase_qa.domain.entities.answer import Answer, SourceReference
 
@@ -40,16 +43,48 @@ class LlmAnswerer:
         self._llm = llm
 
     async def answer(self, question: str, context_chunks: list[str]) -> Answer:
+        prompt = self._prompt(question, context_chunks)
+        response = await self._llm.ainvoke(self._messages(prompt))
+        answer = self._parse(question, str(response.content))
+        answer.prompt_tokens = self._prompt_tokens(
+            prompt, getattr(response, "usage_metadata", None)
+        )
+        return answer
+
+    async def answer_stream(
+        self, question: str, context_chunks: list[str]
+    ) -> AsyncIterator[str | Answer]:
+        """Yield the answer text as it is generated, then the parsed `Answer`."""
+        prompt = self._prompt(question, context_chunks)
+        decoder = AnswerTextDecoder()
+        parts: list[str] = []
+        usage: UsageMetadata | None = None
+        async for chunk in self._llm.astream(self._messages(prompt)):
+            text = str(chunk.content)
+            parts.append(text)
+            usage = getattr(chunk, "usage_metadata", None) or usage
+            delta = decoder.feed(text)
+            if delta:
+                yield delta
+        answer = self._parse(question, "".join(parts))
+        answer.prompt_tokens = self._prompt_tokens(prompt, usage)
+        yield answer
+
+    @staticmethod
+    def _prompt(question: str, context_chunks: list[str]) -> str:
         context = "\n\n---\n\n".join(context_chunks)
-        prompt = f"Question: {question}\n\nCode Context:\n{context}"
+        return f"Question: {question}\n\nCode Context:\n{context}"
 
-        response = await self._llm.ainvoke(
-            [
-                SystemMessage(content=SYSTEM_PROMPT),
-                HumanMessage(content=prompt),
-            ]
-        )
-        return self._parse(question, str(response.content))
+    @staticmethod
+    def _messages(prompt: str) -> list[BaseMessage]:
+        return [SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)]
+
+    @staticmethod
+    def _prompt_tokens(prompt: str, usage: UsageMetadata | None) -> int:
+        # Providers report exact input tokens; cache hits and fakes do not.
+        if usage:
+            return usage["input_tokens"]
+        return estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt)
 
     def _parse(self, question: str, raw: str) -> Answer:
         try:
@@ -86,3 +121,55 @@ class LlmAnswerer:
         if start >= 0 and end > start:
             return text[start:end]
         return text
+
+
+_ANSWER_KEY = re.compile(r'"answer"\s*:\s*"')
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class AnswerTextDecoder:
+    """Incrementally decodes the `"answer"` string out of a streamed JSON reply.
+
+    The prompt asks for one JSON object, so the raw stream is not fit to show;
+    this yields just the answer text, as soon as each character is complete.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos: int | None = None
+        self._done = False
+
+    def feed(self, text: str) -> str:
+        self._buffer += text
+        if self._done:
+            return ""
+        if self._pos is None:
+            match = _ANSWER_KEY.search(self._buffer)
+            if match is None:
+                return ""
+            self._pos = match.end()
+
+        buf, i, out = self._buffer, self._pos, []
+        while i < len(buf):
+            char = buf[i]
+            if char == '"':
+                self._done = True
+                break
+            if char != "\\":
+                out.append(char)
+                i += 1
+                continue
+            # Escapes may be split across chunks; wait until one is complete.
+            if i + 1 >= len(buf):
+                break
+            if buf[i + 1] != "u":
+                out.append(_ESCAPES.get(buf[i + 1], buf[i + 1]))
+                i += 2
+                continue
+            width = 12 if buf[i + 2 : i + 4].upper() in {"D8", "D9", "DA", "DB"} else 6
+            if i + width > len(buf):
+                break
+            out.append(json.loads(f'"{buf[i : i + width]}"'))
+            i += width
+        self._pos = i
+        return "".join(out)
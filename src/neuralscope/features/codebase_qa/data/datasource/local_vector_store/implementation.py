@@ -0,0 +1,282 @@
+"""Memory-mapped float16 vector store for Q&A without a Qdrant server.
+
+Each project gets a directory named after its resolved root, holding one
+directory per index generation:
+
+- `vectors.npy`: unit-normalized float16 rows, memory-mapped on load.
+- `chunks.jsonl`: one JSON array per row, located through `offsets.npy`.
+- `meta.json`: format version, embedder and shape.
+- `ivf.npz` (large indexes only): k-means centroids and the row range of
+  each cluster, since rows are stored grouped by cluster.
+
+A `CURRENT` file names the live generation and is replaced atomically, so
+a reader never sees a half-written index. Loading only maps the arrays;
+chunk text is read from disk for the rows a search returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from neuralscope.core.embeddings.pipeline import EmbeddingPipeline
+from neuralscope.core.logging import get_logger
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
+)
+from neuralscope.features.codebase_qa.data.datasource.vector_store.implementation import (
+    ChunkVectorStore,
+)
+
+logger = get_logger("local_vector_store")
+
+STORE_VERSION = 1
+
+# Below this many rows an exact scan is fast enough; above it, search an IVF index.
+IVF_MIN_ROWS = 20_000
+
+# Rows widened to float32 per matrix product, bounding the scratch memory of a scan.
+SCAN_ROWS = 16_384
+
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+
+
+class LocalChunkStore(ChunkVectorStore):
+    """Exact cosine search, or IVF search probing `nprobe` clusters.
+
+    Indexes with at least `ivf_min_rows` chunks are clustered into about
+    sqrt(n) lists when written.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        pipeline: EmbeddingPipeline,
+        *,
+        ivf_min_rows: int = IVF_MIN_ROWS,
+        nprobe: int = 8,
+    ) -> None:
+        super().__init__(pipeline)
+        self._dir = directory
+        self._ivf_min_rows = ivf_min_rows
+        self._nprobe = max(1, nprobe)
+        self._mapped: dict[Path, _MappedIndex | None] = {}
+
+    async def index(
+        self,
+        project_path: str,
+        chunks: list[CodeChunk],
+        vectors: np.ndarray,
+        *,
+        generation: str,
+    ) -> None:
+        if await self.reuse(project_path, generation):
+            return
+        project_dir = self._project_dir(project_path)
+        self._mapped.pop(project_dir, None)
+        await asyncio.to_thread(self._write, project_dir, generation[:16], chunks, vectors)
+
+    async def reuse(self, project_path: str, generation: str) -> bool:
+        project_dir = self._project_dir(project_path)
+        name = generation[:16]
+        if _current(project_dir) != name or not (project_dir / name).is_dir():
+            return False
+        mapped = self._mapped.get(project_dir)
+        if mapped is None or mapped.path.name != name:
+            self._mapped.pop(project_dir, None)
+        return True
+
+    async def search(self, project_path: str, question: str, top_k: int) -> list[CodeChunk]:
+        index = self._load(self._project_dir(project_path))
+        if index is None:
+            return []
+        query = _normalize(await self._pipeline.embed_query(question))
+        return index.chunks(index.top_rows(query, top_k, self._nprobe))
+
+    def _project_dir(self, project_path: str) -> Path:
+        root = str(Path(project_path).resolve())
+        return self._dir / hashlib.sha256(root.encode()).hexdigest()[:16]
+
+    def _load(self, project_dir: Path) -> _MappedIndex | None:
+        if project_dir not in self._mapped:
+            name = _current(project_dir)
+            index = None
+            if name:
+                try:
+                    index = _MappedIndex.open(project_dir / name, self.embedding_id)
+                except (OSError, ValueError, KeyError) as exc:
+                    logger.warning("Ignoring unreadable vector index %s: %s", project_dir, exc)
+            self._mapped[project_dir] = index
+        return self._mapped[project_dir]
+
+    def _write(
+        self,
+        project_dir: Path,
+        name: str,
+        chunks: list[CodeChunk],
+        vectors: np.ndarray,
+    ) -> None:
+        project_dir.mkdir(parents=True, exist_ok=True)
+        if not chunks:
+            (project_dir / "CURRENT").unlink(missing_ok=True)
+            return
+
+        tmp = project_dir / f".{name}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+        order = np.arange(len(chunks))
+        if len(chunks) >= self._ivf_min_rows:
+            centroids, assignment = _kmeans(matrix, max(1, int(math.sqrt(len(chunks)))))
+            order = np.argsort(assignment, kind="stable")
+            bounds = np.searchsorted(assignment[order], np.arange(len(centroids) + 1))
+            np.savez(tmp / "ivf.npz", centroids=centroids, bounds=bounds)
+        np.save(tmp / "vectors.npy", matrix[order].astype(np.float16))
+
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        with open(tmp / "chunks.jsonl", "wb") as f:
+            for row, i in enumerate(order, start=1):
+                c = chunks[i]
+                line = json.dumps(
+                    [c.file_path, c.content, c.line_start, c.line_end, c.symbol, c.parent]
+                ).encode()
+                f.write(line + b"\n")
+                offsets[row] = offsets[row - 1] + len(line) + 1
+        np.save(tmp / "offsets.npy", offsets)
+        (tmp / "meta.json").write_text(
+            json.dumps(
+                {
+                    "version": STORE_VERSION,
+                    "embedding_id": self.embedding_id,
+                    "rows": len(chunks),
+                    "dim": int(matrix.shape[1]),
+                }
+            )
+        )
+
+        target = project_dir / name
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+        pointer = project_dir / f".CURRENT.{os.getpid()}.tmp"
+        pointer.write_text(name)
+        os.replace(pointer, project_dir / "CURRENT")
+        for stale in project_dir.iterdir():
+            if stale.is_dir() and stale.name != name and not stale.name.startswith("."):
+                shutil.rmtree(stale, ignore_errors=True)
+
+
+@dataclass
+class _MappedIndex:
+    path: Path
+    vectors: np.ndarray
+    offsets: np.ndarray
+    centroids: np.ndarray | None
+    bounds: np.ndarray | None
+
+    @classmethod
+    def open(cls, path: Path, embedding_id: str) -> _MappedIndex:
+        meta = json.loads((path / "meta.json").read_text())
+        if meta["version"] != STORE_VERSION or meta["embedding_id"] != embedding_id:
+            raise ValueError("index was written by another version or embedder")
+        centroids = bounds = None
+        if (path / "ivf.npz").exists():
+            with np.load(path / "ivf.npz") as ivf:
+                centroids, bounds = ivf["centroids"], ivf["bounds"]
+        return cls(
+            path=path,
+            vectors=np.load(path / "vectors.npy", mmap_mode="r"),
+            offsets=np.load(path / "offsets.npy", mmap_mode="r"),
+            centroids=centroids,
+            bounds=bounds,
+        )
+
+    def top_rows(self, query: np.ndarray, top_k: int, nprobe: int) -> np.ndarray:
+        if self.centroids is None or self.bounds is None:
+            ranges = [(0, len(self.vectors))]
+        else:
+            probe = np.argsort(-(self.centroids @ query))[:nprobe]
+            ranges = [(int(self.bounds[c]), int(self.bounds[c + 1])) for c in probe]
+
+        rows: list[np.ndarray] = []
+        scores: list[np.ndarray] = []
+        for start, end in ranges:
+            for block in range(start, end, SCAN_ROWS):
+                stop = min(end, block + SCAN_ROWS)
+                s = self.vectors[block:stop].astype(np.float32) @ query
+                keep = _top(s, top_k)
+                rows.append(keep + block)
+                scores.append(s[keep])
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        all_rows, all_scores = np.concatenate(rows), np.concatenate(scores)
+        return all_rows[_top(all_scores, top_k)]
+
+    def chunks(self, rows: np.ndarray) -> list[CodeChunk]:
+        found: list[CodeChunk] = []
+        with open(self.path / "chunks.jsonl", "rb") as f:
+            for row in rows:
+                f.seek(int(self.offsets[row]))
+                file_path, content, start, end, symbol, parent = json.loads(f.readline())
+                found.append(
+                    CodeChunk(
+                        file_path=file_path,
+                        content=content,
+                        line_start=start,
+                        line_end=end,
+                        symbol=symbol,
+                        parent=parent,
+                    )
+                )
+        return found
+
+
+def _current(project_dir: Path) -> str:
+    try:
+        return (project_dir / "CURRENT").read_text().strip()
+    except OSError:
+        return ""
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def _top(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the `k` highest scores, best first."""
+    if len(scores) > k:
+        part = np.argpartition(-scores, k)[:k]
+    else:
+        part = np.arange(len(scores))
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def _kmeans(matrix: np.ndarray, nlist: int) -> tuple[np.ndarray, np.ndarray]:
+    """Spherical k-means trained on a sample; returns centroids and every row's list."""
+    rng = np.random.default_rng(0)
+    sample_size = min(len(matrix), nlist * KMEANS_SAMPLE_PER_LIST)
+    sample = matrix[rng.choice(len(matrix), sample_size, replace=False)]
+    centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+    for _ in range(KMEANS_ITERATIONS):
+        labels = np.argmax(sample @ centroids.T, axis=1)
+        order = np.argsort(labels, kind="stable")
+        present, starts = np.unique(labels[order], return_index=True)
+        # Normalizing the sum gives the mean's direction; empty lists keep their centroid.
+        centroids[present] = _normalize(np.add.reduceat(sample[order], starts, axis=0))
+    assignment = np.concatenate(
+        [
+            np.argmax(matrix[i : i + SCAN_ROWS] @ centroids.T, axis=1)
+            for i in range(0, len(matrix), SCAN_ROWS)
+        ]
+    )
+    return centroids, assignment
@@ -0,0 +1,127 @@
+"""Second-stage rerankers that trim fused candidates before answering."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from neuralscope.core.logging import get_logger
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
+)
+
+logger = get_logger("reranker")
+
+DEFAULT_CROSS_ENCODER = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+# Rerankers judge relevance from the head of a chunk; full bodies only add cost.
+SNIPPET_CHARS = 1200
+
+SYSTEM_PROMPT = """\
+You rank code snippets by how useful they are for answering a question about a codebase.
+
+Return ONLY a JSON array of snippet numbers, most relevant first, omitting irrelevant ones.
+Example: [3, 0, 5]"""
+
+
+class Reranker(ABC):
+    @abstractmethod
+    async def rerank(self, question: str, chunks: list[CodeChunk], top_k: int) -> list[CodeChunk]:
+        """Return at most `top_k` of `chunks`, most relevant first."""
+        raise NotImplementedError
+
+
+class LlmReranker(Reranker):
+    """Listwise rerank with one call to a (preferably cheap) chat model."""
+
+    def __init__(self, llm: BaseChatModel) -> None:
+        self._llm = llm
+
+    async def rerank(self, question: str, chunks: list[CodeChunk], top_k: int) -> list[CodeChunk]:
+        if len(chunks) <= 1:
+            return chunks[:top_k]
+        listing = "\n\n".join(
+            f"[{i}] {c.file_path}:{c.line_start}-{c.line_end}\n{c.content[:SNIPPET_CHARS]}"
+            for i, c in enumerate(chunks)
+        )
+        response = await self._llm.ainvoke(
+            [
+                SystemMessage(content=SYSTEM_PROMPT),
+                HumanMessage(content=f"Question: {question}\n\nSnippets:\n{listing}"),
+            ]
+        )
+        order = self._parse(str(response.content), len(chunks))
+        if order is None:
+            logger.warning("Failed to parse rerank response, keeping fused order")
+            return chunks[:top_k]
+        return [chunks[i] for i in order[:top_k]]
+
+    @staticmethod
+    def _parse(raw: str, n: int) -> list[int] | None:
+        match = re.search(r"\[[\d,\s]*\]", raw)
+        if match is None:
+            return None
+        try:
+            data: list[Any] = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return None
+        seen: set[int] = set()
+        order: list[int] = []
+        for i in data:
+            if isinstance(i, int) and 0 <= i < n and i not in seen:
+                seen.add(i)
+                order.append(i)
+        return order
+
+
+class CrossEncoderReranker(Reranker):
+    """Local cross-encoder rerank. Requires the `sentence-transformers` package.
+
+    The model is loaded on the first `rerank`, off the event loop. If it cannot
+    be loaded (package missing, download failed, offline), a warning is logged
+    once and candidates keep their fused order.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_CROSS_ENCODER) -> None:
+        self._model_name = model_name
+        self._model: Any = None
+        self._unavailable = False
+        self._lock = asyncio.Lock()
+
+    async def rerank(self, question: str, chunks: list[CodeChunk], top_k: int) -> list[CodeChunk]:
+        if not chunks:
+            return []
+        model = await self._load()
+        if model is None:
+            return chunks[:top_k]
+        pairs = [(question, c.content[:SNIPPET_CHARS]) for c in chunks]
+        # Model inference is CPU-bound; keep the event loop responsive.
+        scores = await asyncio.to_thread(model.predict, pairs)
+        ranked = sorted(range(len(chunks)), key=lambda i: scores[i], reverse=True)
+        return [chunks[i] for i in ranked[:top_k]]
+
+    async def _load(self) -> Any:
+        async with self._lock:
+            if self._model is None and not self._unavailable:
+                try:
+                    self._model = await asyncio.to_thread(_cross_encoder, self._model_name)
+                except Exception as exc:
+                    self._unavailable = True
+                    logger.warning(
+                        "Cross-encoder %s unavailable, keeping fused order: %s",
+                        self._model_name,
+                        exc,
+                    )
+        return self._model
+
+
+def _cross_encoder(model_name: str) -> Any:
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(model_name)
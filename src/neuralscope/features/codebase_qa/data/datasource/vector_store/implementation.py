@@ -0,0 +1,160 @@
+"""Qdrant-backed vector store for code chunks."""
+
+from __future__ import annotations
+
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from neuralscope.core.embeddings.pipeline import EmbeddingPipeline
+from neuralscope.core.settings import QdrantMode, Settings
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
+)
+
+
+def create_qdrant_client(settings: Settings) -> AsyncQdrantClient:
+    if settings.qdrant_mode == QdrantMode.SERVER:
+        return AsyncQdrantClient(url=settings.qdrant_url)
+    return AsyncQdrantClient(location=":memory:")
+
+
+class ChunkVectorStore(ABC):
+    """Nearest-neighbour search over chunk embeddings produced by `pipeline`.
+
+    `index` receives the whole index with a `generation` hash of its contents;
+    a store that already holds that generation may skip the write. `reuse`
+    lets callers check for a generation before building the vectors at all.
+    """
+
+    def __init__(self, pipeline: EmbeddingPipeline) -> None:
+        self._pipeline = pipeline
+
+    @property
+    def embedding_id(self) -> str:
+        return self._pipeline.embedding_id
+
+    async def embed(self, chunks: list[CodeChunk]) -> np.ndarray:
+        return await self._pipeline.embed_documents([c.content for c in chunks])
+
+    @abstractmethod
+    async def index(
+        self,
+        project_path: str,
+        chunks: list[CodeChunk],
+        vectors: np.ndarray,
+        *,
+        generation: str,
+    ) -> None: ...
+
+    @abstractmethod
+    async def reuse(self, project_path: str, generation: str) -> bool:
+        """Serve `generation` if the store already holds it; returns whether it does."""
+
+    @abstractmethod
+    async def search(self, project_path: str, question: str, top_k: int) -> list[CodeChunk]: ...
+
+
+class QdrantChunkStore(ChunkVectorStore):
+    """Serves ANN search from Qdrant.
+
+    Each project's collection is named after the index contents, so a server
+    collection that already holds the current index is reused as is.
+    """
+
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        pipeline: EmbeddingPipeline,
+        *,
+        batch_size: int = 64,
+    ) -> None:
+        super().__init__(pipeline)
+        self._client = client
+        self._batch_size = max(1, batch_size)
+        self._collections: dict[str, str] = {}
+
+    async def index(
+        self,
+        project_path: str,
+        chunks: list[CodeChunk],
+        vectors: np.ndarray,
+        *,
+        generation: str,
+    ) -> None:
+        prefix = self._collection_prefix(project_path)
+        collection = f"{prefix}_{generation[:16]}"
+        self._collections[prefix] = collection
+
+        existing = {c.name for c in (await self._client.get_collections()).collections}
+        for stale in existing:
+            if stale.startswith(prefix) and stale != collection:
+                await self._client.delete_collection(stale)
+        if collection in existing or not chunks:
+            return
+
+        await self._client.create_collection(
+            collection,
+            vectors_config=VectorParams(size=vectors.shape[1], distance=Distance.COSINE),
+        )
+        for start in range(0, len(chunks), self._batch_size):
+            await self._client.upsert(
+                collection,
+                points=[
+                    PointStruct(id=start + i, vector=vector.tolist(), payload=_to_payload(chunk))
+                    for i, (chunk, vector) in enumerate(
+                        zip(
+                            chunks[start : start + self._batch_size],
+                            vectors[start : start + self._batch_size],
+                            strict=True,
+                        )
+                    )
+                ],
+            )
+
+    async def reuse(self, project_path: str, generation: str) -> bool:
+        prefix = self._collection_prefix(project_path)
+        collection = f"{prefix}_{generation[:16]}"
+        if not await self._client.collection_exists(collection):
+            return False
+        self._collections[prefix] = collection
+        return True
+
+    async def search(self, project_path: str, question: str, top_k: int) -> list[CodeChunk]:
+        collection = self._collections.get(self._collection_prefix(project_path))
+        if collection is None or not await self._client.collection_exists(collection):
+            return []
+        vector = await self._pipeline.embed_query(question)
+        response = await self._client.query_points(collection, query=vector.tolist(), limit=top_k)
+        return [_from_payload(p.payload or {}) for p in response.points]
+
+    @staticmethod
+    def _collection_prefix(project_path: str) -> str:
+        root = str(Path(project_path).resolve())
+        return f"neuralscope_chunks_{hashlib.sha256(root.encode()).hexdigest()[:16]}"
+
+
+def _to_payload(chunk: CodeChunk) -> dict[str, str | int | None]:
+    return {
+        "file_path": chunk.file_path,
+        "content": chunk.content,
+        "line_start": chunk.line_start,
+        "line_end": chunk.line_end,
+        "symbol": chunk.symbol,
+        "parent": chunk.parent,
+    }
+
+
+def _from_payload(payload: dict) -> CodeChunk:
+    return CodeChunk(
+        file_path=payload["file_path"],
+        content=payload["content"],
+        line_start=payload["line_start"],
+        line_end=payload["line_end"],
+        symbol=payload.get("symbol", ""),
+        parent=payload.get("parent"),
+    )
@@ -2,48 +2,209 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import numpy as np
+
+from neuralscope.core.logging import get_logger
+from neuralscope.features.codebase_qa.data.datasource.context_packer.implementation import (
+    ContextPacker,
+)
 from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
     FileIndexer,
 )
+from neuralscope.features.codebase_qa.data.datasource.index_store.implementation import (
+    IndexEntry,
+    QAIndexStore,
+)
+from neuralscope.features.codebase_qa.data.datasource.lexical_index.implementation import (
+    BM25Index,
+)
 from neuralscope.features.codebase_qa.data.datasource.llm_answerer.implementation import (
     LlmAnswerer,
 )
+from neuralscope.features.codebase_qa.data.datasource.reranker.implementation import Reranker
+from neuralscope.features.codebase_qa.data.datasource.vector_store.implementation import (
+    ChunkVectorStore,
+)
 from neuralscope.features.codebase_qa.domain.entities.answer import Answer
 from neuralscope.features.codebase_qa.domain.repository.qa import IQARepository
 
+logger = get_logger("qa_repository")
+
+
+# Standard RRF damping constant; keeps any single list from dominating the fusion.
+RRF_K = 60
+
 
 class QARepository(IQARepository):
-    """Simple keyword-search QA. For production, swap search with Qdrant vectors."""
+    """Answers questions from the `top_k` most relevant chunks.
 
-    def __init__(self, indexer: FileIndexer, answerer: LlmAnswerer) -> None:
+    BM25 lexical search (built at index time) and, with a `vector_store`,
+    nearest-neighbour search each return `candidates` chunks; the lists are
+    merged with reciprocal-rank fusion and, with a `reranker`, trimmed to the
+    best `top_k`. A failing embeddings provider leaves lexical results. The
+    `packer` then fits them into the prompt token budget, followed by the
+    header chunks of their enclosing class or function, which are only sent
+    if budget is left over. With an
+    `index_store`, chunks and vectors persist across processes and only files
+    whose content changed are re-chunked and re-embedded.
+    """
+
+    def __init__(
+        self,
+        indexer: FileIndexer,
+        answerer: LlmAnswerer,
+        *,
+        vector_store: ChunkVectorStore | None = None,
+        index_store: QAIndexStore | None = None,
+        reranker: Reranker | None = None,
+        packer: ContextPacker | None = None,
+        top_k: int = 5,
+        candidates: int = 20,
+    ) -> None:
         self._indexer = indexer
         self._answerer = answerer
-        self._chunks: dict[str, list] = {}
+        self._vector_store = vector_store
+        self._index_store = index_store
+        self._reranker = reranker
+        self._packer = packer or ContextPacker()
+        self._top_k = top_k
+        self._candidates = max(candidates, top_k)
+        self._chunks: dict[str, list[CodeChunk]] = {}
+        self._lexical: dict[str, BM25Index] = {}
+        self._headers: dict[str, dict[tuple[str, str], CodeChunk]] = {}
+        self._vector_indexed: set[str] = set()
 
     async def index_project(self, project_path: str) -> int:
-        chunks = self._indexer.index(project_path)
+        root = str(Path(project_path).resolve())
+        embedding_id = self._vector_store.embedding_id if self._vector_store else None
+        previous = self._index_store.load(root, embedding_id) if self._index_store else {}
+
+        files = self._indexer.index_files(
+            project_path, known={path: e.digest for path, e in previous.items()}
+        )
+        entries: dict[str, IndexEntry] = {}
+        for f in files:
+            if f.chunks is None:
+                entries[f.file_path] = previous[f.file_path]
+            else:
+                entries[f.file_path] = IndexEntry(digest=f.digest, chunks=f.chunks)
+        changed = len(entries) != len(previous) or any(f.chunks is not None for f in files)
+
+        chunks = [c for e in entries.values() for c in e.chunks]
         self._chunks[project_path] = chunks
+        self._lexical[project_path] = BM25Index(chunks)
+        self._headers[project_path] = _scope_headers(chunks)
+        self._vector_indexed.discard(project_path)
+
+        if self._vector_store is not None and chunks:
+            # Derived from the manifest digests alone, so an unchanged index is
+            # recognised without reading a single stored vector.
+            generation = hashlib.sha256(
+                "\0".join(
+                    [embedding_id or "", *(f"{path}:{e.digest}" for path, e in entries.items())]
+                ).encode()
+            ).hexdigest()
+            try:
+                if not await self._vector_store.reuse(project_path, generation):
+                    changed = await _embed_missing(self._vector_store, entries) or changed
+                    vectors = np.concatenate([e.vectors for e in entries.values() if e.chunks])
+                    await self._vector_store.index(
+                        project_path, chunks, vectors, generation=generation
+                    )
+                self._vector_indexed.add(project_path)
+            except Exception as exc:
+                logger.warning("Vector indexing failed, using lexical search: %s", exc)
+
+        if self._index_store is not None and changed:
+            self._index_store.save(root, embedding_id, entries)
         return len(chunks)
 
     async def ask(self, question: str, project_path: str) -> Answer:
+        context = await self._context(question, project_path)
+        return await self._answerer.answer(question, context)
+
+    async def ask_stream(self, question: str, project_path: str) -> AsyncIterator[str | Answer]:
+        context = await self._context(question, project_path)
+        async for event in self._answerer.answer_stream(question, context):
+            yield event
+
+    async def _context(self, question: str, project_path: str) -> list[str]:
         if project_path not in self._chunks:
             await self.index_project(project_path)
+        top = await self._search(question, project_path)
+        return self._packer.pack(question, top + self._parents(project_path, top)).blocks
 
-        chunks = self._chunks.get(project_path, [])
-        q_lower = question.lower()
-
-        scored = []
+    def _parents(self, project_path: str, chunks: list[CodeChunk]) -> list[CodeChunk]:
+        headers = self._headers[project_path]
+        seen = {(c.file_path, c.line_start) for c in chunks}
+        parents: list[CodeChunk] = []
         for chunk in chunks:
-            score = sum(1 for word in q_lower.split() if word in chunk.content.lower())
-            if score > 0:
-                scored.append((score, chunk))
+            header = headers.get((chunk.file_path, chunk.parent)) if chunk.parent else None
+            if header is not None and (header.file_path, header.line_start) not in seen:
+                seen.add((header.file_path, header.line_start))
+                parents.append(header)
+        return parents
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        top = scored[:5]
+    async def _search(self, question: str, project_path: str) -> list[CodeChunk]:
+        rankings: list[list[CodeChunk]] = []
+        if self._vector_store is not None and project_path in self._vector_indexed:
+            try:
+                rankings.append(
+                    await self._vector_store.search(project_path, question, self._candidates)
+                )
+            except Exception as exc:
+                logger.warning("Vector search failed, using lexical search: %s", exc)
+        lexical = self._lexical[project_path].search(question, self._candidates)
+        rankings.append([chunk for chunk, _ in lexical])
 
-        if not top:
-            top = [(0, c) for c in chunks[:5]]
+        fused = reciprocal_rank_fusion(rankings)[: self._candidates]
+        if not fused:
+            return self._chunks[project_path][: self._top_k]
+        if self._reranker is not None and len(fused) > 1:
+            try:
+                reranked = await self._reranker.rerank(question, fused, self._top_k)
+            except Exception as exc:
+                logger.warning("Rerank failed, keeping fused order: %s", exc)
+            else:
+                if reranked:
+                    return reranked
+        return fused[: self._top_k]
 
-        context = [f"# {c.file_path}:{c.line_start}-{c.line_end}\n{c.content}" for _, c in top]
 
-        return await self._answerer.answer(question, context)
+def reciprocal_rank_fusion(rankings: list[list[CodeChunk]], *, k: int = RRF_K) -> list[CodeChunk]:
+    """Merge ranked lists by summing 1 / (k + rank); ties keep first-seen order."""
+    scores: dict[tuple[str, int, int], float] = {}
+    chunks: dict[tuple[str, int, int], CodeChunk] = {}
+    for ranking in rankings:
+        for rank, chunk in enumerate(ranking, start=1):
+            key = (chunk.file_path, chunk.line_start, chunk.line_end)
+            chunks.setdefault(key, chunk)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return [chunks[key] for key in sorted(scores, key=scores.__getitem__, reverse=True)]
+
+
+def _scope_headers(chunks: list[CodeChunk]) -> dict[tuple[str, str], CodeChunk]:
+    """Map (file, symbol) to the first chunk of that scope, which holds its signature."""
+    headers: dict[tuple[str, str], CodeChunk] = {}
+    for chunk in chunks:
+        if chunk.symbol:
+            headers.setdefault((chunk.file_path, chunk.symbol), chunk)
+    return headers
+
+
+async def _embed_missing(store: ChunkVectorStore, entries: dict[str, IndexEntry]) -> bool:
+    """Embed chunks of entries that have no vectors yet; returns whether any were embedded."""
+    missing = [e for e in entries.values() if e.vectors is None and e.chunks]
+    if not missing:
+        return False
+    vectors = await store.embed([c for e in missing for c in e.chunks])
+    row = 0
+    for entry in missing:
+        entry.vectors = vectors[row : row + len(entry.chunks)]
+        row += len(entry.chunks)
+    return True
@@ -19,6 +19,7 @@ class Answer:
     answer: str
     sources: list[SourceReference] = field(default_factory=list)
     confidence: float = 0.0
+    prompt_tokens: int = 0
 
     @property
     def source_count(self) -> int:
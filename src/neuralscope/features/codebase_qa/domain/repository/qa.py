@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from neuralscope.features.codebase_qa.domain.entities.answer import Answer
 
@@ -16,3 +17,8 @@ class IQARepository(ABC):
     @abstractmethod
     async def ask(self, question: str, project_path: str) -> Answer:
         raise NotImplementedError
+
+    @abstractmethod
+    def ask_stream(self, question: str, project_path: str) -> AsyncIterator[str | Answer]:
+        """Yield answer text as it is generated, then the final `Answer`."""
+        raise NotImplementedError
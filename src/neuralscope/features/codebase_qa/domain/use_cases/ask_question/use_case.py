@@ -57,5 +57,6 @@ class AskQuestionUseCase:
             result="success",
             sources=answer.source_count,
             confidence=answer.confidence,
+            prompt_tokens=answer.prompt_tokens,
         )
         return AskQuestionSuccess(answer=answer)
@@ -0,0 +1,60 @@
+"""Stream answer use case: same contract as ask_question, delivered incrementally."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from neuralscope.core.log_context import ILogContextRepository
+from neuralscope.features.codebase_qa.domain.entities.answer import Answer
+from neuralscope.features.codebase_qa.domain.repository.qa import IQARepository
+from neuralscope.features.codebase_qa.domain.use_cases.ask_question.use_case import (
+    AskQuestionError,
+    AskQuestionParams,
+    AskQuestionSuccess,
+)
+
+
+class StreamAnswerUseCase:
+    def __init__(
+        self,
+        qa_repo: IQARepository,
+        log_context_repository: ILogContextRepository,
+    ) -> None:
+        self._qa = qa_repo
+        self._log_context = log_context_repository
+
+    async def __call__(
+        self, params: AskQuestionParams
+    ) -> AsyncIterator[str | AskQuestionSuccess | AskQuestionError]:
+        """Yield answer text deltas, then exactly one success or error result."""
+        self._log_context.emit_input(question=params.question, project=params.project)
+
+        if not params.question.strip():
+            self._log_context.emit_result(result="error", reason="empty_question")
+            yield AskQuestionError("Question cannot be empty")
+            return
+
+        answer: Answer | None = None
+        try:
+            async for event in self._qa.ask_stream(params.question, params.project):
+                if isinstance(event, Answer):
+                    answer = event
+                else:
+                    yield event
+        except Exception as exc:
+            self._log_context.emit_result(result="error", reason=str(exc))
+            yield AskQuestionError(f"Q&A failed: {exc}")
+            return
+
+        if answer is None:
+            self._log_context.emit_result(result="error", reason="no_answer")
+            yield AskQuestionError("Q&A failed: stream ended without an answer")
+            return
+
+        self._log_context.emit_result(
+            result="success",
+            sources=answer.source_count,
+            confidence=answer.confidence,
+            prompt_tokens=answer.prompt_tokens,
+        )
+        yield AskQuestionSuccess(answer=answer)
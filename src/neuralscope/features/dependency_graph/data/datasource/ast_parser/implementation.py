@@ -9,9 +9,19 @@ Walks a project tree, parses each .py file with `ast`, and extracts:
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
+from typing import cast
 
 from neuralscope.core.logging import get_logger
+from neuralscope.core.project import ProjectFile, ProjectSnapshot
+from neuralscope.features.dependency_graph.data.datasource.parse_cache.implementation import (
+    AstParseCache,
+    ParseCacheEntry,
+)
 from neuralscope.features.dependency_graph.domain.entities.graph import (
     GraphEdge,
     GraphNode,
@@ -21,104 +31,196 @@ from neuralscope.features.dependency_graph.domain.entities.graph import (
 logger = get_logger("ast_parser")
 
 
-class AstParser:
-    """Parses a Python project into nodes and edges using the `ast` module."""
+# Compact, cheap-to-pickle records exchanged with worker processes.
+NodeRecord = tuple[str, str, str, str, int, str | None]
+EdgeRecord = tuple[str, str, str]
+# (nodes, edges, warning, content digest); digest is None when the file is unreadable.
+ParsedFile = tuple[list[NodeRecord], list[EdgeRecord], str | None, str | None]
+
 
-    def __init__(self, root: Path) -> None:
+class AstParser:
+    """Parses a Python project into nodes and edges using the `ast` module.
+
+    With `workers > 1` files are parsed in a process pool; `workers=0` uses every
+    CPU. Results are merged in file order, so output matches the serial parser.
+    With a `cache`, files whose mtime and size (or content hash) are unchanged
+    reuse their stored records instead of being parsed again. Files are read
+    through `snapshot`, so sources and ASTs are shared with other features.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        workers: int = 1,
+        cache: AstParseCache | None = None,
+        snapshot: ProjectSnapshot | None = None,
+    ) -> None:
         self._root = root.resolve()
+        self._workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self._cache = cache
+        self._snapshot = snapshot or ProjectSnapshot(self._root)
 
     def parse(self) -> tuple[list[GraphNode], list[GraphEdge]]:
+        py_files = self._snapshot.files
+        root = str(self._root)
+
+        cached = self._cache.load(root) if self._cache else {}
+        entries: dict[str, ParseCacheEntry] = {}
+        parsed: list[ParsedFile | None] = [None] * len(py_files)
+        stale: list[int] = []
+        dirty = False
+        for index, f in enumerate(py_files):
+            entry = self._revalidate(f, cached[f.rel]) if f.rel in cached else None
+            if entry is not None:
+                entries[f.rel] = entry
+                parsed[index] = entry.parsed
+                dirty = dirty or entry is not cached[f.rel]
+            else:
+                stale.append(index)
+
+        for index, result in zip(
+            stale, self._parse_files([py_files[i] for i in stale]), strict=True
+        ):
+            parsed[index] = result
+            f, digest = py_files[index], result[3]
+            if digest is not None:
+                entries[f.rel] = ParseCacheEntry(f.mtime_ns, f.size, digest, result)
+
+        if self._cache is not None and (dirty or stale or len(entries) != len(cached)):
+            self._cache.save(root, entries)
+
         nodes: list[GraphNode] = []
         edges: list[GraphEdge] = []
-
-        py_files = sorted(self._root.rglob("*.py"))
-        for file_path in py_files:
-            if self._should_skip(file_path):
-                continue
-            file_nodes, file_edges = self._parse_file(file_path)
-            nodes.extend(file_nodes)
-            edges.extend(file_edges)
+        for node_records, edge_records, warning, _ in cast(list[ParsedFile], parsed):
+            if warning:
+                logger.warning("%s", warning)
+            nodes.extend(
+                GraphNode(
+                    id=node_id,
+                    name=name,
+                    kind=NodeKind(kind),
+                    file_path=file_path,
+                    line=line,
+                    docstring=docstring,
+                )
+                for node_id, name, kind, file_path, line, docstring in node_records
+            )
+            edges.extend(
+                GraphEdge(source=source, target=target, relation=relation)
+                for source, target, relation in edge_records
+            )
 
         return nodes, edges
 
-    def _parse_file(self, file_path: Path) -> tuple[list[GraphNode], list[GraphEdge]]:
+    def _parse_files(self, files: list[ProjectFile]) -> list[ParsedFile]:
+        results: list[ParsedFile | None] = [None] * len(files)
+        readable: list[tuple[int, str]] = []
+        for index, f in enumerate(files):
+            try:
+                readable.append((index, self._snapshot.read(f)))
+            except (OSError, UnicodeDecodeError) as exc:
+                results[index] = ([], [], f"Skipping {f.rel}: {exc}", None)
+
+        if self._workers > 1 and len(readable) > 1:
+            # Workers re-parse from source: AST objects are too costly to pickle back.
+            rels = [files[i].rel for i, _ in readable]
+            sources = [source for _, source in readable]
+            chunksize = max(1, len(readable) // (self._workers * 4))
+            with ProcessPoolExecutor(max_workers=self._workers) as pool:
+                records = list(pool.map(parse_file_records, rels, sources, chunksize=chunksize))
+        else:
+            records = [
+                parse_file_records(files[i].rel, source, self._tree(files[i]))
+                for i, source in readable
+            ]
+        for (index, _), result in zip(readable, records, strict=True):
+            results[index] = result
+        return cast(list[ParsedFile], results)
+
+    def _tree(self, file: ProjectFile) -> ast.Module | None:
+        try:
+            return self._snapshot.parse(file)
+        except SyntaxError:
+            return None  # parse_file_records reports it
+
+    def _revalidate(self, file: ProjectFile, entry: ParseCacheEntry) -> ParseCacheEntry | None:
+        if file.size != entry.size:
+            return None
+        if file.mtime_ns == entry.mtime_ns:
+            return entry
+        # Touched but possibly identical (e.g. after a branch switch): compare content.
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
-        except (SyntaxError, UnicodeDecodeError) as exc:
-            logger.warning("Skipping %s: %s", file_path, exc)
-            return [], []
-
-        rel = file_path.relative_to(self._root)
-        module_id = self._path_to_module_id(rel)
-
-        nodes: list[GraphNode] = [
-            GraphNode(
-                id=module_id,
-                name=rel.stem,
-                kind=NodeKind.MODULE,
-                file_path=str(rel),
-                line=1,
-                docstring=ast.get_docstring(tree),
+            source = self._snapshot.read(file)
+        except (OSError, UnicodeDecodeError):
+            return None
+        if source_digest(source) != entry.digest:
+            return None
+        return replace(entry, mtime_ns=file.mtime_ns)
+
+
+def parse_file_records(rel: str, source: str, tree: ast.Module | None = None) -> ParsedFile:
+    """Parse one file into node and edge records. Top-level so worker processes can pickle it."""
+    digest = source_digest(source)
+    if tree is None:
+        try:
+            tree = ast.parse(source, filename=rel)
+        except SyntaxError as exc:
+            return [], [], f"Skipping {rel}: {exc}", digest
+
+    rel_path = Path(rel)
+    module_id = _path_to_module_id(rel_path)
+
+    nodes: list[NodeRecord] = [
+        (module_id, rel_path.stem, NodeKind.MODULE.value, rel, 1, ast.get_docstring(tree))
+    ]
+    edges: list[EdgeRecord] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            nodes.append(
+                (
+                    f"{module_id}.{node.name}",
+                    node.name,
+                    NodeKind.CLASS.value,
+                    rel,
+                    node.lineno,
+                    ast.get_docstring(node),
+                )
             )
-        ]
 
-        edges: list[GraphEdge] = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_id = f"{module_id}.{node.name}"
-                nodes.append(
-                    GraphNode(
-                        id=class_id,
-                        name=node.name,
-                        kind=NodeKind.CLASS,
-                        file_path=str(rel),
-                        line=node.lineno,
-                        docstring=ast.get_docstring(node),
-                    )
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            nodes.append(
+                (
+                    f"{module_id}.{node.name}",
+                    node.name,
+                    NodeKind.FUNCTION.value,
+                    rel,
+                    node.lineno,
+                    ast.get_docstring(node),
                 )
+            )
 
-            elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                func_id = f"{module_id}.{node.name}"
-                nodes.append(
-                    GraphNode(
-                        id=func_id,
-                        name=node.name,
-                        kind=NodeKind.FUNCTION,
-                        file_path=str(rel),
-                        line=node.lineno,
-                        docstring=ast.get_docstring(node),
-                    )
-                )
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                edges.append((module_id, alias.name, "imports"))
 
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    edges.append(GraphEdge(source=module_id, target=alias.name, relation="imports"))
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                edges.append((module_id, node.module, "imports"))
 
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    edges.append(
-                        GraphEdge(
-                            source=module_id,
-                            target=node.module,
-                            relation="imports",
-                        )
-                    )
+    return nodes, edges, None, digest
 
-        return nodes, edges
 
-    def _should_skip(self, file_path: Path) -> bool:
-        parts = file_path.relative_to(self._root).parts
-        skip_dirs = {".venv", "venv", "__pycache__", ".git", "node_modules", ".tox", ".nox"}
-        return bool(skip_dirs & set(parts))
-
-    @staticmethod
-    def _path_to_module_id(rel_path: Path) -> str:
-        """Convert relative path to dotted module id: src/foo/bar.py → src.foo.bar"""
-        parts = list(rel_path.parts)
-        if parts[-1] == "__init__.py":
-            parts = parts[:-1]
-        else:
-            parts[-1] = parts[-1].removesuffix(".py")
-        return ".".join(parts)
+def source_digest(source: str) -> str:
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _path_to_module_id(rel_path: Path) -> str:
+    """Convert relative path to dotted module id: src/foo/bar.py → src.foo.bar"""
+    parts = list(rel_path.parts)
+    if parts[-1] == "__init__.py":
+        parts = parts[:-1]
+    else:
+        parts[-1] = parts[-1].removesuffix(".py")
+    return ".".join(parts)
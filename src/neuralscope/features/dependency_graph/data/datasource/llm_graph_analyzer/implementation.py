@@ -65,8 +65,6 @@ NODE_KIND_MAP = {
     "package": NodeKind.PACKAGE,
 }
 
-SKIP_DIRS = {".venv", "venv", "__pycache__", ".git", "node_modules", ".tox"}
-
 
 class LlmGraphAnalyzer:
     def __init__(self, llm: BaseChatModel) -> None:
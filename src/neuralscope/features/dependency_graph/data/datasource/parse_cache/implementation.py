@@ -0,0 +1,94 @@
+"""On-disk cache of per-file AST parse records.
+
+One JSON file per project root maps each relative path to its mtime, size,
+content hash and extracted node/edge records, so warm graph builds only
+re-parse files that actually changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from neuralscope.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from neuralscope.features.dependency_graph.data.datasource.ast_parser.implementation import (
+        ParsedFile,
+    )
+
+logger = get_logger("ast_parse_cache")
+
+# Bump when the record layout or extraction rules change.
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ParseCacheEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    parsed: ParsedFile
+
+
+class AstParseCache:
+    def __init__(self, directory: Path) -> None:
+        self._dir = directory
+
+    def load(self, root: str) -> dict[str, ParseCacheEntry]:
+        path = self._path(root)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable parse cache %s: %s", path, exc)
+            return {}
+        if not isinstance(data, dict):
+            logger.warning("Ignoring unreadable parse cache %s: not a JSON object", path)
+            return {}
+        if data.get("version") != CACHE_VERSION or data.get("root") != root:
+            return {}
+        # The cache is disposable: any bad shape means rebuilding it, never failing the build.
+        try:
+            files = data["files"]
+            if not isinstance(files, dict):
+                raise TypeError("'files' is not an object")
+            return {rel: _entry_from_json(raw) for rel, raw in files.items()}
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring unreadable parse cache %s: %s", path, exc)
+            return {}
+
+    def save(self, root: str, entries: dict[str, ParseCacheEntry]) -> None:
+        path = self._path(root)
+        payload = {
+            "version": CACHE_VERSION,
+            "root": root,
+            "files": {rel: _entry_to_json(e) for rel, e in entries.items()},
+        }
+        self._dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _path(self, root: str) -> Path:
+        return self._dir / f"{hashlib.sha256(root.encode()).hexdigest()[:16]}.json"
+
+
+def _entry_to_json(entry: ParseCacheEntry) -> list[Any]:
+    nodes, edges, warning, _ = entry.parsed
+    return [entry.mtime_ns, entry.size, entry.digest, nodes, edges, warning]
+
+
+def _entry_from_json(raw: list[Any]) -> ParseCacheEntry:
+    mtime_ns, size, digest, nodes, edges, warning = raw
+    return ParseCacheEntry(
+        mtime_ns=mtime_ns,
+        size=size,
+        digest=digest,
+        parsed=([tuple(n) for n in nodes], [tuple(e) for e in edges], warning, digest),
+    )
@@ -42,12 +42,18 @@ class ImpactAnalyzerRepository(IImpactAnalyzerRepository):
         affected: list[AffectedNode] = []
         visited: set[str] = set()
 
-        def walk(node_id: str, distance: int) -> None:
-            if node_id in visited:
-                return
-            visited.add(node_id)
-            dependents = graph.get_dependents(node_id)
-            for dep_id in dependents:
+        # Iterative depth-first walk: deep import chains would overflow the recursion limit.
+        for module_id in changed_modules:
+            if module_id in visited:
+                continue
+            visited.add(module_id)
+            stack = [(iter(graph.get_dependents(module_id)), 1)]
+            while stack:
+                dependents, distance = stack[-1]
+                dep_id = next(dependents, None)
+                if dep_id is None:
+                    stack.pop()
+                    continue
                 if dep_id in changed_modules or dep_id in visited:
                     continue
                 node = graph.get_node(dep_id)
@@ -61,10 +67,8 @@ class ImpactAnalyzerRepository(IImpactAnalyzerRepository):
                             risk=RiskLevel.HIGH if distance <= 1 else RiskLevel.MEDIUM,
                         )
                     )
-                walk(dep_id, distance + 1)
-
-        for module_id in changed_modules:
-            walk(module_id, 1)
+                visited.add(dep_id)
+                stack.append((iter(graph.get_dependents(dep_id)), distance + 1))
 
         return affected
 
@@ -32,9 +32,27 @@ class GraphEdge:
 
 @dataclass
 class DependencyGraph:
+    """Nodes and edges with lazily built lookup indexes.
+
+    Indexes are rebuilt whenever `nodes` or `edges` is replaced or changes length.
+    In-place item replacement is not detected; call `invalidate()` after it.
+    """
+
     root_path: str
     nodes: list[GraphNode] = field(default_factory=list)
     edges: list[GraphEdge] = field(default_factory=list)
+    _index_key: tuple[int, int, int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _by_id: dict[str, GraphNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _forward: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _reverse: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def node_count(self) -> int:
@@ -44,11 +62,43 @@ class DependencyGraph:
     def edge_count(self) -> int:
         return len(self.edges)
 
+    def add_node(self, node: GraphNode) -> None:
+        self.nodes.append(node)
+        self.invalidate()
+
+    def add_edge(self, edge: GraphEdge) -> None:
+        self.edges.append(edge)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._index_key = None
+
     def get_node(self, node_id: str) -> GraphNode | None:
-        return next((n for n in self.nodes if n.id == node_id), None)
+        self._ensure_index()
+        return self._by_id.get(node_id)
 
     def get_dependents(self, node_id: str) -> list[str]:
-        return [e.source for e in self.edges if e.target == node_id]
+        self._ensure_index()
+        return list(self._reverse.get(node_id, ()))
 
     def get_dependencies(self, node_id: str) -> list[str]:
-        return [e.target for e in self.edges if e.source == node_id]
+        self._ensure_index()
+        return list(self._forward.get(node_id, ()))
+
+    def _ensure_index(self) -> None:
+        key = (id(self.nodes), len(self.nodes), id(self.edges), len(self.edges))
+        if self._index_key == key:
+            return
+
+        by_id: dict[str, GraphNode] = {}
+        for node in self.nodes:
+            by_id.setdefault(node.id, node)
+
+        forward: dict[str, list[str]] = {}
+        reverse: dict[str, list[str]] = {}
+        for edge in self.edges:
+            forward.setdefault(edge.source, []).append(edge.target)
+            reverse.setdefault(edge.target, []).append(edge.source)
+
+        self._by_id, self._forward, self._reverse = by_id, forward, reverse
+        self._index_key = key
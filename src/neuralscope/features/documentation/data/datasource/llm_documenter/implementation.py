@@ -65,7 +65,8 @@ class LlmDocumenterDatasource:
             [
                 SystemMessage(content=SYSTEM_PROMPT),
                 HumanMessage(content=prompt),
-            ]
+            ],
+            config={"metadata": {"file": file_path}},
         )
         return self._parse(file_path, str(response.content))
 
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 from neuralscope.core.logging import get_logger
+from neuralscope.core.project import SnapshotRegistry
 from neuralscope.features.health_dashboard.domain.entities.health import (
     ComplexityMetric,
     HealthReport,
@@ -16,10 +15,12 @@ logger = get_logger("complexity_analyzer")
 class ComplexityAnalyzer:
     """Analyzes Python project complexity using file metrics."""
 
+    def __init__(self, snapshots: SnapshotRegistry | None = None) -> None:
+        self._snapshots = snapshots or SnapshotRegistry()
+
     async def analyze(self, project_path: str) -> HealthReport:
-        root = Path(project_path)
-        py_files = list(root.rglob("*.py"))
-        py_files = [f for f in py_files if not self._should_skip(f, root)]
+        snapshot = self._snapshots.get(project_path)
+        py_files = snapshot.files
 
         total_lines = 0
         complexities: list[int] = []
@@ -27,14 +28,14 @@ class ComplexityAnalyzer:
 
         for f in py_files:
             try:
-                lines = f.read_text(encoding="utf-8").splitlines()
+                lines = snapshot.read(f).splitlines()
                 total_lines += len(lines)
                 cc = self._estimate_complexity(lines)
                 complexities.append(cc)
                 if cc > 5:
                     hotspots.append(
                         ComplexityMetric(
-                            file_path=str(f.relative_to(root)),
+                            file_path=f.rel,
                             function_name="(module)",
                             complexity=cc,
                             rank="C" if cc > 10 else "B",
@@ -66,9 +67,3 @@ class ComplexityAnalyzer:
             if first_word in branch_keywords:
                 count += 1
         return count
-
-    @staticmethod
-    def _should_skip(file_path: Path, root: Path) -> bool:
-        parts = file_path.relative_to(root).parts
-        skip = {".venv", "venv", "__pycache__", ".git", "node_modules"}
-        return bool(skip & set(parts))
@@ -42,7 +42,8 @@ class LlmTestWriterDatasource:
             [
                 SystemMessage(content=SYSTEM_PROMPT),
                 HumanMessage(content=prompt),
-            ]
+            ],
+            config={"metadata": {"file": file_path}},
         )
         return self._parse(file_path, str(response.content))
 
@@ -0,0 +1,79 @@
+"""Persistent per-file findings store for incremental scans.
+
+Entries are keyed by SHA-256 of the file content, the scanner prompt version
+and the model, so an unchanged file is never re-sent to the LLM. Unlike the
+generic LLM cache, entries do not expire: a content hash can never go stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from neuralscope.core.cache import CacheLimits, open_cache
+from neuralscope.features.vulnerability_scan.domain.entities.vulnerability import (
+    Vulnerability,
+    VulnSeverity,
+    VulnSource,
+)
+
+
+class ScanFindingsStore:
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        model: str,
+        prompt_version: str,
+        limits: CacheLimits | None = None,
+    ) -> None:
+        self._cache = open_cache(directory, limits)
+        self._namespace = f"{prompt_version}\0{model}\0"
+
+    def key(self, source: str) -> str:
+        return hashlib.sha256((self._namespace + source).encode()).hexdigest()
+
+    def get(self, file_path: str, source: str) -> list[Vulnerability] | None:
+        raw = self._cache.get(self.key(source))
+        if raw is None:
+            return None
+        return [_from_dict(d, file_path) for d in json.loads(raw)]
+
+    def put(self, source: str, vulns: list[Vulnerability]) -> None:
+        self._cache.set(self.key(source), json.dumps([_to_dict(v) for v in vulns]))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def _to_dict(vuln: Vulnerability) -> dict[str, Any]:
+    return {
+        "id": vuln.id,
+        "title": vuln.title,
+        "severity": vuln.severity.value,
+        "source": vuln.source.value,
+        "line": vuln.line,
+        "description": vuln.description,
+        "recommendation": vuln.recommendation,
+        "cwe": vuln.cwe,
+    }
+
+
+def _from_dict(data: dict[str, Any], file_path: str) -> Vulnerability:
+    # Paths are not stored: the same content may live elsewhere on the next scan.
+    return Vulnerability(
+        id=data["id"],
+        title=data["title"],
+        severity=VulnSeverity(data["severity"]),
+        source=VulnSource(data["source"]),
+        file_path=file_path,
+        line=data["line"],
+        description=data["description"],
+        recommendation=data["recommendation"],
+        cwe=data["cwe"],
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from typing import Any
@@ -9,6 +10,7 @@ from typing import Any
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from neuralscope.core.llm.tokens import estimate_tokens
 from neuralscope.core.logging import get_logger
 from neuralscope.features.vulnerability_scan.domain.entities.vulnerability import (
     Vulnerability,
@@ -45,6 +47,55 @@ Focus on real security issues:
 
 Do NOT flag style or convention issues. Return ONLY the JSON object."""
 
+BATCH_SYSTEM_PROMPT = """\
+You are an expert security auditor. Analyze each of the provided Python source files \
+for vulnerabilities. Files are separated by "### File: <path>" headers.
+
+Return a JSON object with one entry per file, using the exact path from its header:
+{
+  "files": [
+    {
+      "file_path": "<path from header>",
+      "vulnerabilities": [
+        {
+          "id": "<CWE-ID or custom ID like SEC-001>",
+          "title": "<short title>",
+          "severity": "low|medium|high|critical",
+          "line": <int, relative to that file>,
+          "description": "<what's dangerous and why>",
+          "recommendation": "<how to fix>",
+          "cwe": "<CWE number if applicable>"
+        }
+      ]
+    }
+  ]
+}
+
+Focus on real security issues:
+- SQL injection, XSS, command injection
+- Hardcoded secrets, weak crypto
+- Path traversal, insecure deserialization
+- Unsafe eval/exec, unvalidated input
+- SSRF, open redirects, auth bypass
+
+Do NOT flag style or convention issues. Return ONLY the JSON object."""
+
+# Bump whenever _parse or _parse_batch changes what a reply turns into.
+PARSER_VERSION = 1
+
+
+def _prompt_version(*prompts: str) -> str:
+    """Version stored findings by the parser and a digest of the prompts that produced them."""
+    digest = hashlib.sha256("\0".join(prompts).encode()).hexdigest()[:12]
+    return f"{PARSER_VERSION}-{digest}"
+
+
+# Editing either prompt changes this, which invalidates stored findings.
+PROMPT_VERSION = _prompt_version(SYSTEM_PROMPT, BATCH_SYSTEM_PROMPT)
+
+# Keeps batched responses small enough to come back as complete JSON.
+MAX_BATCH_FILES = 20
+
 SEVERITY_MAP = {
     "low": VulnSeverity.LOW,
     "medium": VulnSeverity.MEDIUM,
@@ -57,26 +108,103 @@ class LlmSecurityScanner:
     def __init__(self, llm: BaseChatModel) -> None:
         self._llm = llm
 
-    async def scan_source(self, file_path: str, source: str) -> list[Vulnerability]:
+    async def scan_source(self, file_path: str, source: str) -> list[Vulnerability] | None:
+        """Vulnerabilities found in `source`; None when the reply could not be parsed."""
         prompt = f"File: {file_path}\n\n```python\n{source}\n```"
         response = await self._llm.ainvoke(
             [
                 SystemMessage(content=SYSTEM_PROMPT),
                 HumanMessage(content=prompt),
-            ]
+            ],
+            config={"metadata": {"file": file_path}},
         )
         return self._parse(file_path, str(response.content))
 
-    def _parse(self, file_path: str, raw: str) -> list[Vulnerability]:
+    async def scan_batch(self, files: list[tuple[str, str]]) -> dict[str, list[Vulnerability]]:
+        """Scan several `(file_path, source)` pairs in one request.
+
+        Only files present in the response are returned, so callers can fall back
+        to `scan_source` for any file the model skipped.
+        """
+        prompt = "\n\n".join(
+            f"### File: {file_path}\n```python\n{source}\n```" for file_path, source in files
+        )
+        response = await self._llm.ainvoke(
+            [
+                SystemMessage(content=BATCH_SYSTEM_PROMPT),
+                HumanMessage(content=prompt),
+            ],
+            config={"metadata": {"files": [path for path, _ in files]}},
+        )
+        return self._parse_batch({path for path, _ in files}, str(response.content))
+
+    @staticmethod
+    def plan_batches(
+        files: list[tuple[str, str]],
+        token_budget: int,
+    ) -> list[list[tuple[str, str]]]:
+        """Greedily pack files into batches of at most `token_budget` estimated tokens.
+
+        Files larger than the budget get a batch of their own.
+        """
+        batches: list[list[tuple[str, str]]] = []
+        current: list[tuple[str, str]] = []
+        current_tokens = 0
+        for file_path, source in files:
+            tokens = estimate_tokens(file_path) + estimate_tokens(source)
+            if current and (
+                current_tokens + tokens > token_budget or len(current) >= MAX_BATCH_FILES
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append((file_path, source))
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _parse(self, file_path: str, raw: str) -> list[Vulnerability] | None:
         try:
             cleaned = self._extract_json(raw)
             data: dict[str, Any] = json.loads(cleaned)
         except (json.JSONDecodeError, ValueError):
             logger.warning("Failed to parse LLM scanner response for %s", file_path)
-            return []
+            return None
+        items = data.get("vulnerabilities", []) if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            logger.warning("Unexpected LLM scanner response for %s", file_path)
+            return None
+
+        return self._to_vulns(file_path, items)
 
+    def _parse_batch(self, expected: set[str], raw: str) -> dict[str, list[Vulnerability]]:
+        try:
+            cleaned = self._extract_json(raw)
+            data: dict[str, Any] = json.loads(cleaned)
+        except (json.JSONDecodeError, ValueError):
+            logger.warning("Failed to parse batched LLM scanner response")
+            return {}
+        files = data.get("files") if isinstance(data, dict) else None
+        if not isinstance(files, list):
+            # Files left out of the result are rescanned one by one.
+            logger.warning("Unexpected batched LLM scanner response")
+            return {}
+
+        results: dict[str, list[Vulnerability]] = {}
+        for entry in files:
+            if not isinstance(entry, dict):
+                continue
+            file_path, items = entry.get("file_path"), entry.get("vulnerabilities", [])
+            if isinstance(file_path, str) and file_path in expected and isinstance(items, list):
+                results[file_path] = self._to_vulns(file_path, items)
+        return results
+
+    @staticmethod
+    def _to_vulns(file_path: str, items: list[dict[str, Any]]) -> list[Vulnerability]:
         vulns = []
-        for v in data.get("vulnerabilities", []):
+        for v in items:
+            if not isinstance(v, dict):
+                continue
             vulns.append(
                 Vulnerability(
                     id=v.get("id", ""),
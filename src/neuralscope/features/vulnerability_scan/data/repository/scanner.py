@@ -1,9 +1,14 @@
-"""Data repository: walks project files and scans each via LLM."""
+"""Data repository: walks project files and scans them concurrently via LLM."""
 
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+from collections.abc import Callable
 
+from neuralscope.core.project import SnapshotRegistry
+from neuralscope.features.vulnerability_scan.data.datasource.findings_store.implementation import (
+    ScanFindingsStore,
+)
 from neuralscope.features.vulnerability_scan.data.datasource.llm_scanner.implementation import (
     LlmSecurityScanner,
 )
@@ -15,34 +20,107 @@ from neuralscope.features.vulnerability_scan.domain.repository.scanner import (
     IScannerRepository,
 )
 
-SKIP_DIRS = {".venv", "venv", "__pycache__", ".git", "node_modules", ".tox"}
+FileScannedCallback = Callable[[str, list[Vulnerability]], None]
 
 
 class ScannerRepository(IScannerRepository):
-    def __init__(self, scanner: LlmSecurityScanner) -> None:
+    """Scans up to `max_concurrency` requests at once.
+
+    `on_file_scanned` is called as each file finishes, in completion order;
+    the returned report is always ordered by file path. With a `findings_store`,
+    only new or modified files reach the LLM; the rest reuse stored findings.
+    With `batch_token_budget`, small files are packed into shared requests.
+    """
+
+    def __init__(
+        self,
+        scanner: LlmSecurityScanner,
+        *,
+        max_concurrency: int = 8,
+        on_file_scanned: FileScannedCallback | None = None,
+        findings_store: ScanFindingsStore | None = None,
+        batch_token_budget: int | None = None,
+        snapshots: SnapshotRegistry | None = None,
+    ) -> None:
         self._scanner = scanner
+        self._findings = findings_store
+        self._max_concurrency = max(1, max_concurrency)
+        self._on_file_scanned = on_file_scanned
+        self._batch_token_budget = batch_token_budget
+        self._snapshots = snapshots or SnapshotRegistry()
 
     async def scan_project(self, project_path: str) -> VulnReport:
-        root = Path(project_path)
-        py_files = [f for f in root.rglob("*.py") if not self._skip(f, root)]
+        snapshot = self._snapshots.get(project_path)
+        py_files = snapshot.files
 
-        all_vulns: list[Vulnerability] = []
+        results: dict[str, list[Vulnerability]] = {}
+        pending: list[tuple[str, str]] = []
         for f in py_files:
             try:
-                source = f.read_text(encoding="utf-8")
-                if len(source.strip()) == 0:
-                    continue
-                vulns = await self._scanner.scan_source(str(f.relative_to(root)), source)
-                all_vulns.extend(vulns)
+                source = snapshot.read(f)
             except (OSError, UnicodeDecodeError):
                 continue
+            if len(source.strip()) == 0:
+                continue
+            stored = self._findings.get(f.rel, source) if self._findings else None
+            if stored is not None:
+                self._record(results, f.rel, stored)
+            else:
+                pending.append((f.rel, source))
+        reused = len(results)
+
+        if self._batch_token_budget:
+            batches = self._scanner.plan_batches(pending, self._batch_token_budget)
+        else:
+            batches = [[item] for item in pending]
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        requests = 0
+
+        async def scan_batch(batch: list[tuple[str, str]]) -> None:
+            nonlocal requests
+            async with semaphore:
+                found: dict[str, list[Vulnerability]] = {}
+                if len(batch) > 1:
+                    requests += 1
+                    found = await self._scanner.scan_batch(batch)
+                for rel, source in batch:
+                    vulns = found.get(rel)
+                    if vulns is None:
+                        requests += 1
+                        vulns = await self._scanner.scan_source(rel, source)
+                    if vulns is None:
+                        # Unparseable reply: report nothing, but don't store it so the
+                        # next incremental scan asks again.
+                        vulns = []
+                    elif self._findings is not None:
+                        self._findings.put(source, vulns)
+                    self._record(results, rel, vulns)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for batch in batches:
+                    tg.create_task(scan_batch(batch))
+        except* Exception as group:
+            # Surface the first provider error rather than an opaque ExceptionGroup.
+            raise group.exceptions[0] from None
 
+        all_vulns = [v for f in py_files for v in results.get(f.rel, [])]
         return VulnReport(
             project_path=project_path,
             vulnerabilities=all_vulns,
-            summary=f"Scanned {len(py_files)} files, found {len(all_vulns)} issue(s)",
+            summary=(
+                f"Scanned {len(py_files)} files ({reused} unchanged, "
+                f"{requests} LLM request(s)), found {len(all_vulns)} issue(s)"
+            ),
         )
 
-    @staticmethod
-    def _skip(path: Path, root: Path) -> bool:
-        return bool(SKIP_DIRS & set(path.relative_to(root).parts))
+    def _record(
+        self,
+        results: dict[str, list[Vulnerability]],
+        rel: str,
+        vulns: list[Vulnerability],
+    ) -> None:
+        results[rel] = vulns
+        if self._on_file_scanned is not None:
+            self._on_file_scanned(rel, vulns)
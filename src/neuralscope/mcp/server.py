@@ -10,6 +10,7 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, TextContent, Tool
 
+from neuralscope.core.logging import setup_logging
 from neuralscope.sdk.client import NeuralScope
 
 server = Server("neuralscope")
@@ -151,7 +152,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         "impact": lambda: ns.impact(arguments["path"], diff=arguments.get("diff", "HEAD~1")),
         "scan": lambda: ns.scan(arguments["path"]),
         "generate_tests": lambda: ns.generate_tests(arguments["path"]),
-        "ask": lambda: ns.ask(arguments["question"], project=arguments.get("project", ".")),
+        "ask": lambda: _ask_with_progress(ns, arguments),
         "health": lambda: ns.health(arguments["path"]),
         "pr_summary": lambda: ns.pr_summary(diff=arguments.get("diff", "HEAD~1")),
         "validate_arch": lambda: ns.validate_arch(arguments["path"], rules=arguments.get("rules")),
@@ -174,6 +175,21 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         return [TextContent(type="text", text=f"Error: {exc}")]
 
 
+async def _ask_with_progress(ns: NeuralScope, arguments: dict[str, Any]) -> dict:
+    """Run `ask_stream`, relaying answer text as progress notifications when requested."""
+    ctx = server.request_context
+    token = ctx.meta.progressToken if ctx.meta else None
+    result: dict = {}
+    sent = 0
+    async for event in ns.ask_stream(arguments["question"], project=arguments.get("project", ".")):
+        if isinstance(event, dict):
+            result = event
+        elif token is not None:
+            sent += len(event)
+            await ctx.session.send_progress_notification(token, sent, message=event)
+    return result
+
+
 @server.list_resources()
 async def list_resources() -> list[Resource]:
     return [
@@ -212,6 +228,7 @@ async def run_server() -> None:
 
 
 def main() -> None:
+    setup_logging()
     asyncio.run(run_server())
 
 
@@ -10,14 +10,34 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from langchain_core.language_models import BaseChatModel
 
+from neuralscope.core.cache import CacheLimits, namespace_dir
 from neuralscope.core.llm.model_registry import ModelRegistry
-from neuralscope.core.llm.models import ModelConfig
 from neuralscope.core.log_context import LogContextRepository
-from neuralscope.core.settings import Settings, get_settings
+from neuralscope.core.logging import get_logger
+from neuralscope.core.project import SnapshotRegistry
+from neuralscope.core.settings import RerankMode, Settings, VectorBackend, get_settings
+
+if TYPE_CHECKING:
+    from neuralscope.features.code_review.domain.entities.review import ReviewResult
+    from neuralscope.features.codebase_qa.data.datasource.reranker.implementation import (
+        Reranker,
+    )
+    from neuralscope.features.codebase_qa.data.datasource.vector_store.implementation import (
+        ChunkVectorStore,
+    )
+    from neuralscope.features.codebase_qa.data.repository.qa import QARepository
+    from neuralscope.features.codebase_qa.domain.entities.answer import Answer
+    from neuralscope.features.dependency_graph.data.datasource.parse_cache.implementation import (
+        AstParseCache,
+    )
+
+logger = get_logger("sdk")
 
 
 class NeuralScope:
@@ -33,7 +53,9 @@ class NeuralScope:
         self._model_string = model or self._settings.get_model_string()
         self._profile = profile
         self._registry = ModelRegistry(self._settings)
-        self._llm: BaseChatModel | None = None
+        self._llms: dict[str | None, BaseChatModel] = {}
+        # One walk and one read per file, however many features run on a project.
+        self._snapshots = SnapshotRegistry(use_gitignore=self._settings.respect_gitignore)
 
     @property
     def model(self) -> str:
@@ -43,18 +65,92 @@ class NeuralScope:
     def profile(self) -> str:
         return self._profile
 
-    def _get_llm(self) -> BaseChatModel:
-        if self._llm is None:
-            config = ModelConfig.from_string(self._model_string)
-            self._llm = self._registry.get(config)
-        return self._llm
+    def _get_llm(self, feature: str | None = None) -> BaseChatModel:
+        if feature not in self._llms:
+            self._llms[feature] = self._registry.get(self._model_string, feature=feature)
+        return self._llms[feature]
 
     def _log(self, name: str) -> LogContextRepository:
-        return LogContextRepository(name)
+        return LogContextRepository(name, tracer=self._registry.tracer)
+
+    def _ast_parse_cache(self) -> AstParseCache | None:
+        from neuralscope.features.dependency_graph.data.datasource.parse_cache.implementation import (  # noqa: E501
+            AstParseCache,
+        )
+
+        if not self._settings.cache_enabled:
+            return None
+        return AstParseCache(namespace_dir(self._settings, "ast"))
+
+    def _qa_vector_store(self) -> ChunkVectorStore | None:
+        from neuralscope.core.embeddings import EmbeddingsService
+        from neuralscope.core.embeddings.pipeline import EmbeddingCache, EmbeddingPipeline
+        from neuralscope.features.codebase_qa.data.datasource.local_vector_store.implementation import (  # noqa: E501
+            LocalChunkStore,
+        )
+        from neuralscope.features.codebase_qa.data.datasource.vector_store.implementation import (
+            QdrantChunkStore,
+            create_qdrant_client,
+        )
+
+        if not self._settings.qa_vector_search:
+            return None
+        try:
+            embeddings = EmbeddingsService(self._settings).get()
+        except Exception as exc:  # missing provider package or credentials
+            logger.warning("Vector search unavailable, using lexical search: %s", exc)
+            return None
+        cache = None
+        if self._settings.cache_enabled:
+            cache = EmbeddingCache(
+                namespace_dir(self._settings, "embeddings"),
+                limits=CacheLimits.for_namespace(self._settings, "embeddings"),
+            )
+        pipeline = EmbeddingPipeline(
+            embeddings,
+            batch_size=self._settings.embedding_batch_size,
+            concurrency=self._settings.embedding_concurrency,
+            max_retries=self._settings.embedding_max_retries,
+            cache=cache,
+        )
+        if self._settings.qa_vector_backend == VectorBackend.LOCAL:
+            return LocalChunkStore(self._settings.qa_vector_dir, pipeline)
+        return QdrantChunkStore(create_qdrant_client(self._settings), pipeline)
+
+    def _qa_reranker(self, mode: RerankMode) -> Reranker | None:
+        from neuralscope.features.codebase_qa.data.datasource.reranker.implementation import (
+            DEFAULT_CROSS_ENCODER,
+            CrossEncoderReranker,
+            LlmReranker,
+        )
+
+        model = self._settings.qa_rerank_model
+        match mode:
+            case RerankMode.LLM:
+                return LlmReranker(
+                    self._registry.get(model, feature="ask") if model else self._get_llm("ask")
+                )
+            case RerankMode.CROSS_ENCODER:
+                return CrossEncoderReranker(model or DEFAULT_CROSS_ENCODER)
+            case _:
+                return None
 
     # ── Code Review ────────────────────────────────────────────────────────
 
-    async def review(self, path: str, *, diff: bool = False) -> dict:
+    async def review(
+        self,
+        path: str,
+        *,
+        diff: bool = False,
+        concurrency: int | None = None,
+        on_file_reviewed: Callable[[str, float | None], None] | None = None,
+    ) -> dict:
+        """Review a file, or every file under a directory or matching a glob.
+
+        Several files are reviewed up to `concurrency` at once and returned as an
+        aggregate report; `on_file_reviewed(file, score)` fires as each completes,
+        with a None score when its review failed.
+        """
         from neuralscope.features.code_review.data.datasource.llm_reviewer.implementation import (
             LlmReviewerDatasource,
         )
@@ -63,30 +159,49 @@ class NeuralScope:
             ReviewFileParams,
             ReviewFileUseCase,
         )
+        from neuralscope.features.code_review.domain.use_cases.review_project.use_case import (
+            ReviewProjectParams,
+            ReviewProjectUseCase,
+            is_project_target,
+        )
 
-        ds = LlmReviewerDatasource(self._get_llm())
+        ds = LlmReviewerDatasource(self._get_llm("review"))
         repo = ReviewerRepository(ds)
+        if not diff and is_project_target(path):
+            project_uc = ReviewProjectUseCase(
+                reviewer_repo=repo,
+                log_context_repository=self._log("review_project"),
+                on_file_reviewed=(
+                    (lambda file, review: on_file_reviewed(file, review.score if review else None))
+                    if on_file_reviewed
+                    else None
+                ),
+                snapshots=self._snapshots,
+            )
+            project_result = await project_uc(
+                ReviewProjectParams(
+                    target=path,
+                    max_concurrency=concurrency or self._settings.review_concurrency,
+                )
+            )
+            if not project_result.is_success():
+                return {"error": project_result.message}
+            report = project_result.report
+            return {
+                "root": report.root,
+                "files": report.file_count,
+                "average_score": report.average_score,
+                "score_distribution": report.score_distribution,
+                "failing": report.failing_files,
+                "errors": report.errors,
+                "passed": report.passed,
+                "reviews": [_review_dict(r) for r in report.reviews],
+            }
+
         uc = ReviewFileUseCase(reviewer_repo=repo, log_context_repository=self._log("review"))
         result = await uc(ReviewFileParams(path=path, diff=diff))
         if result.is_success():
-            r = result.review
-            return {
-                "file": r.file_path,
-                "score": r.score,
-                "summary": r.summary,
-                "issues": [
-                    {
-                        "line": i.line,
-                        "message": i.message,
-                        "severity": i.severity.value,
-                        "category": i.category.value,
-                        "suggestion": i.suggestion,
-                    }
-                    for i in r.issues
-                ],
-                "strengths": r.strengths,
-                "passed": r.passed,
-            }
+            return _review_dict(result.review)
         return {"error": result.message}
 
     # ── Documentation ──────────────────────────────────────────────────────
@@ -103,7 +218,7 @@ class NeuralScope:
             GenerateFileDocsUseCase,
         )
 
-        ds = LlmDocumenterDatasource(self._get_llm())
+        ds = LlmDocumenterDatasource(self._get_llm("docs"))
         repo = DocumenterRepository(ds)
         uc = GenerateFileDocsUseCase(documenter_repo=repo, log_context_repository=self._log("docs"))
         result = await uc(GenerateFileDocsParams(path=path, format=fmt))
@@ -119,7 +234,15 @@ class NeuralScope:
 
     # ── Dependency Graph ───────────────────────────────────────────────────
 
-    async def build_graph(self, path: str, *, output: str = "svg", mode: str = "ast") -> dict:
+    async def build_graph(
+        self,
+        path: str,
+        *,
+        output: str = "svg",
+        mode: str = "ast",
+        workers: int = 1,
+    ) -> dict:
+        """Build a dependency graph; `workers > 1` parses files in a process pool (0 = all CPUs)."""
         from neuralscope.features.dependency_graph.data.repository.graph_builder import (
             GraphBuilderRepository,
         )
@@ -128,9 +251,14 @@ class NeuralScope:
             BuildGraphUseCase,
         )
 
-        llm = self._get_llm() if mode == "llm" else None
-        repo = GraphBuilderRepository(llm=llm)
-        uc = BuildGraphUseCase(graph_builder_repo=repo, log_context_repository=self._log("graph"))
+        llm = self._get_llm("graph") if mode == "llm" else None
+        repo = GraphBuilderRepository(
+            llm=llm,
+            workers=workers,
+            parse_cache=self._ast_parse_cache(),
+            snapshots=self._snapshots,
+        )
+        uc = BuildGraphUseCase(graph_repo=repo, log_context_repository=self._log("graph"))
         result = await uc(BuildGraphParams(path=path, output_format=output, mode=mode))
         if result.is_success():
             return {
@@ -153,10 +281,12 @@ class NeuralScope:
             AnalyzeImpactUseCase,
         )
 
-        builder = GraphBuilderRepository()
+        builder = GraphBuilderRepository(
+            parse_cache=self._ast_parse_cache(), snapshots=self._snapshots
+        )
         analyzer = ImpactAnalyzerRepository()
         uc = AnalyzeImpactUseCase(
-            graph_builder_repo=builder,
+            graph_repo=builder,
             impact_repo=analyzer,
             log_context_repository=self._log("impact"),
         )
@@ -164,16 +294,34 @@ class NeuralScope:
         if result.is_success():
             r = result.report
             return {
-                "risk": r.overall_risk.value,
-                "affected": len(r.affected_nodes),
+                "risk": r.risk_level.value,
+                "affected": r.affected_count,
                 "summary": r.summary,
             }
         return {"error": result.message}
 
     # ── Vulnerability Scan ─────────────────────────────────────────────────
 
-    async def scan(self, path: str) -> dict:
+    async def scan(
+        self,
+        path: str,
+        *,
+        concurrency: int | None = None,
+        incremental: bool = True,
+        batch_tokens: int | None = None,
+        on_file_scanned: Callable[[str, int], None] | None = None,
+    ) -> dict:
+        """Scan a project; `on_file_scanned(file, issue_count)` fires as each file completes.
+
+        With `incremental` (and `cache_enabled`), files whose content was already scanned
+        with the same model and prompt reuse their stored findings instead of calling the LLM.
+        `batch_tokens` packs small files into shared requests up to that token budget.
+        """
+        from neuralscope.features.vulnerability_scan.data.datasource.findings_store.implementation import (  # noqa: E501
+            ScanFindingsStore,
+        )
         from neuralscope.features.vulnerability_scan.data.datasource.llm_scanner.implementation import (  # noqa: E501
+            PROMPT_VERSION,
             LlmSecurityScanner,
         )
         from neuralscope.features.vulnerability_scan.data.repository.scanner import (
@@ -184,8 +332,26 @@ class NeuralScope:
             ScanProjectUseCase,
         )
 
-        scanner = LlmSecurityScanner(self._get_llm())
-        repo = ScannerRepository(scanner)
+        scanner = LlmSecurityScanner(self._get_llm("scan"))
+        repo = ScannerRepository(
+            scanner,
+            max_concurrency=concurrency or self._settings.scan_concurrency,
+            on_file_scanned=(
+                (lambda file, vulns: on_file_scanned(file, len(vulns))) if on_file_scanned else None
+            ),
+            findings_store=(
+                ScanFindingsStore(
+                    namespace_dir(self._settings, "scan_findings"),
+                    model=self._model_string,
+                    prompt_version=PROMPT_VERSION,
+                    limits=CacheLimits.for_namespace(self._settings, "scan_findings"),
+                )
+                if incremental and self._settings.cache_enabled
+                else None
+            ),
+            batch_token_budget=batch_tokens or self._settings.scan_batch_tokens,
+            snapshots=self._snapshots,
+        )
         uc = ScanProjectUseCase(scanner_repo=repo, log_context_repository=self._log("scan"))
         result = await uc(ScanProjectParams(path=path))
         if result.is_success():
@@ -225,7 +391,7 @@ class NeuralScope:
             GenerateTestsUseCase,
         )
 
-        ds = LlmTestWriterDatasource(self._get_llm())
+        ds = LlmTestWriterDatasource(self._get_llm("test_gen"))
         repo = GeneratorRepository(ds)
         uc = GenerateTestsUseCase(generator_repo=repo, log_context_repository=self._log("test_gen"))
         result = await uc(GenerateTestsParams(path=path))
@@ -236,50 +402,94 @@ class NeuralScope:
 
     # ── Codebase Q&A ───────────────────────────────────────────────────────
 
-    async def ask(self, question: str, *, project: str = ".") -> dict:
-        from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
-            FileIndexer,
-        )
-        from neuralscope.features.codebase_qa.data.datasource.llm_answerer.implementation import (
-            LlmAnswerer,
-        )
-        from neuralscope.features.codebase_qa.data.repository.qa import QARepository
+    async def ask(
+        self,
+        question: str,
+        *,
+        project: str = ".",
+        rerank: str | None = None,
+    ) -> dict:
         from neuralscope.features.codebase_qa.domain.use_cases.ask_question.use_case import (
             AskQuestionParams,
             AskQuestionUseCase,
         )
 
-        indexer = FileIndexer()
-        answerer = LlmAnswerer(self._get_llm())
-        repo = QARepository(indexer, answerer)
+        repo = self._qa_repository(rerank)
         uc = AskQuestionUseCase(qa_repo=repo, log_context_repository=self._log("ask"))
         result = await uc(AskQuestionParams(question=question, project=project))
         if result.is_success():
-            a = result.answer
-            return {
-                "answer": a.answer,
-                "confidence": a.confidence,
-                "sources": [
-                    {
-                        "file": s.file_path,
-                        "lines": f"{s.line_start}-{s.line_end}",
-                        "snippet": s.snippet,
-                    }
-                    for s in a.sources
-                ],
-            }
+            return _answer_dict(result.answer)
         return {"error": result.message}
 
+    async def ask_stream(
+        self,
+        question: str,
+        *,
+        project: str = ".",
+        rerank: str | None = None,
+    ) -> AsyncIterator[str | dict]:
+        """Yield answer text as it arrives, then the same dict `ask` returns."""
+        from neuralscope.features.codebase_qa.domain.use_cases.ask_question.use_case import (
+            AskQuestionParams,
+        )
+        from neuralscope.features.codebase_qa.domain.use_cases.stream_answer.use_case import (
+            StreamAnswerUseCase,
+        )
+
+        repo = self._qa_repository(rerank)
+        uc = StreamAnswerUseCase(qa_repo=repo, log_context_repository=self._log("ask"))
+        async for event in uc(AskQuestionParams(question=question, project=project)):
+            if isinstance(event, str):
+                yield event
+            elif event.is_success():
+                yield _answer_dict(event.answer)
+            else:
+                yield {"error": event.message}
+
+    def _qa_repository(self, rerank: str | None) -> QARepository:
+        from neuralscope.features.codebase_qa.data.datasource.context_packer.implementation import (
+            ContextPacker,
+        )
+        from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+            FileIndexer,
+        )
+        from neuralscope.features.codebase_qa.data.datasource.index_store.implementation import (
+            QAIndexStore,
+        )
+        from neuralscope.features.codebase_qa.data.datasource.llm_answerer.implementation import (
+            LlmAnswerer,
+        )
+        from neuralscope.features.codebase_qa.data.repository.qa import QARepository
+
+        index_store = (
+            QAIndexStore(namespace_dir(self._settings, "qa_index"))
+            if self._settings.cache_enabled
+            else None
+        )
+        return QARepository(
+            FileIndexer(snapshots=self._snapshots),
+            LlmAnswerer(self._get_llm("ask")),
+            vector_store=self._qa_vector_store(),
+            index_store=index_store,
+            reranker=self._qa_reranker(RerankMode(rerank or self._settings.qa_rerank)),
+            packer=ContextPacker(self._settings.qa_context_tokens),
+            top_k=self._settings.qa_top_k,
+            candidates=self._settings.qa_candidates,
+        )
+
     # ── Health Dashboard ───────────────────────────────────────────────────
 
     async def health(self, path: str) -> dict:
+        from neuralscope.features.health_dashboard.data.datasource.complexity_analyzer.implementation import (  # noqa: E501
+            ComplexityAnalyzer,
+        )
         from neuralscope.features.health_dashboard.data.repository.health import HealthRepository
         from neuralscope.features.health_dashboard.domain.use_cases.analyze_health.use_case import (
             AnalyzeHealthParams,
             AnalyzeHealthUseCase,
         )
 
-        repo = HealthRepository()
+        repo = HealthRepository(ComplexityAnalyzer(self._snapshots))
         uc = AnalyzeHealthUseCase(health_repo=repo, log_context_repository=self._log("health"))
         result = await uc(AnalyzeHealthParams(path=path))
         if result.is_success():
@@ -308,7 +518,7 @@ class NeuralScope:
             ReviewDiffUseCase,
         )
 
-        ds = LlmReviewerDatasource(self._get_llm())
+        ds = LlmReviewerDatasource(self._get_llm("pr_summary"))
         repo = ReviewerRepository(ds)
         uc = ReviewDiffUseCase(reviewer_repo=repo, log_context_repository=self._log("pr_summary"))
         result = await uc(ReviewDiffParams(diff_ref=diff))
@@ -320,13 +530,16 @@ class NeuralScope:
     # ── Architecture Validator ─────────────────────────────────────────────
 
     async def validate_arch(self, path: str, *, rules: str | None = None) -> dict:
+        from neuralscope.features.health_dashboard.data.datasource.complexity_analyzer.implementation import (  # noqa: E501
+            ComplexityAnalyzer,
+        )
         from neuralscope.features.health_dashboard.data.repository.health import HealthRepository
         from neuralscope.features.health_dashboard.domain.use_cases.analyze_health.use_case import (
             AnalyzeHealthParams,
             AnalyzeHealthUseCase,
         )
 
-        repo = HealthRepository()
+        repo = HealthRepository(ComplexityAnalyzer(self._snapshots))
         uc = AnalyzeHealthUseCase(health_repo=repo, log_context_repository=self._log("validate"))
         result = await uc(AnalyzeHealthParams(path=path))
         if result.is_success():
@@ -392,3 +605,65 @@ class NeuralScope:
 
     def list_models(self) -> list[dict[str, str]]:
         return self._registry.list_providers()
+
+    def trace_stats(self) -> dict:
+        """Latency, token and cost summary of this client's LLM calls, per feature."""
+        return self._registry.tracer.stats
+
+    # ── Cache Management ───────────────────────────────────────────────────
+
+    def cache_stats(self) -> list[dict]:
+        from neuralscope.core.cache_admin import cache_stats
+
+        return cache_stats(self._settings)
+
+    def cache_prune(self, *, older_than_days: float | None = None) -> dict[str, int]:
+        from neuralscope.core.cache_admin import prune_caches
+
+        return prune_caches(self._settings, older_than_days=older_than_days)
+
+    def cache_export(self, path: str, *, namespaces: list[str] | None = None) -> dict[str, int]:
+        from neuralscope.core.cache_admin import export_caches
+
+        return export_caches(self._settings, Path(path), namespaces=namespaces)
+
+    def cache_import(self, path: str) -> dict[str, int]:
+        from neuralscope.core.cache_admin import import_caches
+
+        return import_caches(self._settings, Path(path))
+
+
+def _review_dict(r: ReviewResult) -> dict:
+    return {
+        "file": r.file_path,
+        "score": r.score,
+        "summary": r.summary,
+        "issues": [
+            {
+                "line": i.line,
+                "message": i.message,
+                "severity": i.severity.value,
+                "category": i.category.value,
+                "suggestion": i.suggestion,
+            }
+            for i in r.issues
+        ],
+        "strengths": r.strengths,
+        "passed": r.passed,
+    }
+
+
+def _answer_dict(answer: Answer) -> dict:
+    return {
+        "answer": answer.answer,
+        "confidence": answer.confidence,
+        "prompt_tokens": answer.prompt_tokens,
+        "sources": [
+            {
+                "file": s.file_path,
+                "lines": f"{s.line_start}-{s.line_end}",
+                "snippet": s.snippet,
+            }
+            for s in answer.sources
+        ],
+    }
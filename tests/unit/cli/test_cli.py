@@ -3,6 +3,7 @@
 from typer.testing import CliRunner
 
 from neuralscope.cli.app import app
+from neuralscope.core.cache import LLMCache
 
 runner = CliRunner()
 
@@ -25,3 +26,18 @@ def test_cli_models_command():
     result = runner.invoke(app, ["models"])
     assert result.exit_code == 0
     assert "LLM Providers" in result.stdout
+
+
+def test_cli_cache_export_import_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEURALSCOPE_CACHE_DIR", str(tmp_path / "warm"))
+    LLMCache(tmp_path / "warm").set("key", "answer")
+    archive = tmp_path / "cache.tar.gz"
+
+    exported = runner.invoke(app, ["cache", "export", str(archive)])
+    monkeypatch.setenv("NEURALSCOPE_CACHE_DIR", str(tmp_path / "cold"))
+    imported = runner.invoke(app, ["cache", "import", str(archive)])
+    stats = runner.invoke(app, ["cache", "stats"])
+
+    assert exported.exit_code == imported.exit_code == stats.exit_code == 0
+    assert LLMCache(tmp_path / "cold").get("key") == "answer"
+    assert "llm" in stats.stdout
@@ -0,0 +1,93 @@
+"""Tests for cache limits, per-feature TTL and cache export/import."""
+
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from neuralscope.core.cache import CacheLimits, LLMCache
+from neuralscope.core.cache_admin import cache_stats, export_caches, import_caches, prune_caches
+from neuralscope.core.embeddings.pipeline import EmbeddingCache
+from neuralscope.core.llm.model_registry import ModelRegistry
+from neuralscope.core.settings import EvictionPolicy, Settings
+
+
+def _settings(cache_dir: Path, **kwargs) -> Settings:
+    return Settings(_env_file=None, cache_dir=cache_dir, **kwargs)
+
+
+def test_feature_ttl_applies_per_feature(tmp_path: Path, monkeypatch):
+    settings = _settings(
+        tmp_path, cache_ttl=3600, cache_feature_ttl={"review": 60}, llm_tracing=False
+    )
+    registry = ModelRegistry(settings)
+    monkeypatch.setattr(registry, "_create", lambda _: FakeListChatModel(responses=["ok"]))
+
+    review = registry.get("openai/gpt-5.2", feature="review")
+    docs = registry.get("openai/gpt-5.2", feature="docs")
+
+    assert review.ttl == 60
+    assert docs.ttl is None
+    assert review.inner is docs.inner
+    review.invoke("hello")
+    _, expire_time = review.llm_cache._cache.get(
+        review._cache_key([review._convert_input("hello").to_messages()[0]], None),
+        expire_time=True,
+    )
+    assert expire_time - time.time() <= 60
+
+
+def test_size_limit_evicts_least_recently_used(tmp_path: Path):
+    limits = CacheLimits(size_limit=500_000, eviction_policy=EvictionPolicy.LEAST_RECENTLY_USED)
+    cache = LLMCache(tmp_path, memory_size=0, limits=limits)
+    # Large enough to be stored as files, so the cache volume is predictable.
+    for i in range(40):
+        cache.set(f"k{i}", "x" * 40_000)
+        cache.get("k0")
+
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+    assert cache.stats["size"] < 40
+
+
+def test_export_import_round_trips_every_namespace(tmp_path: Path):
+    warm = _settings(tmp_path / "warm")
+    LLMCache(warm.cache_dir).set("prompt", "answer")
+    EmbeddingCache(warm.cache_dir / "embeddings").put("chunk", np.ones(3))
+    (warm.cache_dir / "ast").mkdir()
+    (warm.cache_dir / "ast" / "root.json").write_text("{}")
+    archive = tmp_path / "cache.tar.gz"
+
+    exported = export_caches(warm, archive)
+    cold = _settings(tmp_path / "cold")
+    imported = import_caches(cold, archive)
+
+    assert exported == imported
+    assert LLMCache(cold.cache_dir).get("prompt") == "answer"
+    assert list(EmbeddingCache(cold.cache_dir / "embeddings").get("chunk")) == [1.0, 1.0, 1.0]
+    assert (cold.cache_dir / "ast" / "root.json").read_text() == "{}"
+    rows = {r["namespace"]: r for r in cache_stats(cold)}
+    assert rows["llm"]["entries"] == 1
+    assert rows["ast"]["entries"] == 1
+
+
+def test_prune_drops_expired_entries_and_old_files(tmp_path: Path):
+    settings = _settings(tmp_path)
+    cache = LLMCache(tmp_path, ttl=3600, memory_size=0)
+    cache.set("fresh", "y")
+    # Written last: diskcache also drops expired entries on every set.
+    cache.set("stale", "x", ttl=0)
+    time.sleep(0.01)
+    (tmp_path / "qa_index").mkdir()
+    old = tmp_path / "qa_index" / "old.npz"
+    old.write_bytes(b"")
+    past = time.time() - 10 * 86400
+    os.utime(old, (past, past))
+
+    removed = prune_caches(settings, older_than_days=7)
+
+    assert removed["llm"] == 1
+    assert removed["qa_index"] == 1
+    assert cache.get("fresh") == "y"
@@ -0,0 +1,260 @@
+"""Tests for the caching chat-model wrapper."""
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from neuralscope.core.cache import LLMCache, normalize_code
+from neuralscope.core.embeddings.pipeline import EmbeddingPipeline
+from neuralscope.core.llm.cached_model import CachedChatModel
+from neuralscope.core.llm.model_registry import ModelRegistry
+from neuralscope.core.semantic_cache import SemanticCacheIndex
+from neuralscope.core.settings import Settings
+
+
+def _cached(tmp_path: Path, responses: list[str], **kwargs) -> CachedChatModel:
+    return CachedChatModel(
+        inner=FakeListChatModel(responses=responses),
+        llm_cache=LLMCache(cache_dir=tmp_path / "cache"),
+        model_id="openai/gpt-5.2",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_prompt_served_from_cache(tmp_path: Path):
+    llm = _cached(tmp_path, ["first", "second"])
+    messages = [SystemMessage(content="sys"), HumanMessage(content="hello")]
+
+    r1 = await llm.ainvoke(messages)
+    r2 = await llm.ainvoke(messages)
+
+    assert r1.content == "first"
+    assert r2.content == "first"
+    assert llm.inner.i == 1
+
+
+@pytest.mark.asyncio
+async def test_different_prompt_misses_cache(tmp_path: Path):
+    llm = _cached(tmp_path, ["first", "second"])
+
+    r1 = await llm.ainvoke([HumanMessage(content="a")])
+    r2 = await llm.ainvoke([HumanMessage(content="b")])
+
+    assert r1.content == "first"
+    assert r2.content == "second"
+
+
+@pytest.mark.asyncio
+async def test_stream_passes_chunks_through_and_caches(tmp_path: Path):
+    llm = _cached(tmp_path, ["hello", "other"])
+
+    first = [c.content async for c in llm.astream("hi")]
+    second = [c.content async for c in llm.astream("hi")]
+
+    assert first == list("hello")
+    assert second == ["hello"]
+    assert llm.inner.i == 1
+
+
+def test_sync_invoke_uses_cache(tmp_path: Path):
+    llm = _cached(tmp_path, ["first", "second"])
+    assert llm.invoke("hello").content == "first"
+    assert llm.invoke("hello").content == "first"
+
+
+def test_cache_key_covers_sampling_params():
+    cache = LLMCache.__new__(LLMCache)
+    messages = [{"role": "user", "content": "hello"}]
+    k1 = cache.key("gpt-5.2", messages, temperature=0.1, max_tokens=None)
+    k2 = cache.key("gpt-5.2", messages, temperature=0.7, max_tokens=None)
+    k3 = cache.key("gpt-5.2", messages, temperature=0.1, max_tokens=512)
+    assert len({k1, k2, k3}) == 3
+
+
+def test_registry_wraps_when_cache_enabled(tmp_path: Path, monkeypatch):
+    settings = Settings(
+        _env_file=None, cache_enabled=True, cache_dir=tmp_path / "cache", llm_tracing=False
+    )
+    registry = ModelRegistry(settings)
+    monkeypatch.setattr(registry, "_create", lambda _: FakeListChatModel(responses=["ok"]))
+
+    llm = registry.get("openai/gpt-5.2")
+    assert isinstance(llm, CachedChatModel)
+    assert llm.model_id == "openai/gpt-5.2"
+
+
+def test_registry_returns_raw_model_when_cache_disabled(mock_settings, monkeypatch):
+    mock_settings.llm_tracing = False
+    registry = ModelRegistry(mock_settings)
+    monkeypatch.setattr(registry, "_create", lambda _: FakeListChatModel(responses=["ok"]))
+
+    llm = registry.get("openai/gpt-5.2")
+    assert isinstance(llm, FakeListChatModel)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_inner_call(tmp_path: Path):
+    llm = _cached(tmp_path, ["first", "second"])
+
+    results = await asyncio.gather(*(llm.ainvoke("same") for _ in range(5)))
+
+    assert [r.content for r in results] == ["first"] * 5
+    assert llm.inner.i == 1
+    stats = llm.llm_cache.stats
+    assert stats["misses"] == 1
+    assert stats["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_serves_before_disk(tmp_path: Path):
+    cache = LLMCache(cache_dir=tmp_path / "cache", memory_size=1)
+    await cache.aset("a", "1")
+    await cache.aset("b", "2")
+
+    assert await cache.aget("b") == "2"
+    assert await cache.aget("a") == "1"
+    assert cache.stats["memory_hits"] == 1
+    assert cache.stats["disk_hits"] == 1
+    assert cache.stats["memory_entries"] == 1
+
+    reopened = LLMCache(cache_dir=tmp_path / "cache")
+    assert reopened.get("b") == "2"
+    assert reopened.get("b") == "2"
+    assert reopened.stats["hits"] == 2
+    assert reopened.stats["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_call_is_not_cached_and_fails_waiters(tmp_path: Path):
+    cache = LLMCache(cache_dir=tmp_path / "cache")
+    release = asyncio.Event()
+
+    async def boom() -> str:
+        await release.wait()
+        raise RuntimeError("provider down")
+
+    calls = [asyncio.create_task(cache.aget_or_compute("k", boom)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    release.set()
+    outcomes = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+    assert await cache.aget("k") is None
+
+
+def test_normalized_key_ignores_formatting_and_comments():
+    a = "Review:\n```python\ndef f(x):\n    return x+1\n```"
+    b = "Review:\n```python\n# bump\ndef f(x):\n\n    return x + 1  # inc\n```"
+    c = "Review:\n```python\ndef f(x):\n    return x + 2\n```"
+
+    assert normalize_code(a) == normalize_code(b)
+    assert normalize_code(a) != normalize_code(c)
+    assert normalize_code("```\nif (x)  {y;}\n```") == normalize_code("```\nif (x) {y;}\n```")
+
+
+@pytest.mark.asyncio
+async def test_normalized_alias_serves_reformatted_code(tmp_path: Path):
+    llm = _cached(tmp_path, ["first", "second"], normalize_code=True)
+
+    r1 = await llm.ainvoke("```python\nx = 1\n```")
+    r2 = await llm.ainvoke("```python\nx  =  1   # same\n```")
+
+    assert r2.content == r1.content == "first"
+    assert llm.inner.i == 1
+    assert llm.llm_cache.stats["normalized_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_tier_serves_near_duplicate_prompts(tmp_path: Path):
+    class WordEmbeddings(DeterministicFakeEmbedding):
+        def embed_query(self, text: str) -> list[float]:
+            return [float(text.count(w)) for w in ("login", "token", "parse")] + [1.0]
+
+    pipeline = EmbeddingPipeline(WordEmbeddings(size=4))
+    cache = LLMCache(
+        cache_dir=tmp_path / "cache",
+        semantic=SemanticCacheIndex(pipeline, tmp_path / "semantic", threshold=0.99),
+    )
+    llm = CachedChatModel(
+        inner=FakeListChatModel(responses=["a", "b", "c"]),
+        llm_cache=cache,
+        model_id="openai/gpt-5.2",
+    )
+    system = SystemMessage(content="sys")
+
+    await llm.ainvoke([system, HumanMessage(content="how does login use the token?")])
+    near = await llm.ainvoke([system, HumanMessage(content="How does login use the token")])
+    other_system = await llm.ainvoke(
+        [SystemMessage(content="other"), HumanMessage(content="how does login use the token")]
+    )
+
+    assert near.content == "a"
+    assert other_system.content == "b"
+    assert cache.stats["semantic_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_miss_embeds_the_prompt_once(tmp_path: Path):
+    class CountingIndex(SemanticCacheIndex):
+        embedded = 0
+
+        async def embed(self, text):
+            self.embedded += 1
+            return await super().embed(text)
+
+    index = CountingIndex(
+        EmbeddingPipeline(DeterministicFakeEmbedding(size=8)), tmp_path / "semantic"
+    )
+    llm = CachedChatModel(
+        inner=FakeListChatModel(responses=["a", "b"]),
+        llm_cache=LLMCache(cache_dir=tmp_path / "cache", semantic=index),
+        model_id="openai/gpt-5.2",
+    )
+
+    await llm.ainvoke("first prompt")
+    assert index.embedded == 1
+    assert "".join([c.content async for c in llm.astream("second prompt")]) == "b"
+    assert index.embedded == 2
+    assert len(index._store) == 2
+
+
+def test_semantic_index_never_compares_vectors_across_embedders(tmp_path: Path):
+    class OtherEmbedding(DeterministicFakeEmbedding):
+        pass
+
+    first = SemanticCacheIndex(
+        EmbeddingPipeline(DeterministicFakeEmbedding(size=8)), tmp_path, threshold=0.0
+    )
+    vector = np.ones(8, dtype=np.float32) / np.sqrt(8)
+    first.add("ns", vector, "k1")
+    first.add("ns", vector, "k2")
+    assert first.search("ns", vector) == "k1"
+
+    wider = SemanticCacheIndex(
+        EmbeddingPipeline(DeterministicFakeEmbedding(size=16)), tmp_path, threshold=0.0
+    )
+    assert wider.search("ns", np.ones(16, dtype=np.float32)) is None
+    other = SemanticCacheIndex(EmbeddingPipeline(OtherEmbedding(size=8)), tmp_path, threshold=0.0)
+    assert other.search("ns", vector) is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_failure_is_a_miss(tmp_path: Path):
+    class BrokenIndex(SemanticCacheIndex):
+        def search(self, namespace, vector):
+            raise ValueError("matmul: dimension mismatch")
+
+    index = BrokenIndex(EmbeddingPipeline(DeterministicFakeEmbedding(size=8)), tmp_path / "s")
+    llm = CachedChatModel(
+        inner=FakeListChatModel(responses=["a"]),
+        llm_cache=LLMCache(cache_dir=tmp_path / "cache", semantic=index),
+        model_id="openai/gpt-5.2",
+    )
+
+    assert (await llm.ainvoke("prompt")).content == "a"
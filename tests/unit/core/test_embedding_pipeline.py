@@ -0,0 +1,88 @@
+"""Tests for the batched, cached embedding pipeline."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from neuralscope.core.embeddings.pipeline import EmbeddingCache, EmbeddingPipeline
+
+
+class _RecordingEmbeddings(DeterministicFakeEmbedding):
+    batches: list[list[str]]
+    failures: int = 0
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("rate limited")
+        self.batches.append(texts)
+        return await super().aembed_documents(texts)
+
+
+@pytest.mark.asyncio
+async def test_batches_and_dedupes_identical_texts():
+    embeddings = _RecordingEmbeddings(size=8, batches=[])
+    pipeline = EmbeddingPipeline(embeddings, batch_size=2, concurrency=2)
+
+    vectors = await pipeline.embed_documents(["a", "b", "a", "c", "b"])
+
+    assert vectors.shape == (5, 8)
+    assert (vectors[0] == vectors[2]).all()
+    assert sorted(t for batch in embeddings.batches for t in batch) == ["a", "b", "c"]
+    assert all(len(batch) <= 2 for batch in embeddings.batches)
+    assert pipeline.stats.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_embeds_only_new_texts(tmp_path: Path):
+    texts = [f"def f{i}(): pass" for i in range(20)]
+    first = _RecordingEmbeddings(size=8, batches=[])
+    await EmbeddingPipeline(first, cache=EmbeddingCache(tmp_path)).embed_documents(texts)
+
+    second = _RecordingEmbeddings(size=8, batches=[])
+    pipeline = EmbeddingPipeline(second, cache=EmbeddingCache(tmp_path))
+    vectors = await pipeline.embed_documents([*texts[:19], "def changed(): pass"])
+
+    assert second.batches == [["def changed(): pass"]]
+    assert pipeline.stats.cache_hits == 19
+    assert vectors.shape == (20, 8)
+
+
+@pytest.mark.asyncio
+async def test_retries_failed_batches():
+    embeddings = _RecordingEmbeddings(size=8, batches=[], failures=2)
+    pipeline = EmbeddingPipeline(embeddings, max_retries=2, retry_delay=0)
+
+    vectors = await pipeline.embed_documents(["x"])
+
+    assert vectors.shape == (1, 8)
+    assert pipeline.stats.retries == 2
+
+    embeddings.failures = 1
+    with pytest.raises(ConnectionError):
+        await EmbeddingPipeline(embeddings, max_retries=0).embed_documents(["y"])
+
+
+@pytest.mark.asyncio
+async def test_cache_is_read_and_written_off_the_event_loop(tmp_path: Path):
+    calls: list[tuple[str, int, bool]] = []
+
+    class ThreadCheckingCache(EmbeddingCache):
+        def get_many(self, keys):
+            calls.append(("get", len(keys), threading.current_thread() is threading.main_thread()))
+            return super().get_many(keys)
+
+        def put_many(self, vectors):
+            calls.append(
+                ("put", len(vectors), threading.current_thread() is threading.main_thread())
+            )
+            super().put_many(vectors)
+
+    pipeline = EmbeddingPipeline(
+        _RecordingEmbeddings(size=8, batches=[]), batch_size=2, cache=ThreadCheckingCache(tmp_path)
+    )
+    await pipeline.embed_documents(["a", "b", "a", "c"])
+
+    assert sorted(calls) == [("get", 3, False), ("put", 1, False), ("put", 2, False)]
@@ -0,0 +1,76 @@
+"""Tests for lazy, structured logging."""
+
+import io
+import json
+import logging
+
+from neuralscope.core.log_context import LogContextRepository
+from neuralscope.core.logging import (
+    JsonFormatter,
+    KeyValues,
+    setup_logging,
+    shutdown_logging,
+    truncate,
+)
+from neuralscope.core.settings import Settings
+
+
+class _Expensive:
+    def __init__(self) -> None:
+        self.rendered = 0
+
+    def __str__(self) -> str:
+        self.rendered += 1
+        return "expensive"
+
+
+def test_disabled_level_never_renders_values():
+    logger = logging.getLogger("neuralscope.log_context")
+    previous = logger.level
+    logger.setLevel(logging.WARNING)
+    value = _Expensive()
+    try:
+        log = LogContextRepository("review_file")
+        log.emit_input(path=value)
+        log.emit_result(result="success", detail=value)
+    finally:
+        logger.setLevel(previous)
+    assert value.rendered == 0
+
+
+def test_truncate_bounds_strings_and_collections():
+    assert truncate("x" * 10, max_chars=4) == "xxxx... (6 more chars)"
+    assert truncate(list(range(5)), max_items=2) == [0, 1, "... 3 more"]
+    assert truncate({"a": "y" * 9}, max_chars=3) == {"a": "yyy... (6 more chars)"}
+    assert truncate(3.5) == 3.5
+    assert str(KeyValues({"files": ["a.py", "b.py"], "n": 2})) == "files=['a.py', 'b.py'] n=2"
+
+
+def test_json_formatter_emits_fields():
+    record = logging.LogRecord("neuralscope.x", logging.INFO, __file__, 1, "hi %s", ("you",), None)
+    record.fields = {"event": "use_case_input", "context": {"changed_files": ["f"] * 30}}
+
+    data = json.loads(JsonFormatter(max_items=3).format(record))
+
+    assert (data["level"], data["logger"], data["message"]) == ("INFO", "neuralscope.x", "hi you")
+    assert data["event"] == "use_case_input"
+    assert data["context"]["changed_files"] == ["f", "f", "f", "... 27 more"]
+
+
+def test_setup_logging_writes_json_lines_through_the_queue(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stderr", stream)
+    shutdown_logging()
+    setup_logging(Settings(_env_file=None, log_format="json", log_level="INFO"))
+    try:
+        LogContextRepository("ask").emit_result(result="success", sources=["a.py"])
+    finally:
+        shutdown_logging()
+
+    (line,) = stream.getvalue().splitlines()
+    data = json.loads(line)
+    assert data["event"] == "use_case_result"
+    assert data["use_case"] == "ask"
+    assert data["result"] == "success"
+    assert data["context"] == {"sources": ["a.py"]}
+    assert logging.getLogger("neuralscope").handlers == []
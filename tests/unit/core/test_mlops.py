@@ -2,8 +2,11 @@
 
 import time
 
+import numpy as np
+import pytest
+
 from neuralscope.core.cache import LLMCache
-from neuralscope.core.tracing import Tracer, TraceSpan
+from neuralscope.core.tracing import LogHistogram, Tracer, TraceSpan
 
 
 def test_cache_key_deterministic():
@@ -55,3 +58,35 @@ def test_tracer_max_spans():
     for i in range(10):
         tracer.start_span(f"op_{i}", "model")
     assert len(tracer.spans) == 5
+
+
+def test_tracer_stats_outlive_the_span_buffer():
+    tracer = Tracer(max_spans=5)
+    for i in range(10):
+        tracer.start_span("review", "model").finish(error="boom" if i % 2 else None)
+
+    stats = tracer.stats
+    assert len(tracer.spans) == 5
+    assert stats["total_calls"] == 10
+    assert stats["errors"] == 5
+    assert stats["features"]["review"]["calls"] == 10
+    assert not hasattr(tracer.spans[0], "__dict__")
+
+
+def test_span_is_counted_once():
+    tracer = Tracer()
+    span = tracer.start_span("docs", "model")
+    span.finish()
+    span.finish(error="late")
+    assert tracer.stats["features"]["docs"]["calls"] == 1
+
+
+def test_log_histogram_quantiles_within_accuracy():
+    values = sorted(np.random.default_rng(0).lognormal(5, 1.5, 20_000).tolist())
+    histogram = LogHistogram(accuracy=0.01)
+    for v in values:
+        histogram.add(v)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.01)
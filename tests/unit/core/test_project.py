@@ -0,0 +1,99 @@
+"""Tests for the shared project snapshot."""
+
+from pathlib import Path
+
+import pytest
+
+from neuralscope.core.project import ProjectSnapshot, SnapshotRegistry
+from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    FileIndexer,
+)
+from neuralscope.features.health_dashboard.data.datasource.complexity_analyzer.implementation import (  # noqa: E501
+    ComplexityAnalyzer,
+)
+
+
+def _write(root: Path, rel: str, content: str = "x = 1\n") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _rels(snapshot: ProjectSnapshot) -> list[str]:
+    return [f.rel for f in snapshot.files]
+
+
+def test_walk_skips_builtin_dirs_and_sorts(tmp_path: Path):
+    _write(tmp_path, "b.py")
+    _write(tmp_path, "a/z.py")
+    _write(tmp_path, ".venv/lib/site.py")
+    _write(tmp_path, "node_modules/x.py")
+    _write(tmp_path, "notes.txt")
+
+    assert _rels(ProjectSnapshot(tmp_path)) == ["a/z.py", "b.py"]
+
+
+def test_walk_applies_gitignore(tmp_path: Path):
+    (tmp_path / ".gitignore").write_text("# generated\nbuild/\n/top.py\n*_pb2.py\n!keep_pb2.py\n")
+    _write(tmp_path, "build/gen.py")
+    _write(tmp_path, "top.py")
+    _write(tmp_path, "pkg/top.py")
+    _write(tmp_path, "pkg/api_pb2.py")
+    _write(tmp_path, "pkg/keep_pb2.py")
+    _write(tmp_path, "pkg/sub/.gitignore", "local.py\n")
+    _write(tmp_path, "pkg/sub/local.py")
+    _write(tmp_path, "local.py")
+
+    assert _rels(ProjectSnapshot(tmp_path)) == ["local.py", "pkg/keep_pb2.py", "pkg/top.py"]
+    assert len(ProjectSnapshot(tmp_path, use_gitignore=False).files) == 7
+
+
+def test_read_and_parse_are_memoized(tmp_path: Path):
+    _write(tmp_path, "a.py", "def f(): pass\n")
+    _write(tmp_path, "broken.py", "def broken(:\n")
+    snapshot = ProjectSnapshot(tmp_path)
+    a, broken = snapshot.files
+
+    source = snapshot.read(a)
+    (tmp_path / "a.py").write_text("changed\n")
+    assert snapshot.read(a) == source
+    assert snapshot.parse(a) is snapshot.parse(a)
+    with pytest.raises(SyntaxError):
+        snapshot.parse(broken)
+
+
+def test_registry_revalidates_changed_files(tmp_path: Path):
+    _write(tmp_path, "a.py", "a = 1\n")
+    _write(tmp_path, "b.py", "b = 1\n")
+    snapshots = SnapshotRegistry()
+    snapshot = snapshots.get(tmp_path)
+    _, b = snapshot.files
+    tree = snapshot.parse(b)
+
+    (tmp_path / "a.py").write_text("a = 'edited'\n")
+    _write(tmp_path, "c.py")
+    assert snapshots.get(tmp_path) is snapshot
+    new_a, new_b, c = snapshot.files
+
+    assert snapshot.read(new_a) == "a = 'edited'\n"
+    assert snapshot.parse(new_b) is tree
+    assert c.rel == "c.py"
+
+
+@pytest.mark.asyncio
+async def test_features_share_one_read_per_file(tmp_path: Path, monkeypatch):
+    _write(tmp_path, "app.py", "def main():\n    if True:\n        pass\n")
+    reads: list[str] = []
+    real = Path.read_text
+
+    def counting(self: Path, *args, **kwargs) -> str:
+        reads.append(self.name)
+        return real(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting)
+    snapshots = SnapshotRegistry()
+
+    FileIndexer(snapshots=snapshots).index(str(tmp_path))
+    await ComplexityAnalyzer(snapshots).analyze(str(tmp_path))
+
+    assert reads == ["app.py"]
@@ -0,0 +1,143 @@
+"""Tests for nested use-case spans and OTLP span export."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from neuralscope.core.llm.model_registry import ModelRegistry
+from neuralscope.core.llm.traced_model import TracedChatModel
+from neuralscope.core.log_context import LogContextRepository
+from neuralscope.core.settings import Settings
+from neuralscope.core.trace_export import (
+    BatchSpanProcessor,
+    JsonlExporter,
+    OtlpHttpExporter,
+    SpanExporter,
+    span_processors,
+)
+from neuralscope.core.tracing import Tracer, TraceSpan
+
+
+async def _traced_use_case(tracer: Tracer, *, fail: bool = False) -> None:
+    llm = TracedChatModel(
+        inner=FakeListChatModel(responses=["ok"]), tracer=tracer, model_id="m", feature="review"
+    )
+    log = LogContextRepository("review_file", tracer=tracer)
+    log.emit_input(path="a.py", changed_files=["x.py"] * 200)
+    await llm.ainvoke("prompt")
+    if fail:
+        log.emit_result(result="error", reason="llm_failed")
+    else:
+        log.emit_result(result="success", score=7)
+
+
+async def _traced_call(tracer: Tracer) -> None:
+    llm = TracedChatModel(inner=FakeListChatModel(responses=["ok"]), tracer=tracer, model_id="m")
+    await llm.ainvoke("prompt")
+
+
+@pytest.mark.asyncio
+async def test_llm_spans_nest_under_the_use_case_span():
+    tracer = Tracer()
+    await _traced_use_case(tracer)
+    await _traced_call(tracer)
+
+    root, child, outside = tracer.spans
+    assert (root.kind, root.operation, child.kind) == ("use_case", "review_file", "llm")
+    assert (child.trace_id, child.parent_id) == (root.trace_id, root.span_id)
+    assert root.parent_id is None and outside.parent_id is None
+    assert outside.trace_id != root.trace_id
+    assert root.metadata["result"] == "success"
+    assert len(root.metadata["changed_files"]) < 300
+    assert set(tracer.stats["features"]) == {"review", "llm"}
+
+
+@pytest.mark.asyncio
+async def test_jsonl_exporter_writes_otlp_requests(tmp_path: Path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer()
+    tracer.add_processor(BatchSpanProcessor(JsonlExporter(path), schedule_delay=60))
+    await _traced_use_case(tracer, fail=True)
+    tracer.shutdown()
+
+    (line,) = path.read_text().splitlines()
+    spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child, root = spans
+    assert child["name"] == "chat m"
+    assert child["parentSpanId"] == root["spanId"]
+    assert root["status"] == {"code": 2, "message": "llm_failed"}
+    attributes = {a["key"]: a["value"] for a in child["attributes"]}
+    assert attributes["neuralscope.feature"] == {"stringValue": "review"}
+    assert attributes["gen_ai.usage.input_tokens"] == {"intValue": "0"}
+
+
+def test_otlp_http_exporter_posts_json():
+    received: list[tuple[str, dict]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.path, json.loads(body)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+    try:
+        exporter = OtlpHttpExporter(f"http://127.0.0.1:{server.server_port}/v1/traces")
+        span = TraceSpan(operation="docs", model="m")
+        span.finish()
+        exporter.export([span])
+    finally:
+        thread.join(timeout=5)
+        server.server_close()
+
+    ((path, payload),) = received
+    assert path == "/v1/traces"
+    assert payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["traceId"] == span.trace_id
+
+
+def test_full_queue_drops_spans_instead_of_blocking():
+    release = threading.Event()
+
+    class Blocking(SpanExporter):
+        def __init__(self) -> None:
+            self.exported = 0
+
+        def export(self, spans: list[TraceSpan]) -> None:
+            release.wait(5)
+            self.exported += len(spans)
+
+    exporter = Blocking()
+    processor = BatchSpanProcessor(exporter, max_queue_size=4, max_batch_size=1, schedule_delay=0)
+    for _ in range(50):
+        processor.on_end(TraceSpan(operation="scan", model="m"))
+    release.set()
+    processor.shutdown()
+
+    assert processor.dropped > 0
+    assert exporter.exported + processor.dropped == 50
+
+
+def test_registries_share_one_processor_per_exporter(tmp_path: Path):
+    settings = Settings(_env_file=None, trace_jsonl_path=tmp_path / "traces.jsonl")
+    before = threading.active_count()
+
+    registries = [ModelRegistry(settings) for _ in range(5)]
+
+    (processor,) = span_processors(settings)
+    assert all(r.tracer._processors == [processor] for r in registries)
+    assert threading.active_count() <= before + 1
+
+    processor.shutdown()
+    (replacement,) = span_processors(settings)
+    assert replacement is not processor
+    replacement.shutdown()
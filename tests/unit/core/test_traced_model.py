@@ -0,0 +1,106 @@
+"""Tests for per-call LLM tracing."""
+
+import time
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeListChatModel,
+    GenericFakeChatModel,
+)
+from langchain_core.messages import AIMessage
+
+from neuralscope.core.llm.model_registry import ModelRegistry
+from neuralscope.core.llm.traced_model import TracedChatModel
+from neuralscope.core.settings import Settings
+from neuralscope.core.tracing import Tracer
+
+
+def _usage(content: str, input_tokens: int, output_tokens: int) -> AIMessage:
+    return AIMessage(
+        content=content,
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_registry_traces_calls_with_feature_file_and_cache_hits(tmp_path: Path, monkeypatch):
+    settings = Settings(_env_file=None, cache_dir=tmp_path, llm_prices={"gpt-test": (1.0, 2.0)})
+    registry = ModelRegistry(settings)
+    inner = GenericFakeChatModel(messages=iter([_usage("answer", 1000, 500)]))
+    monkeypatch.setattr(registry, "_create", lambda _: inner)
+    llm = registry.get("openai/gpt-test", feature="review")
+
+    first = await llm.ainvoke("prompt", config={"metadata": {"file": "a.py"}})
+    second = await llm.ainvoke("prompt", config={"metadata": {"file": "a.py"}})
+
+    assert first.content == second.content == "answer"
+    miss, hit = registry.tracer.spans
+    assert (miss.operation, miss.model, miss.metadata) == (
+        "review",
+        "openai/gpt-test",
+        {"file": "a.py"},
+    )
+    assert (miss.input_tokens, miss.output_tokens, miss.cache_hit) == (1000, 500, False)
+    assert miss.cost_usd == pytest.approx(0.002)
+    assert (hit.cache_hit, hit.cost_usd, hit.input_tokens) == (True, 0.0, 0)
+
+    review = registry.tracer.stats["features"]["review"]
+    assert review["calls"] == 2
+    assert review["cache_hits"] == 1
+    assert review["input_tokens"] == 1000
+
+
+@pytest.mark.asyncio
+async def test_failed_call_is_recorded_and_reraised():
+    tracer = Tracer()
+    llm = TracedChatModel(inner=FakeListChatModel(responses=[]), tracer=tracer, model_id="m")
+
+    with pytest.raises(IndexError):
+        await llm.ainvoke("prompt")
+
+    (span,) = tracer.spans
+    assert span.error is not None
+    assert span.end_time > 0
+    assert span.cache_hit is None
+
+
+@pytest.mark.asyncio
+async def test_stream_records_time_to_first_token():
+    tracer = Tracer()
+    inner = GenericFakeChatModel(messages=iter([AIMessage(content="one two three")]))
+    llm = TracedChatModel(inner=inner, tracer=tracer, model_id="m", feature="ask")
+
+    text = "".join([str(chunk.content) async for chunk in llm.astream("prompt")])
+
+    assert text == "one two three"
+    (span,) = tracer.spans
+    assert span.ttft_ms is not None
+    assert 0 <= span.ttft_ms <= span.duration_ms
+
+
+def test_stats_report_percentiles_per_feature():
+    tracer = Tracer()
+    for ms in range(1, 101):
+        span = tracer.start_span("docs", "m")
+        span.start_time, span.input_tokens = time.time() - ms / 1000, ms * 10
+        span.finish()
+    tracer.start_span("scan", "m")  # still running: counted, but not in percentiles
+
+    stats = tracer.stats
+    docs = stats["features"]["docs"]
+    assert stats["total_calls"] == 101
+    # Histogram buckets are within 1%, plus the time spent finishing each span.
+    assert docs["latency_ms"]["p50"] == pytest.approx(50, rel=0.03)
+    assert docs["latency_ms"]["p95"] == pytest.approx(95, rel=0.03)
+    assert docs["latency_ms"]["p99"] == pytest.approx(99, rel=0.03)
+    assert docs["tokens"] == {
+        "p50": pytest.approx(500, rel=0.01),
+        "p95": pytest.approx(950, rel=0.01),
+        "p99": pytest.approx(990, rel=0.01),
+    }
+    assert "scan" not in stats["features"]
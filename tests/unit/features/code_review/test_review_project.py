@@ -0,0 +1,124 @@
+"""Tests for the review_project use case."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from neuralscope.core.log_context import LogContextRepository
+from neuralscope.features.code_review.domain.entities.review import ReviewResult
+from neuralscope.features.code_review.domain.repository.reviewer import (
+    GetReviewErrorResult,
+    GetReviewSuccessResult,
+    IReviewerRepository,
+)
+from neuralscope.features.code_review.domain.use_cases.review_project.use_case import (
+    ReviewProjectParams,
+    ReviewProjectUseCase,
+    is_project_target,
+)
+
+
+class ScoringReviewerRepo(IReviewerRepository):
+    """Scores each file with the number in its source; "fail" makes the review fail."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def review_file(self, file_path, source):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            value = source.split("=")[1].strip()
+            if value == "fail":
+                return GetReviewErrorResult("LLM timeout")
+            # Higher scores finish first, so completion order differs from path order.
+            await asyncio.sleep(0.01 * (10 - float(value)))
+            return GetReviewSuccessResult(
+                ReviewResult(file_path=file_path, score=float(value), summary="ok")
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def review_diff(self, diff):
+        raise NotImplementedError
+
+
+def _project(root: Path) -> None:
+    (root / "pkg").mkdir()
+    (root / "a.py").write_text("x = 9\n")
+    (root / "b.py").write_text("x = 3\n")
+    (root / "pkg" / "c.py").write_text("x = fail\n")
+    (root / "pkg" / "d.py").write_text("x = 8.5\n")
+    (root / "empty.py").write_text("\n")
+    (root / "notes.txt").write_text("x = 1\n")
+
+
+def _use_case(repo, on_file_reviewed=None) -> ReviewProjectUseCase:
+    return ReviewProjectUseCase(
+        reviewer_repo=repo,
+        log_context_repository=LogContextRepository("review_project"),
+        on_file_reviewed=on_file_reviewed,
+    )
+
+
+@pytest.mark.asyncio
+async def test_review_directory_aggregates_reviews(tmp_path: Path):
+    _project(tmp_path)
+    repo = ScoringReviewerRepo()
+    completed: list[tuple[str, float | None]] = []
+
+    uc = _use_case(
+        repo, lambda file, review: completed.append((file, review.score if review else None))
+    )
+    result = await uc(ReviewProjectParams(target=str(tmp_path), max_concurrency=2))
+
+    assert result.is_success()
+    report = result.report
+    assert [r.file_path for r in report.reviews] == ["a.py", "b.py", str(Path("pkg/d.py"))]
+    assert report.errors == {str(Path("pkg/c.py")): "LLM timeout"}
+    assert report.file_count == 4
+    assert report.average_score == pytest.approx(6.83)
+    assert report.score_distribution[8] == report.score_distribution[9] == 1
+    assert report.failing_files == ["b.py"]
+    assert not report.passed
+    assert repo.max_in_flight == 2
+    assert completed == [
+        ("a.py", 9.0),
+        (str(Path("pkg/c.py")), None),
+        (str(Path("pkg/d.py")), 8.5),
+        ("b.py", 3.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_review_glob_selects_matching_files(tmp_path: Path):
+    _project(tmp_path)
+
+    result = await _use_case(ScoringReviewerRepo())(
+        ReviewProjectParams(target=str(tmp_path / "pkg" / "*.py"))
+    )
+
+    assert result.is_success()
+    assert [r.file_path for r in result.report.reviews] == ["d.py"]
+    assert list(result.report.errors) == ["c.py"]
+
+
+@pytest.mark.asyncio
+async def test_review_glob_without_matches(tmp_path: Path):
+    _project(tmp_path)
+
+    result = await _use_case(ScoringReviewerRepo())(
+        ReviewProjectParams(target=str(tmp_path / "**" / "missing_*.py"))
+    )
+
+    assert not result.is_success()
+    assert "No directory or files match" in result.message
+
+
+def test_is_project_target(tmp_path: Path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    assert is_project_target(str(tmp_path))
+    assert is_project_target(str(tmp_path / "*.py"))
+    assert not is_project_target(str(tmp_path / "a.py"))
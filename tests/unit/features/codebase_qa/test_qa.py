@@ -1,15 +1,58 @@
 """Tests for codebase Q&A: file indexer, LLM answerer, entities."""
 
 import json
+import sys
+import types
 from pathlib import Path
 
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from qdrant_client import AsyncQdrantClient
+
+from neuralscope.core.embeddings.pipeline import EmbeddingPipeline
+from neuralscope.core.log_context import LogContextRepository
+from neuralscope.features.codebase_qa.data.datasource.context_packer.implementation import (
+    ContextPacker,
+)
 from neuralscope.features.codebase_qa.data.datasource.file_indexer.implementation import (
+    CodeChunk,
     FileIndexer,
 )
+from neuralscope.features.codebase_qa.data.datasource.index_store.implementation import (
+    IndexEntry,
+    QAIndexStore,
+)
+from neuralscope.features.codebase_qa.data.datasource.lexical_index.implementation import (
+    BM25Index,
+    tokenize,
+)
 from neuralscope.features.codebase_qa.data.datasource.llm_answerer.implementation import (
+    AnswerTextDecoder,
     LlmAnswerer,
 )
+from neuralscope.features.codebase_qa.data.datasource.local_vector_store.implementation import (
+    LocalChunkStore,
+)
+from neuralscope.features.codebase_qa.data.datasource.reranker.implementation import (
+    CrossEncoderReranker,
+    LlmReranker,
+)
+from neuralscope.features.codebase_qa.data.datasource.vector_store.implementation import (
+    QdrantChunkStore,
+)
+from neuralscope.features.codebase_qa.data.repository.qa import (
+    QARepository,
+    reciprocal_rank_fusion,
+)
 from neuralscope.features.codebase_qa.domain.entities.answer import Answer, SourceReference
+from neuralscope.features.codebase_qa.domain.use_cases.ask_question.use_case import (
+    AskQuestionParams,
+)
+from neuralscope.features.codebase_qa.domain.use_cases.stream_answer.use_case import (
+    StreamAnswerUseCase,
+)
 
 
 def test_answer_source_count():
@@ -59,6 +102,46 @@ def test_file_indexer_to_source_ref(tmp_path: Path):
     assert ref.line_start > 0
 
 
+def test_file_indexer_covers_every_line_once(tmp_path: Path):
+    methods = "".join(f"    def m{i}(self):\n        return {i}\n\n" for i in range(5))
+    (tmp_path / "svc.py").write_text(
+        "import os\n\n"
+        "class Service:\n"
+        "    limit = 3\n\n"
+        f"{methods}"
+        "def helper():\n    return os.sep\n\n"
+        "if __name__ == '__main__':\n    helper()\n"
+    )
+    source = (tmp_path / "svc.py").read_text().splitlines()
+
+    chunks = FileIndexer(max_chunk_lines=6).index(str(tmp_path))
+
+    covered = [n for c in chunks for n in range(c.line_start, c.line_end + 1)]
+    assert len(covered) == len(set(covered))
+    assert {n for n, line in enumerate(source, start=1) if line.strip()} <= set(covered)
+    assert all(c.line_end - c.line_start < 6 for c in chunks)
+    by_symbol = {c.symbol: c for c in chunks}
+    assert by_symbol["Service"].content.startswith("class Service:")
+    assert by_symbol["Service.m2"].parent == "Service"
+    assert by_symbol["helper"].parent is None
+    assert [c.content for c in chunks if c.symbol == ""] == [
+        "import os",
+        "if __name__ == '__main__':\n    helper()",
+    ]
+
+
+def test_file_indexer_splits_long_function_at_statements(tmp_path: Path):
+    body = "".join(f"    x{i} = {i}\n" for i in range(10))
+    (tmp_path / "long.py").write_text(f"def long():\n{body}    return x9\n")
+
+    chunks = FileIndexer(max_chunk_lines=4).index(str(tmp_path))
+
+    assert chunks[0].content.startswith("def long():")
+    assert all(c.symbol == "long" for c in chunks)
+    assert [c.parent for c in chunks[1:]] == ["long"] * (len(chunks) - 1)
+    assert sum(c.line_end - c.line_start + 1 for c in chunks) == 12
+
+
 def test_answerer_parse_valid():
     raw = json.dumps(
         {
@@ -87,3 +170,299 @@ def test_answerer_parse_malformed():
     result = answerer._parse("question?", "not json")
     assert result.confidence == 0.3
     assert "not json" in result.answer
+
+
+def _chunk(name: str, body: str) -> CodeChunk:
+    return CodeChunk(file_path=f"{name}.py", content=body, line_start=1, line_end=2)
+
+
+@pytest.mark.asyncio
+async def test_vector_store_returns_nearest_chunks():
+    store = QdrantChunkStore(
+        AsyncQdrantClient(location=":memory:"),
+        EmbeddingPipeline(DeterministicFakeEmbedding(size=32), batch_size=2),
+        batch_size=2,
+    )
+    chunks = [_chunk(f"m{i}", f"def f{i}():\n    return {i}") for i in range(5)]
+    await store.index("/project", chunks, await store.embed(chunks), generation="g1")
+
+    found = await store.search("/project", chunks[3].content, top_k=2)
+
+    assert len(found) == 2
+    assert found[0] == chunks[3]
+    assert await store.search("/other", "anything", top_k=2) == []
+
+
+class _FailingEmbeddings(DeterministicFakeEmbedding):
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        raise RuntimeError("no credentials")
+
+
+@pytest.mark.asyncio
+async def test_qa_falls_back_to_keyword_search(tmp_path: Path):
+    (tmp_path / "auth.py").write_text("def login(token):\n    return token\n")
+    (tmp_path / "math.py").write_text("def add(a, b):\n    return a + b\n")
+    seen: list[list[str]] = []
+
+    class RecordingAnswerer(LlmAnswerer):
+        async def answer(self, question: str, context_chunks: list[str]):
+            seen.append(context_chunks)
+            return await super().answer(question, context_chunks)
+
+    store = QdrantChunkStore(
+        AsyncQdrantClient(location=":memory:"),
+        EmbeddingPipeline(_FailingEmbeddings(size=8), max_retries=0),
+    )
+    answerer = RecordingAnswerer(FakeListChatModel(responses=['{"answer": "ok"}']))
+    repo = QARepository(FileIndexer(), answerer, vector_store=store, top_k=1)
+
+    answer = await repo.ask("how does login work", str(tmp_path))
+
+    assert answer.answer == "ok"
+    assert len(seen[0]) == 1
+    assert "def login" in seen[0][0]
+
+
+@pytest.mark.asyncio
+async def test_qa_context_expands_to_parent_header(tmp_path: Path):
+    methods = "".join(f"    def step{i}(self):\n        return {i}\n\n" for i in range(4))
+    (tmp_path / "flow.py").write_text(f'class Flow:\n    """Checkout flow."""\n\n{methods}')
+    repo = QARepository(
+        FileIndexer(max_chunk_lines=4),
+        LlmAnswerer(FakeListChatModel(responses=["{}"])),
+        top_k=1,
+    )
+
+    context = await repo._context("what does step2 return", str(tmp_path))
+
+    assert "def step2" in context[0]
+    assert context[1].endswith('class Flow:\n    """Checkout flow."""')
+
+
+class _CountingEmbeddings(DeterministicFakeEmbedding):
+    embedded: list[str]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return await super().aembed_documents(texts)
+
+
+@pytest.mark.asyncio
+async def test_persistent_index_reembeds_only_changed_files(tmp_path: Path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("def alpha():\n    return 1\n")
+    (project / "b.py").write_text("def beta():\n    return 2\n")
+    store_dir = tmp_path / "qa_index"
+
+    async def index() -> list[str]:
+        embeddings = _CountingEmbeddings(size=16, embedded=[])
+        repo = QARepository(
+            FileIndexer(),
+            LlmAnswerer(FakeListChatModel(responses=["{}"])),
+            vector_store=QdrantChunkStore(
+                AsyncQdrantClient(location=":memory:"), EmbeddingPipeline(embeddings)
+            ),
+            index_store=QAIndexStore(store_dir),
+        )
+        assert await repo.index_project(str(project)) == 2
+        found = await repo._search("def beta():\n    return 2", str(project))
+        assert found[0].file_path == "b.py"
+        return embeddings.embedded
+
+    assert len(await index()) == 2
+    assert await index() == []
+
+    (project / "a.py").write_text("def alpha():\n    return 10\n")
+    assert await index() == ["def alpha():\n    return 10"]
+
+
+class _CountingLocalStore(LocalChunkStore):
+    writes = 0
+
+    async def index(self, project_path, chunks, vectors, *, generation):
+        type(self).writes += 1
+        await super().index(project_path, chunks, vectors, generation=generation)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_project_reuses_local_vectors_without_loading_them(tmp_path: Path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("def alpha():\n    return 1\n")
+
+    async def index() -> list[CodeChunk]:
+        repo = QARepository(
+            FileIndexer(),
+            LlmAnswerer(FakeListChatModel(responses=["{}"])),
+            vector_store=_CountingLocalStore(
+                tmp_path / "vectors", EmbeddingPipeline(DeterministicFakeEmbedding(size=16))
+            ),
+            index_store=QAIndexStore(tmp_path / "qa_index"),
+        )
+        await repo.index_project(str(project))
+        return await repo._search("alpha", str(project))
+
+    assert (await index())[0].file_path == "a.py"
+    assert (await index())[0].file_path == "a.py"
+    assert _CountingLocalStore.writes == 1
+
+    (project / "a.py").write_text("def alpha():\n    return 2\n")
+    await index()
+    assert _CountingLocalStore.writes == 2
+
+
+def test_index_store_maps_vectors_from_npy(tmp_path: Path):
+    store = QAIndexStore(tmp_path)
+    chunks = [_chunk("a", "x = 1"), _chunk("b", "y = 2")]
+    store.save("/p", "e", {"a.py": IndexEntry("d1", chunks, np.ones((2, 4), dtype=np.float32))})
+    store.save("/p", "e", {"a.py": IndexEntry("d2", chunks, np.zeros((2, 4), dtype=np.float32))})
+
+    entry = store.load("/p", "e")["a.py"]
+
+    assert entry.digest == "d2"
+    assert isinstance(entry.vectors.base, np.memmap)
+    assert not entry.vectors.any()
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    assert store.load("/p", "other-embedder") == {}
+
+
+def test_tokenize_splits_identifiers():
+    assert tokenize("class HTTPServer(user_repo)") == [
+        "class",
+        "http",
+        "server",
+        "httpserver",
+        "user",
+        "repo",
+        "user_repo",
+    ]
+
+
+def test_bm25_ranks_identifier_matches():
+    chunks = [
+        _chunk("auth", "class UserRepository:\n    def save(self, user): ..."),
+        _chunk("math", "def add(a, b):\n    return a + b"),
+        _chunk("views", "def render(request):\n    return repository_template"),
+    ]
+    index = BM25Index(chunks)
+
+    results = index.search("How does the user repository save?", top_k=2)
+
+    assert [chunk.file_path for chunk, _ in results] == ["auth.py", "views.py"]
+    assert index.search("how does it work", top_k=2) == []
+
+
+def test_rrf_rewards_agreement_across_lists():
+    a, b, c, d = (_chunk(n, n) for n in "abcd")
+    fused = reciprocal_rank_fusion([[a, b, c], [c, d, a]])
+    assert [x.file_path for x in fused] == ["a.py", "c.py", "b.py", "d.py"]
+
+
+@pytest.mark.asyncio
+async def test_llm_reranker_reorders_and_trims():
+    chunks = [_chunk(n, f"def {n}(): ...") for n in "abc"]
+    reranker = LlmReranker(FakeListChatModel(responses=["Ranking: [2, 0, 9, 2]"]))
+
+    assert await reranker.rerank("q", chunks, top_k=5) == [chunks[2], chunks[0]]
+    assert LlmReranker._parse("no idea", 3) is None
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_loads_lazily_and_falls_back_when_unavailable(monkeypatch):
+    loads: list[str] = []
+
+    class OfflineCrossEncoder:
+        def __init__(self, name: str) -> None:
+            loads.append(name)
+            raise OSError("offline")
+
+    monkeypatch.setitem(
+        sys.modules,
+        "sentence_transformers",
+        types.SimpleNamespace(CrossEncoder=OfflineCrossEncoder),
+    )
+    chunks = [_chunk(n, f"def {n}(): ...") for n in "abc"]
+    reranker = CrossEncoderReranker("some/model")
+    assert loads == []
+
+    assert await reranker.rerank("q", chunks, top_k=2) == chunks[:2]
+    assert await reranker.rerank("q", chunks, top_k=2) == chunks[:2]
+    assert loads == ["some/model"]
+
+
+def test_packer_drops_overlapping_chunks_and_respects_budget():
+    method = CodeChunk("svc.py", "    def login(self):\n        return token", 3, 4)
+    cls = CodeChunk("svc.py", "class Service:\n    x = 1\n    def login(self): ...", 1, 10)
+    other = CodeChunk("util.py", "def helper():\n    return 1", 1, 2)
+
+    packed = ContextPacker(token_budget=1000).pack("login", [method, cls, other])
+
+    assert [c.file_path for c in packed.chunks] == ["svc.py", "util.py"]
+    assert packed.blocks[0].startswith("# svc.py:3-4\n")
+    assert packed.tokens <= 1000
+
+
+def test_packer_trims_large_chunk_to_relevant_window():
+    body = [f"    value_{i} = compute({i})" for i in range(200)]
+    body[150] = "    token = refresh_token(session)"
+    chunk = CodeChunk("big.py", "class Big:\n" + "\n".join(body), 1, 201)
+
+    packed = ContextPacker(token_budget=200).pack("where is the token refreshed", [chunk])
+
+    block = packed.blocks[0]
+    assert "class Big:" in block
+    assert "refresh_token(session)" in block
+    assert "value_0 " not in block
+    assert packed.tokens <= 200
+
+
+@pytest.mark.asyncio
+async def test_answer_reports_prompt_tokens():
+    answerer = LlmAnswerer(FakeListChatModel(responses=['{"answer": "ok"}']))
+    answer = await answerer.answer("q", ["# a.py:1-2\ndef a(): ..."])
+    assert answer.prompt_tokens > 0
+
+
+def test_answer_text_decoder_handles_split_escapes():
+    raw = (
+        '{"confidence": 0.9, '
+        '"answer": "Uses \\"JWT\\"\\nsee caf\\u00e9 \\ud83d\\ude00", "sources": []}'
+    )
+    decoder = AnswerTextDecoder()
+    text = "".join(decoder.feed(raw[i : i + 3]) for i in range(0, len(raw), 3))
+    assert text == json.loads(raw)["answer"]
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_yields_text_then_result(tmp_path: Path):
+    (tmp_path / "auth.py").write_text("def login(token):\n    return token\n")
+    reply = json.dumps({"answer": "It checks the token.", "confidence": 0.8, "sources": []})
+    repo = QARepository(FileIndexer(), LlmAnswerer(FakeListChatModel(responses=[reply])))
+    uc = StreamAnswerUseCase(qa_repo=repo, log_context_repository=LogContextRepository("ask"))
+
+    events = [e async for e in uc(AskQuestionParams(question="login?", project=str(tmp_path)))]
+
+    deltas, result = events[:-1], events[-1]
+    assert len(deltas) > 1
+    assert "".join(deltas) == "It checks the token."
+    assert result.is_success()
+    assert result.answer.confidence == 0.8
+    assert result.answer.prompt_tokens > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ivf_min_rows", [1_000, 50])
+async def test_local_store_matches_exact_search(tmp_path: Path, ivf_min_rows: int):
+    pipeline = EmbeddingPipeline(DeterministicFakeEmbedding(size=32))
+    chunks = [_chunk(f"m{i}", f"def f{i}():\n    return {i}") for i in range(200)]
+    store = LocalChunkStore(tmp_path, pipeline, ivf_min_rows=ivf_min_rows, nprobe=64)
+    await store.index("/project", chunks, await store.embed(chunks), generation="g1")
+
+    reopened = LocalChunkStore(tmp_path, pipeline)
+    found = await reopened.search("/project", chunks[42].content, top_k=3)
+
+    assert found[0] == chunks[42]
+    assert len(found) == 3
+    assert await reopened.search("/other", "anything", top_k=3) == []
+    assert reopened._load(reopened._project_dir("/project")).vectors.dtype == np.float16
@@ -1,11 +1,22 @@
 """Tests for AST parser."""
 
+import json
+import os
 import textwrap
 from pathlib import Path
 
+import pytest
+
+from neuralscope.features.dependency_graph.data.datasource.ast_parser import (
+    implementation as ast_parser,
+)
 from neuralscope.features.dependency_graph.data.datasource.ast_parser.implementation import (
     AstParser,
 )
+from neuralscope.features.dependency_graph.data.datasource.parse_cache.implementation import (
+    CACHE_VERSION,
+    AstParseCache,
+)
 from neuralscope.features.dependency_graph.domain.entities.graph import NodeKind
 
 
@@ -80,3 +91,81 @@ def test_parse_handles_syntax_error(tmp_path: Path):
     parser = AstParser(tmp_path)
     nodes, edges = parser.parse()
     assert len(nodes) == 0
+
+
+def test_parallel_parse_matches_serial(tmp_path: Path):
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text('"""Package doc."""\n')
+    for i in range(12):
+        (pkg / f"mod{i}.py").write_text(
+            f"import os\nfrom pkg import mod{(i + 1) % 12}\n\n"
+            f"class C{i}:\n    def m(self):\n        pass\n\nasync def f{i}():\n    pass\n"
+        )
+    (pkg / "broken.py").write_text("def broken(:\n")
+
+    serial = AstParser(tmp_path).parse()
+    parallel = AstParser(tmp_path, workers=3).parse()
+
+    assert parallel == serial
+    assert len(serial[0]) == 1 + 12 * 4
+
+
+def test_parse_cache_reparses_only_changed_files(tmp_path: Path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("import os\n")
+    (project / "b.py").write_text("def helper(): pass\n")
+    cache = AstParseCache(tmp_path / "ast")
+
+    cold = AstParser(project, cache=cache).parse()
+
+    parsed: list[str] = []
+    real = ast_parser.parse_file_records
+
+    def counting(rel: str, source: str, tree=None):
+        parsed.append(rel)
+        return real(rel, source, tree)
+
+    monkeypatch.setattr(ast_parser, "parse_file_records", counting)
+
+    assert AstParser(project, cache=cache).parse() == cold
+    assert parsed == []
+
+    # Touched but identical content is revalidated by hash, not re-parsed.
+    os.utime(project / "a.py", ns=(0, 0))
+    assert AstParser(project, cache=cache).parse() == cold
+    assert parsed == []
+
+    (project / "b.py").write_text("class Changed: pass\n")
+    AstParser(project, cache=cache).parse()
+    assert parsed == ["b.py"]
+
+
+_NO_FILES = object()
+
+
+@pytest.mark.parametrize(
+    "files",
+    [None, _NO_FILES, [], {"a.py": [1, 2]}, {"a.py": [0, 0, "x", 5, [], None]}],
+    ids=["not-an-object", "no-files", "files-list", "short-entry", "bad-nodes"],
+)
+def test_parse_cache_ignores_wrongly_shaped_files(tmp_path: Path, files, caplog):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("import os\n")
+    cache = AstParseCache(tmp_path / "ast")
+    root = str(project.resolve())
+    cold = AstParser(project).parse()
+
+    payload: dict | list = {"version": CACHE_VERSION, "root": root}
+    if files is None:
+        payload = []
+    elif files is not _NO_FILES:
+        payload["files"] = files
+    cache._path(root).parent.mkdir(parents=True, exist_ok=True)
+    cache._path(root).write_text(json.dumps(payload))
+
+    assert cache.load(root) == {}
+    assert "Ignoring unreadable parse cache" in caplog.text
+    assert AstParser(project, cache=cache).parse() == cold
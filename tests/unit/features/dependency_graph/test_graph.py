@@ -0,0 +1,71 @@
+"""Tests for DependencyGraph lookup indexes."""
+
+import time
+
+import pytest
+
+from neuralscope.features.dependency_graph.data.repository.impact_analyzer import (
+    ImpactAnalyzerRepository,
+)
+from neuralscope.features.dependency_graph.domain.entities.graph import (
+    DependencyGraph,
+    GraphEdge,
+    GraphNode,
+    NodeKind,
+)
+
+
+def _module(node_id: str) -> GraphNode:
+    return GraphNode(id=node_id, name=node_id, kind=NodeKind.MODULE, file_path=f"{node_id}.py")
+
+
+def test_lookups_match_edge_order():
+    graph = DependencyGraph(
+        root_path="/p",
+        nodes=[_module("a"), _module("b"), _module("c")],
+        edges=[GraphEdge("a", "c"), GraphEdge("b", "c"), GraphEdge("a", "b")],
+    )
+    assert graph.get_node("b") == _module("b")
+    assert graph.get_node("missing") is None
+    assert graph.get_dependents("c") == ["a", "b"]
+    assert graph.get_dependencies("a") == ["c", "b"]
+
+
+def test_index_rebuilt_after_mutation():
+    graph = DependencyGraph(root_path="/p", nodes=[_module("a")])
+    assert graph.get_dependents("a") == []
+
+    graph.add_node(_module("b"))
+    graph.add_edge(GraphEdge("b", "a"))
+    assert graph.get_node("b") is not None
+    assert graph.get_dependents("a") == ["b"]
+
+    graph.edges.append(GraphEdge("c", "a"))
+    assert graph.get_dependents("a") == ["b", "c"]
+
+    graph.edges = [GraphEdge("x", "a")]
+    assert graph.get_dependents("a") == ["x"]
+
+
+def test_returned_lists_do_not_alias_index():
+    graph = DependencyGraph(root_path="/p", nodes=[_module("a")], edges=[GraphEdge("b", "a")])
+    graph.get_dependents("a").append("mutated")
+    assert graph.get_dependents("a") == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_impact_on_large_chain_is_fast():
+    size = 50_000
+    graph = DependencyGraph(
+        root_path="/p",
+        nodes=[_module(f"m{i}") for i in range(size)],
+        edges=[GraphEdge(f"m{i + 1}", f"m{i}") for i in range(size - 1)],
+    )
+    start = time.perf_counter()
+    report = await ImpactAnalyzerRepository().analyze(graph, ["m0.py"])
+    elapsed = time.perf_counter() - start
+
+    assert report.affected_count == size - 1
+    assert report.affected[0].distance == 1
+    assert report.affected[-1].distance == size - 1
+    assert elapsed < 5.0
@@ -1,10 +1,23 @@
 """Tests for LLM-based vulnerability scanning."""
 
+import asyncio
 import json
+from pathlib import Path
 
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from neuralscope.features.vulnerability_scan.data.datasource.findings_store.implementation import (
+    ScanFindingsStore,
+)
 from neuralscope.features.vulnerability_scan.data.datasource.llm_scanner.implementation import (
+    BATCH_SYSTEM_PROMPT,
+    PROMPT_VERSION,
+    SYSTEM_PROMPT,
     LlmSecurityScanner,
+    _prompt_version,
 )
+from neuralscope.features.vulnerability_scan.data.repository.scanner import ScannerRepository
 from neuralscope.features.vulnerability_scan.domain.entities.vulnerability import (
     Vulnerability,
     VulnReport,
@@ -101,10 +114,226 @@ def test_llm_scanner_parse_empty():
 
 def test_llm_scanner_parse_malformed():
     scanner = LlmSecurityScanner.__new__(LlmSecurityScanner)
-    vulns = scanner._parse("test.py", "not json at all")
-    assert vulns == []
+    assert scanner._parse("test.py", "not json at all") is None
+    assert scanner._parse("test.py", "[1, 2]") is None
+    assert scanner._parse("test.py", '{"vulnerabilities": null}') is None
 
 
 def test_llm_scanner_extract_json_fences():
     text = '```json\n{"vulnerabilities": []}\n```'
     assert LlmSecurityScanner._extract_json(text) == '{"vulnerabilities": []}'
+
+
+class SlowFakeScanner:
+    """Finishes files in reverse name order and records peak concurrency."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def scan_source(self, file_path: str, source: str) -> list[Vulnerability]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01 * (10 - int(Path(file_path).stem[-1])))
+        self.in_flight -= 1
+        return [
+            Vulnerability(
+                id="SEC-1",
+                title="eval",
+                severity=VulnSeverity.HIGH,
+                source=VulnSource.AI,
+                file_path=file_path,
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_scan_project_bounded_concurrency_and_ordered(tmp_path: Path):
+    for i in range(6):
+        (tmp_path / f"mod{i}.py").write_text("eval(input())\n")
+    (tmp_path / "empty.py").write_text("")
+
+    scanner = SlowFakeScanner()
+    completed: list[str] = []
+    repo = ScannerRepository(
+        scanner,
+        max_concurrency=3,
+        on_file_scanned=lambda file, _: completed.append(file),
+    )
+    report = await repo.scan_project(str(tmp_path))
+
+    assert scanner.peak == 3
+    assert [v.file_path for v in report.vulnerabilities] == [f"mod{i}.py" for i in range(6)]
+    assert sorted(completed) == [f"mod{i}.py" for i in range(6)]
+    assert completed != sorted(completed)
+
+
+class CountingScanner:
+    def __init__(self) -> None:
+        self.scanned: list[str] = []
+
+    async def scan_source(self, file_path: str, source: str) -> list[Vulnerability]:
+        self.scanned.append(file_path)
+        return [
+            Vulnerability(
+                id="SEC-1",
+                title="eval",
+                severity=VulnSeverity.HIGH,
+                source=VulnSource.AI,
+                file_path=file_path,
+                line=1,
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_scan_only_sends_changed_files(tmp_path: Path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("eval(input())\n")
+    (project / "b.py").write_text("exec(input())\n")
+    store = ScanFindingsStore(tmp_path / "store", model="openai/gpt-5.2", prompt_version="1")
+
+    first = CountingScanner()
+    await ScannerRepository(first, findings_store=store).scan_project(str(project))
+    assert sorted(first.scanned) == ["a.py", "b.py"]
+
+    (project / "b.py").write_text("exec(input())  # changed\n")
+    second = CountingScanner()
+    report = await ScannerRepository(second, findings_store=store).scan_project(str(project))
+
+    assert second.scanned == ["b.py"]
+    assert [v.file_path for v in report.vulnerabilities] == ["a.py", "b.py"]
+    assert "1 unchanged" in report.summary
+
+
+@pytest.mark.asyncio
+async def test_unparseable_reply_is_not_stored_as_clean(tmp_path: Path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("eval(input())\n")
+    store = ScanFindingsStore(tmp_path / "store", model="m", prompt_version="1")
+    llm = FakeListChatModel(
+        responses=["upstream 502 garbage", json.dumps({"vulnerabilities": [{"id": "SEC-1"}]})]
+    )
+
+    first = await ScannerRepository(LlmSecurityScanner(llm), findings_store=store).scan_project(
+        str(project)
+    )
+    second = await ScannerRepository(LlmSecurityScanner(llm), findings_store=store).scan_project(
+        str(project)
+    )
+
+    assert first.vulnerabilities == []
+    assert [v.id for v in second.vulnerabilities] == ["SEC-1"]
+    assert "0 unchanged, 1 LLM request(s)" in second.summary
+
+
+def test_findings_store_keyed_by_model_and_prompt_version(tmp_path: Path):
+    vulns = [Vulnerability(id="SEC-1", title="t", severity=VulnSeverity.LOW, source=VulnSource.AI)]
+    store = ScanFindingsStore(tmp_path, model="m1", prompt_version="1")
+    store.put("x = 1\n", vulns)
+
+    restored = store.get("moved.py", "x = 1\n")
+    assert restored is not None
+    assert restored[0].file_path == "moved.py"
+    assert restored[0].severity == VulnSeverity.LOW
+
+    assert ScanFindingsStore(tmp_path, model="m2", prompt_version="1").get("a", "x = 1\n") is None
+    assert ScanFindingsStore(tmp_path, model="m1", prompt_version="2").get("a", "x = 1\n") is None
+
+
+def test_prompt_version_follows_both_prompts():
+    assert _prompt_version(SYSTEM_PROMPT, BATCH_SYSTEM_PROMPT) == PROMPT_VERSION
+    assert _prompt_version(SYSTEM_PROMPT + " ", BATCH_SYSTEM_PROMPT) != PROMPT_VERSION
+    assert _prompt_version(SYSTEM_PROMPT, BATCH_SYSTEM_PROMPT + " ") != PROMPT_VERSION
+
+
+def test_plan_batches_respects_token_budget():
+    files = [("a.py", "x" * 400), ("b.py", "x" * 400), ("c.py", "x" * 400), ("big.py", "x" * 4000)]
+    batches = LlmSecurityScanner.plan_batches(files, token_budget=250)
+    assert [[path for path, _ in b] for b in batches] == [["a.py", "b.py"], ["c.py"], ["big.py"]]
+
+
+def test_llm_scanner_parse_batch_splits_by_file():
+    raw = json.dumps(
+        {
+            "files": [
+                {"file_path": "a.py", "vulnerabilities": [{"id": "SEC-1", "severity": "high"}]},
+                {"file_path": "b.py", "vulnerabilities": []},
+                {"file_path": "unexpected.py", "vulnerabilities": [{"id": "SEC-2"}]},
+            ]
+        }
+    )
+    scanner = LlmSecurityScanner.__new__(LlmSecurityScanner)
+    results = scanner._parse_batch({"a.py", "b.py", "c.py"}, raw)
+    assert set(results) == {"a.py", "b.py"}
+    assert results["a.py"][0].file_path == "a.py"
+    assert results["a.py"][0].severity == VulnSeverity.HIGH
+    assert results["b.py"] == []
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "[]",
+        '{"files": ["a.py"]}',
+        '{"files": null}',
+        '{"files": [{"file_path": ["a.py"]}, {"file_path": "a.py", "vulnerabilities": 3}]}',
+    ],
+)
+def test_llm_scanner_parse_batch_ignores_wrong_shapes(raw: str):
+    scanner = LlmSecurityScanner.__new__(LlmSecurityScanner)
+    assert scanner._parse_batch({"a.py"}, raw) == {}
+
+
+@pytest.mark.asyncio
+async def test_batched_scan_rescans_files_after_a_wrongly_shaped_reply(tmp_path: Path):
+    (tmp_path / "a.py").write_text("eval(input())\n")
+    (tmp_path / "b.py").write_text("x = 1\n")
+    single = json.dumps({"vulnerabilities": [{"id": "SEC-9"}]})
+    llm = FakeListChatModel(responses=['{"files": null}', single, single])
+
+    repo = ScannerRepository(LlmSecurityScanner(llm), max_concurrency=1, batch_token_budget=1000)
+    report = await repo.scan_project(str(tmp_path))
+
+    assert [v.file_path for v in report.vulnerabilities] == ["a.py", "b.py"]
+    assert "3 LLM request(s)" in report.summary
+
+
+@pytest.mark.asyncio
+async def test_batched_scan_falls_back_for_files_missing_from_response(tmp_path: Path):
+    (tmp_path / "a.py").write_text("eval(input())\n")
+    (tmp_path / "b.py").write_text("x = 1\n")
+    batch_response = json.dumps(
+        {"files": [{"file_path": "a.py", "vulnerabilities": [{"id": "SEC-1"}]}]}
+    )
+    single_response = json.dumps({"vulnerabilities": [{"id": "SEC-9"}]})
+    llm = FakeListChatModel(responses=[batch_response, single_response])
+
+    repo = ScannerRepository(LlmSecurityScanner(llm), max_concurrency=1, batch_token_budget=1000)
+    report = await repo.scan_project(str(tmp_path))
+
+    assert [(v.file_path, v.id) for v in report.vulnerabilities] == [
+        ("a.py", "SEC-1"),
+        ("b.py", "SEC-9"),
+    ]
+    assert "2 LLM request(s)" in report.summary
+
+
+@pytest.mark.asyncio
+async def test_sdk_scan_stores_no_findings_when_cache_disabled(tmp_path: Path):
+    from neuralscope.core.settings import Settings
+    from neuralscope.sdk.client import NeuralScope
+
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("eval(input())\n")
+    settings = Settings(_env_file=None, cache_enabled=False, cache_dir=tmp_path / "cache")
+    ns = NeuralScope(settings=settings)
+    ns._llms["scan"] = FakeListChatModel(responses=['{"vulnerabilities": []}'])
+
+    result = await ns.scan(str(project))
+
+    assert result["total"] == 0
+    assert not (tmp_path / "cache").exists()